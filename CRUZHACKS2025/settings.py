@@ -24,6 +24,18 @@ if not GOOGLE_OAUTH_CLIENT_ID:
         'Have you put it in a file at core/.env ?'
     )
 
+# Which RateMyProfessors lookup backend to use: "selenium" or "http".
+RMP_BACKEND = os.environ.get('RMP_BACKEND', 'selenium')
+
+# Seconds a cached Professor row is served without a background refresh.
+PROFESSOR_CACHE_TTL = int(os.environ.get('PROFESSOR_CACHE_TTL', 60 * 60 * 24 * 14))
+
+# Seconds a "no RMP match" result is remembered before the name is scraped again.
+PROFESSOR_MISS_TTL = int(os.environ.get('PROFESSOR_MISS_TTL', 60 * 60 * 24 * 3))
+
+# Seconds before a stale Professor row is retried after its refresh errored.
+PROFESSOR_RETRY_AFTER = int(os.environ.get('PROFESSOR_RETRY_AFTER', 60 * 60))
+
 # We need these lines below to allow the Google sign in popup to work.
 SECURE_REFERRER_POLICY = 'no-referrer-when-downgrade'
 SECURE_CROSS_ORIGIN_OPENER_POLICY = "same-origin-allow-popups"
@@ -31,6 +43,18 @@ SECURE_CROSS_ORIGIN_OPENER_POLICY = "same-origin-allow-popups"
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
+# The transcript parser and curriculum logic live in the SlugBot backend.
+SLUGBOT_DIR = Path(os.environ.get('SLUGBOT_DIR', BASE_DIR / 'backend' / 'SlugBot'))
+
+# Worker threads that process uploaded transcripts in the background.
+TRANSCRIPT_JOB_WORKERS = int(os.environ.get('TRANSCRIPT_JOB_WORKERS', 2))
+
+# Upload budget for transcripts. Uploads over FILE_UPLOAD_MAX_MEMORY_SIZE (2.5 MB by
+# default) are spooled to a temporary file and read through an mmap.
+TRANSCRIPT_MAX_BYTES = int(os.environ.get('TRANSCRIPT_MAX_BYTES', 10 * 1024 * 1024))
+TRANSCRIPT_MAX_PAGES = int(os.environ.get('TRANSCRIPT_MAX_PAGES', 40))
+TRANSCRIPT_MAX_TEXT_CHARS = int(os.environ.get('TRANSCRIPT_MAX_TEXT_CHARS', 500_000))
+
 
 # Quick-start development settings - unsuitable for production
 # See https://docs.djangoproject.com/en/5.2/howto/deployment/checklist/
@@ -0,0 +1,112 @@
+# --- Batch Transcript Ingestion --------- #
+#
+# Runs a whole cohort of transcript PDFs through TranscriptParser and
+# CurriculumRequirements without prompting, one JSON line per student:
+#
+#   python batch_ingest.py Transcripts/ -o cohort.jsonl --workers 8
+#   python batch_ingest.py "cohort_2025/*.pdf" > cohort.jsonl
+#
+# Files that fail to parse are reported on stderr and skipped; the batch keeps going.
+
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from creatingState import TranscriptParser, open_transcript_cache, parse_transcript, summarize_curriculum
+from pdf_text import extract_text
+
+
+# Directories are searched recursively for PDFs; anything else is a glob pattern.
+def collect_paths(sources):
+    paths = []
+    for source in sources:
+        if os.path.isdir(source):
+            paths.extend(glob.glob(os.path.join(source, "**", "*.pdf"), recursive=True))
+        else:
+            paths.extend(glob.glob(source, recursive=True))
+    return sorted(set(paths))
+
+
+_worker_cache = None
+
+
+# Runs in a worker process. Each worker already has a whole file to itself, so
+# page extraction stays in-process instead of spawning a pool per PDF.
+def ingest_one(pdf_path, use_cache=True):
+    global _worker_cache
+    if use_cache and _worker_cache is None:
+        _worker_cache = open_transcript_cache()
+    cache = _worker_cache if use_cache else None
+    try:
+        if cache is None:
+            user = TranscriptParser(text=extract_text(pdf_path, max_workers=1)).parse_user()
+        else:
+            user = parse_transcript(pdf_path, cache=cache, max_workers=1)
+        record = {
+            "file": pdf_path,
+            "name": user.name,
+            "gpa": user.gpa,
+            "credits_taken": user.credits_taken,
+            "courses": [{"code": c.code, "quarter": c.quarter, "credits": c.credits} for c in user.classes_taken],
+            **summarize_curriculum(user)
+        }
+        return pdf_path, record, None
+    except Exception as e:
+        return pdf_path, None, f"{type(e).__name__}: {e}"
+
+
+def run_batch(paths, out, workers=None, use_cache=True, progress_every=100):
+    ok = 0
+    failures = []
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(ingest_one, path, use_cache) for path in paths]
+        for done, future in enumerate(as_completed(futures), start=1):
+            pdf_path, record, error = future.result()
+            if error is None:
+                out.write(json.dumps(record) + "\n")
+                ok += 1
+            else:
+                failures.append((pdf_path, error))
+                print(f"FAILED {pdf_path}: {error}", file=sys.stderr)
+            if progress_every and done % progress_every == 0:
+                elapsed = time.perf_counter() - start
+                print(f"{done}/{len(paths)} files, {done / elapsed:.1f} files/s", file=sys.stderr)
+
+    elapsed = time.perf_counter() - start
+    rate = len(paths) / elapsed if elapsed else 0.0
+    print(f"Processed {len(paths)} files in {elapsed:.1f}s ({rate:.1f} files/s): "
+          f"{ok} ok, {len(failures)} failed", file=sys.stderr)
+    return ok, failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Parse a batch of transcript PDFs into JSON lines.")
+    parser.add_argument("sources", nargs="+", help="PDF files, directories or glob patterns")
+    parser.add_argument("-o", "--output", help="JSONL file to write (default: stdout)")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="worker processes (default: one per CPU)")
+    parser.add_argument("--no-cache", action="store_true", help="don't read or write the parsed transcript cache")
+    parser.add_argument("--progress-every", type=int, default=100, help="report throughput every N files (0 = never)")
+    args = parser.parse_args(argv)
+
+    paths = collect_paths(args.sources)
+    if not paths:
+        print("No PDF files found.", file=sys.stderr)
+        return 1
+
+    out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    try:
+        _, failures = run_batch(paths, out, workers=args.workers, use_cache=not args.no_cache,
+                                progress_every=args.progress_every)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,50 @@
+# --- Benchmark: Catalog Loading --- #
+#
+# Compares building the catalog tables from the JSON source (parse + filter
+# prerequisites, what every import used to do with the literals) with opening
+# the memory-mapped binary index from catalog.py, and checks both give the same
+# tables.
+#
+#   python benchmarks/bench_catalog.py [year]
+
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from catalog import CATALOG_YEAR, Catalog, _open_index, build_index, index_path, source_path
+
+
+def from_json(year):
+    with open(source_path(year), "r") as f:
+        data = json.load(f)
+    allowed = set(code for codes in data["allowed"].values() for code in codes)
+    prerequisites = {k: v for k, v in data["prerequisites"].items() if k in allowed}
+    return data["requirements"], allowed, prerequisites
+
+
+def from_index(year):
+    return Catalog(year, _open_index(year))
+
+
+def main(year=CATALOG_YEAR):
+    build_index(year)
+    requirements, allowed, prerequisites = from_json(year)
+    catalog = from_index(year)
+    assert catalog.requirements == requirements
+    assert catalog.allowed_courses == allowed
+    assert catalog.prerequisites == prerequisites
+
+    json_time = min(timeit.repeat(lambda: from_json(year), number=200, repeat=5)) / 200
+    index_time = min(timeit.repeat(lambda: from_index(year), number=200, repeat=5)) / 200
+    build_time = min(timeit.repeat(lambda: build_index(year), number=20, repeat=3)) / 20
+    print(f"catalog {year}: {len(catalog.all_courses)} courses, {len(catalog.names)} names")
+    print(f"  source JSON   : {os.path.getsize(source_path(year)):6d} bytes, {json_time * 1e6:7.1f} us to load")
+    print(f"  binary index  : {os.path.getsize(index_path(year)):6d} bytes, {index_time * 1e6:7.1f} us to map + decode")
+    print(f"  index build   : {build_time * 1e3:7.2f} ms")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1] if len(sys.argv) > 1 else CATALOG_YEAR)
@@ -0,0 +1,87 @@
+# --- Benchmark: Class Search Result Parsing --- #
+#
+# Compares the original parse (full html.parser tree, one selector scan per field)
+# with the strained, single-pass parse used by webscraping/class_search.py.
+#
+#   python benchmarks/bench_class_search.py saved_pages/*.html
+#
+# With no arguments it runs on a synthetic 300-class results page.
+
+import glob
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from bs4 import BeautifulSoup
+from webscraping.class_search import (
+    PARSER, get_field_text, make_soup, parse_panels
+)
+
+PANEL_SELECTOR = "div.panel.panel-default.row"
+
+
+def legacy_parse(html):
+    soup = BeautifulSoup(html, "html.parser")
+    classes = []
+    for panel in soup.select(PANEL_SELECTOR):
+        title_tag = panel.select_one("div.panel-heading a")
+        classes.append({
+            "title": title_tag.text.strip() if title_tag else "N/A",
+            "instructor": get_field_text(panel, "Instructor"),
+            "location": get_field_text(panel, "Location"),
+            "time": get_field_text(panel, "Day and Time"),
+            "session": get_field_text(panel, "Session"),
+            "enrollment": get_field_text(panel, "Enrolled"),
+        })
+    return classes
+
+
+def current_parse(html):
+    return parse_panels(make_soup(html))
+
+
+def synthetic_page(count=300):
+    panels = []
+    for i in range(count):
+        panels.append(
+            f'<div class="panel panel-default row"><div class="panel-heading">'
+            f'<h2><a href="#">CSE {i} - 01 Course {i}</a></h2></div><div class="panel-body"><div class="row">'
+            f'<div class="col-xs-6 col-sm-3"><b>Instructor:</b> Slug, S.</div>'
+            f'<div class="col-xs-6 col-sm-3"><b>Location:</b> LEC: Baskin Auditorium 101</div>'
+            f'<div class="col-xs-6 col-sm-3"><b>Day and Time:</b> TuTh 01:30PM-03:05PM</div>'
+            f'<div class="col-xs-6 col-sm-3"><b>Session:</b> Regular Academic Session</div>'
+            f'<div class="col-xs-6 col-sm-6"><b>Enrolled:</b> {i} of 300</div>'
+            f'<div class="col-xs-6 col-sm-3"><b>In Person</b></div></div></div></div>'
+        )
+    nav = "<nav>" + "<a href='#'>link</a>" * 500 + "</nav>"
+    summary = f'<div class="row hide-print" style="background-color: #fff"><b>1</b><b>{count}</b><b>{count}</b></div>'
+    return f"<html><head><title>Class Search</title></head><body>{nav}{summary}{''.join(panels)}</body></html>"
+
+
+def main(paths):
+    pages = []
+    for pattern in paths:
+        for path in sorted(glob.glob(pattern)):
+            with open(path, "r", encoding="utf-8") as f:
+                pages.append((path, f.read()))
+    if not pages:
+        pages = [("synthetic (300 classes)", synthetic_page())]
+
+    print(f"Tree builder for the current parser: {PARSER}")
+    for name, html in pages:
+        panel_count = len(legacy_parse(html))
+        if panel_count == 0:
+            print(f"{name}: no result panels, skipped")
+            continue
+        legacy = min(timeit.repeat(lambda: legacy_parse(html), number=3, repeat=3)) / 3
+        current = min(timeit.repeat(lambda: current_parse(html), number=3, repeat=3)) / 3
+        print(f"{name}: {panel_count} panels")
+        print(f"  legacy : {legacy * 1e3:8.2f} ms/page  {legacy / panel_count * 1e6:8.1f} us/panel")
+        print(f"  current: {current * 1e3:8.2f} ms/page  {current / panel_count * 1e6:8.1f} us/panel"
+              f"  ({legacy / current:.1f}x)")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,59 @@
+# --- Benchmark: Cohort Audit --- #
+#
+# Audits a synthetic cohort with cohort.CohortAudit and checks a sample of
+# students against CurriculumRequirements, then times the whole cohort.
+#
+#   python benchmarks/bench_cohort.py [students]
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from cohort import CohortAudit
+from creatingState import (
+    Course, CurriculumRequirements, User, all_courses, equivalencies, prerequisites, requirements
+)
+
+
+def synthetic_cohort(audit, students, seed=0):
+    rng = random.Random(seed)
+    return [set(rng.sample(audit.courses, rng.randint(0, len(audit.courses) // 2))) for _ in range(students)]
+
+
+def main(students=10000, checked=500):
+    start = time.perf_counter()
+    audit = CohortAudit(requirements, prerequisites, all_courses, equivalencies)
+    compile_time = time.perf_counter() - start
+
+    cohort = synthetic_cohort(audit, students)
+    matrix = audit.completion_matrix(cohort)
+    start = time.perf_counter()
+    result = audit.run(matrix)
+    audit_time = time.perf_counter() - start
+
+    for row, completed in enumerate(cohort[:checked]):
+        user = User("Student", classes_taken=[Course(code, "2024 Fall Quarter", 5.0) for code in completed])
+        curriculum = CurriculumRequirements(user, requirements, prerequisites, all_courses)
+        assert result.eligible_courses(row) == curriculum.eligible_courses, row
+        assert result.remaining_requirements(row) == curriculum.remaining_requirements, row
+
+    start = time.perf_counter()
+    for completed in cohort[:checked]:
+        user = User("Student", classes_taken=[Course(code, "2024 Fall Quarter", 5.0) for code in completed])
+        curriculum = CurriculumRequirements(user, requirements, prerequisites, all_courses, cache=None)
+        curriculum.eligible_courses
+        curriculum.remaining_requirements
+    per_student = (time.perf_counter() - start) / checked
+
+    print(f"{students} students x {len(audit.courses)} courses, {len(audit.rules)} requirement rules")
+    print(f"  compile            : {compile_time * 1e3:8.1f} ms")
+    print(f"  cohort audit       : {audit_time * 1e3:8.1f} ms")
+    print(f"  per-student objects: {per_student * students * 1e3:8.1f} ms (extrapolated)")
+    print(f"  matched CurriculumRequirements on {checked} students")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
@@ -0,0 +1,38 @@
+# --- Benchmark: Course Impact Ranking --- #
+#
+# Times the one-off reachability/longest-path analysis of the prerequisites DAG
+# (course_impact.CourseImpact) and the per-request ranking of a student's
+# eligible courses, which only looks up the precomputed values.
+#
+#   python benchmarks/bench_course_impact.py [students]
+
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from creatingState import all_courses, prerequisites, requirements
+from course_impact import CourseImpact, course_impact
+from prereq_engine import compile_prerequisites
+
+
+def main(students=2000):
+    rng = random.Random(0)
+    compiled = compile_prerequisites(prerequisites, all_courses)
+    catalog = sorted(all_courses)
+    eligible_lists = [compiled.eligible(rng.sample(catalog, rng.randint(0, 30))) for _ in range(students)]
+
+    build = min(timeit.repeat(lambda: CourseImpact(requirements, prerequisites, all_courses), number=20, repeat=3)) / 20
+    impact = course_impact(requirements, prerequisites, all_courses)
+    assert course_impact(requirements, prerequisites, all_courses) is impact
+    rank = min(timeit.repeat(lambda: [impact.rank(e) for e in eligible_lists], number=3, repeat=3)) / 3
+    average = sum(map(len, eligible_lists)) / students
+    print(f"{len(catalog)} catalog courses, {students} students, {average:.1f} eligible courses each")
+    print(f"  analysis (once per catalog): {build * 1e3:7.2f} ms")
+    print(f"  ranking per request        : {rank / students * 1e6:7.2f} us")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
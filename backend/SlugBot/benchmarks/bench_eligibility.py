@@ -0,0 +1,56 @@
+# --- Benchmark: Eligibility Check --- #
+#
+# Compares the original eligible_courses loop (string set lookups over every
+# prerequisite group) with the compiled bitmask check in prereq_engine.py, on
+# random completed-course sets drawn from the catalog.
+#
+#   python benchmarks/bench_eligibility.py [students]
+
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from creatingState import all_courses, prerequisites
+from prereq_engine import compile_prerequisites
+
+
+def legacy_eligible(completed):
+    eligible = []
+    for course in all_courses:
+        if course in completed:
+            continue
+        satisfied = True
+        for group in prerequisites.get(course, []):
+            if not any(req in completed for req in group):
+                satisfied = False
+                break
+        if satisfied:
+            eligible.append(course)
+    return eligible
+
+
+def main(students=2000):
+    rng = random.Random(0)
+    universe = sorted(set(all_courses) | {req for groups in prerequisites.values() for group in groups for req in group})
+    completed_sets = [set(rng.sample(universe, rng.randint(0, len(universe) // 2))) for _ in range(students)]
+
+    compiled = compile_prerequisites(prerequisites, all_courses)
+    masks = [compiled.mask(completed) for completed in completed_sets]
+    for completed, mask in zip(completed_sets, masks):
+        assert compiled.eligible(completed) == legacy_eligible(completed)
+        assert compiled.codes(compiled.eligible_mask(mask)) == sorted(legacy_eligible(completed), key=compiled.bit.get)
+
+    legacy = min(timeit.repeat(lambda: [legacy_eligible(c) for c in completed_sets], number=3, repeat=3)) / 3
+    from_sets = min(timeit.repeat(lambda: [compiled.eligible(c) for c in completed_sets], number=3, repeat=3)) / 3
+    from_masks = min(timeit.repeat(lambda: [compiled.eligible_mask(m) for m in masks], number=3, repeat=3)) / 3
+    print(f"{len(all_courses)} catalog courses, {len(compiled.bit)} course bits, {students} students")
+    print(f"  legacy loop          : {legacy / students * 1e6:7.1f} us/student")
+    print(f"  compiled (from set)  : {from_sets / students * 1e6:7.1f} us/student  ({legacy / from_sets:.1f}x)")
+    print(f"  compiled (mask only) : {from_masks / students * 1e6:7.1f} us/student  ({legacy / from_masks:.1f}x)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,64 @@
+# --- Benchmark: Equivalency Enhancement --- #
+#
+# Compares the original ordered if-chain over every equivalency rule with the
+# compiled closure in equivalencies.py, on the shipped table and on a synthetic
+# table with a few hundred extra rules (AP credit / transfer articulation style,
+# including chains the if-chain only follows when they happen to be in order).
+#
+#   python benchmarks/bench_equivalencies.py [students]
+
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from creatingState import all_courses, equivalencies
+from equivalencies import EquivalencyTable
+
+
+def legacy_enhance(rules, completed):
+    enhanced = set(completed)
+    for course, implied in rules:
+        if course in enhanced:
+            enhanced.update(implied)
+    return enhanced
+
+
+def synthetic_rules(rng, count):
+    rules = {course: sorted(implied) for course, implied in equivalencies}
+    catalog = sorted(all_courses)
+    for i in range(count):
+        implied = rng.sample(catalog, rng.randint(1, 3))
+        # Every fourth rule chains to an earlier synthetic source.
+        if i % 4 == 3:
+            implied.append(f"XFER {i - 1}")
+        rules[f"XFER {i}"] = implied
+    return rules
+
+
+def run(label, rules, completed_sets):
+    table = EquivalencyTable(rules)
+    ordered = list(rules.items())
+    missed = sum(legacy_enhance(ordered, c) != table.enhance(c) for c in completed_sets)
+    legacy = min(timeit.repeat(lambda: [legacy_enhance(ordered, c) for c in completed_sets], number=3, repeat=3)) / 3
+    closure = min(timeit.repeat(lambda: [table.enhance(c) for c in completed_sets], number=3, repeat=3)) / 3
+    students = len(completed_sets)
+    print(f"{label}: {len(rules)} rules, {students} students")
+    print(f"  if-chain : {legacy / students * 1e6:7.2f} us/student  (incomplete for {missed} students)")
+    print(f"  closure  : {closure / students * 1e6:7.2f} us/student  ({legacy / closure:.1f}x)")
+
+
+def main(students=5000):
+    rng = random.Random(0)
+    shipped = {course: sorted(implied) for course, implied in equivalencies}
+    synthetic = synthetic_rules(rng, 300)
+    universe = sorted(set(all_courses) | set(synthetic))
+    completed_sets = [rng.sample(universe, rng.randint(0, 30)) for _ in range(students)]
+    run("shipped table", shipped, completed_sets)
+    run("synthetic table", synthetic, completed_sets)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
@@ -0,0 +1,34 @@
+# --- Benchmark: Degree Planner --- #
+#
+# Plans random students (from freshmen with nothing completed to students with
+# about twenty catalog courses done) at a few unit caps and reports plan
+# length, whether it was proven optimal, and the time taken.
+#
+#   python benchmarks/bench_planner.py [students]
+
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from creatingState import all_courses, allowed_courses, equivalencies, prerequisites, requirements
+from planner import DegreePlanner
+
+
+def main(students=50):
+    rng = random.Random(0)
+    catalog = sorted(allowed_courses)
+    cohort = [[]] + [rng.sample(catalog, rng.randint(0, 20)) for _ in range(students - 1)]
+    for unit_cap in (10.0, 15.0, 20.0):
+        planner = DegreePlanner(requirements, prerequisites, all_courses, equivalencies, unit_cap=unit_cap)
+        plans = [planner.plan(completed, time_budget=2.0) for completed in cohort]
+        times = sorted(plan.elapsed for plan in plans)
+        optimal = sum(plan.optimal for plan in plans)
+        print(f"unit cap {unit_cap:4.0f}: freshman {len(plans[0])} quarters, "
+              f"{optimal}/{len(plans)} proven optimal, median {times[len(times) // 2] * 1e3:.1f} ms, "
+              f"max {times[-1] * 1e3:.1f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50)
@@ -0,0 +1,89 @@
+# --- Benchmark: Transcript Parsing --- #
+#
+# Compares the original regex-based parse_user (a whole-text name search, two
+# regexes per line and a DOTALL findall for the cumulative totals) with the
+# single-pass tokenizer in creatingState.TranscriptParser, on synthetic
+# transcripts of increasing length. Per-line cost should stay flat for the
+# current parser.
+#
+#   python benchmarks/bench_transcript_parser.py [max_quarters]
+#
+# The "no totals" rows repeat the Cum GPA line but drop every Cum Totals, as on
+# truncated or in-progress transcripts; that is where the findall backtracks.
+
+import contextlib
+import io
+import os
+import re
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from creatingState import Course, TranscriptParser, User, allowed_courses
+
+COURSES = ["CSE 12", "CSE 16", "CSE 20", "CSE 30", "MATH 19A", "MATH 19B", "AM 10", "CSE 101", "CSE 130", "HIS 10"]
+
+
+def legacy_parse(text):
+    name_match = re.search(r"Name:\s*(.+)", text)
+    user = User(name=name_match.group(1).strip() if name_match else "Unknown")
+    current_quarter = None
+    quarter_pattern = re.compile(r'^(\d{4}\s+(Summer|Fall|Winter|Spring)\s+Quarter)')
+    course_pattern = re.compile(
+        r'^([A-Z]+\s*\d+[A-Z]*)\s+[\w:,&\-/]+(?:\s+[\w:,&\-/]+)*\s+([\d]+\.[\d]+)\s+([\d]+\.[\d]+)\s+[A-F][+-]?\s+[\d]+\.[\d]+'
+    )
+    for line in text.splitlines():
+        line = line.strip()
+        q_match = quarter_pattern.match(line)
+        if q_match:
+            current_quarter = q_match.group(0)
+            continue
+        c_match = course_pattern.match(line)
+        if c_match and current_quarter and c_match.group(1) in allowed_courses:
+            user.add_course(Course(code=c_match.group(1), quarter=current_quarter, credits=float(c_match.group(2))))
+    cum_matches = re.findall(r'Cum GPA\s+([\d.]+).*?Cum Totals\s+([\d.]+)', text, flags=re.DOTALL)
+    if cum_matches:
+        user.gpa, user.credits_taken = (float(value) for value in cum_matches[-1])
+    return user
+
+
+def current_parse(text):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return TranscriptParser(text=text).parse_user()
+
+
+def synthetic_transcript(quarters, totals=True):
+    lines = ["Unofficial Transcript", "Name: Sammy Slug", "Student ID: 1234567", ""]
+    seasons = ["Fall", "Winter", "Spring"]
+    for q in range(quarters):
+        lines.append(f"{2020 + q // 3} {seasons[q % 3]} Quarter")
+        lines.append("Course Description Attempted Earned Grade Points")
+        for c in range(4):
+            code = COURSES[(q * 4 + c) % len(COURSES)]
+            lines.append(f"{code} Intro to Something: Part {c} 5.00 5.00 A- 18.500")
+        lines.append("Term GPA 3.70 Term Totals 20.00 20.00")
+        lines.append(f"Cum GPA 3.{q % 10}0")
+        if totals:
+            lines.append(f"Cum Totals {20 * (q + 1)}.00 {20 * (q + 1)}.00")
+    return "\n".join(lines)
+
+
+def main(max_quarters=960):
+    print(f"{'transcript':>22} {'lines':>7} {'legacy ms':>10} {'current ms':>11} {'current us/line':>16}")
+    for totals in (True, False):
+        quarters = 15
+        while quarters <= max_quarters:
+            text = synthetic_transcript(quarters, totals)
+            line_count = text.count("\n") + 1
+            number = max(1, 2000 // quarters)
+            legacy = min(timeit.repeat(lambda: legacy_parse(text), number=number, repeat=3)) / number
+            current = min(timeit.repeat(lambda: current_parse(text), number=number, repeat=3)) / number
+            label = f"{quarters} quarters" + ("" if totals else ", no totals")
+            print(f"{label:>22} {line_count:>7} {legacy * 1e3:>10.2f} {current * 1e3:>11.2f} "
+                  f"{current / line_count * 1e6:>16.2f}")
+            quarters *= 4
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 960)
@@ -0,0 +1,69 @@
+# --- Benchmark: What-If Eligibility --- #
+#
+# "Suppose I also finish X": compares rebuilding a User and recomputing
+# eligible_courses and remaining_requirements from scratch with
+# CurriculumRequirements.what_if (baseline already computed), and with the
+# bare reverse-index delta in prereq_engine, on random students and additions.
+#
+#   python benchmarks/bench_what_if.py [students]
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from creatingState import Course, CurriculumRequirements, User, all_courses, prerequisites, requirements
+
+
+def make_user(codes):
+    user = User("bench")
+    for code in codes:
+        user.add_course(Course(code, "Fall 2024", 5.0))
+    return user
+
+
+def from_scratch(completed, added):
+    curriculum = CurriculumRequirements(make_user([*completed, *added]), requirements, prerequisites, all_courses,
+                                        cache=None)
+    return curriculum.eligible_courses, curriculum.remaining_requirements
+
+
+def timed(fn, cases):
+    start = time.perf_counter()
+    results = [fn(*case) for case in cases]
+    return results, (time.perf_counter() - start) / len(cases)
+
+
+def main(students=2000):
+    rng = random.Random(0)
+    catalog = sorted(all_courses)
+    cases = []
+    for _ in range(students):
+        completed = rng.sample(catalog, rng.randint(0, 30))
+        curriculum = CurriculumRequirements(make_user(completed), requirements, prerequisites, all_courses,
+                                            cache=None)
+        curriculum.eligible_courses, curriculum.remaining_requirements  # baseline, as shown on the page
+        cases.append((curriculum, completed, rng.sample(catalog, rng.randint(1, 3))))
+
+    scratch, scratch_time = timed(lambda c, completed, added: from_scratch(completed, added), cases)
+    deltas, what_if_time = timed(lambda c, completed, added: c.what_if(added), cases)
+    compiled = cases[0][0].compiled
+    masks = [(compiled.mask(c._snapshot()), compiled.mask(added)) for c, _, added in cases]
+    _, delta_time = timed(compiled.what_if, masks)
+
+    for (curriculum, _, _), (eligible, remaining), delta in zip(cases, scratch, deltas):
+        before = set(curriculum.eligible_courses)
+        assert set(delta["unlocked"]) == set(eligible) - before
+        assert set(delta["done"]) == before - set(eligible)
+        assert delta["remaining"] == remaining
+
+    print(f"{students} students, 1-3 courses added each")
+    print(f"  from scratch            : {scratch_time * 1e6:7.1f} us")
+    print(f"  what_if (incl. remaining): {what_if_time * 1e6:7.1f} us  ({scratch_time / what_if_time:.1f}x)")
+    print(f"  eligibility delta only  : {delta_time * 1e6:7.1f} us  ({scratch_time / delta_time:.1f}x)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
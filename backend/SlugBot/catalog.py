@@ -0,0 +1,261 @@
+# --- Versioned Catalog Index ------------ #
+#
+# Each catalog year is a data file, data/catalog_<year>.json, holding the
+# degree requirements, the allowed course lists and the prerequisites table.
+# `build_index` compiles it into a compact binary index next to it
+# (data/catalog_<year>.idx), which workers memory-map at startup: the pages are
+# shared through the OS page cache by every process that loads the same year.
+#
+# Index layout (little-endian). Header: magic, format version, SHA-256 of the
+# source JSON (a stale index is rebuilt), section count. Then each section is
+# a typecode, an item count and the packed items, padded to 4 bytes:
+#   names          newline-joined UTF-8 strings; every code/key is a name ID (H)
+#   courses        catalog course IDs, in catalog order
+#   allowed_*      allowed list names, offsets into members, member IDs
+#   prereq_*       course IDs, offsets into groups, offsets into members, IDs
+#   rule_*         requirement rows (category, subcategory, key), a number per
+#                  row, offsets into alternatives, offsets into members, IDs
+#
+#   python catalog.py [year ...]     builds (or rebuilds) the indexes
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+CATALOG_DIR = os.getenv("CATALOG_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "data"))
+CATALOG_YEAR = os.getenv("CATALOG_YEAR", "2025")
+
+MAGIC = b"SQCI"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<4sH32sH")
+SECTION = struct.Struct("<cxxxI")
+NO_NAME = 0xFFFF
+
+# Section name -> array typecode: name IDs are "H", offsets and numbers "I".
+SECTIONS = {
+    "names": "B", "courses": "H",
+    "allowed_names": "H", "allowed_offsets": "I", "allowed_members": "H",
+    "prereq_courses": "H", "prereq_groups": "I", "prereq_offsets": "I", "prereq_members": "H",
+    "rule_keys": "H", "rule_numbers": "I", "rule_alternatives": "I", "rule_offsets": "I", "rule_members": "H",
+}
+# Requirement keys whose value is one flat list, and keys holding alternatives.
+LIST_KEYS = ("mandatory", "additional", "list")
+ALTERNATIVE_KEYS = ("one_of", "plus_one_of")
+
+_loaded = {}
+
+
+def source_path(year):
+    return os.path.join(CATALOG_DIR, f"catalog_{year}.json")
+
+
+def index_path(year):
+    return os.path.join(CATALOG_DIR, f"catalog_{year}.idx")
+
+
+def available_years():
+    return sorted(name[len("catalog_"):-len(".json")] for name in os.listdir(CATALOG_DIR)
+                  if name.startswith("catalog_") and name.endswith(".json"))
+
+
+# =============================================================================
+# Build
+# =============================================================================
+def compile_catalog(data, digest):
+    """Catalog JSON (as loaded) -> index bytes."""
+    names = []
+    ids = {}
+
+    def name_id(name):
+        if name not in ids:
+            ids[name] = len(names)
+            names.append(name)
+        return ids[name]
+
+    allowed = data["allowed"]
+    catalog = list(dict.fromkeys(code for codes in allowed.values() for code in codes))
+    sections = {name: array(typecode) for name, typecode in SECTIONS.items()}
+    for name in ("allowed_offsets", "prereq_groups", "prereq_offsets", "rule_alternatives", "rule_offsets"):
+        sections[name].append(0)
+
+    sections["courses"].extend(name_id(code) for code in catalog)
+    for group, codes in allowed.items():
+        sections["allowed_names"].append(name_id(group))
+        sections["allowed_members"].extend(name_id(code) for code in codes)
+        sections["allowed_offsets"].append(len(sections["allowed_members"]))
+
+    # Only catalog courses keep their prerequisites (same filter creatingState used).
+    in_catalog = set(catalog)
+    for course, groups in data["prerequisites"].items():
+        if course not in in_catalog:
+            continue
+        sections["prereq_courses"].append(name_id(course))
+        for group in groups:
+            sections["prereq_members"].extend(name_id(code) for code in group)
+            sections["prereq_offsets"].append(len(sections["prereq_members"]))
+        sections["prereq_groups"].append(len(sections["prereq_offsets"]) - 1)
+
+    def add_rule(category, subcategory, key, value):
+        if key in LIST_KEYS:
+            alternatives, number = [value], 0
+        elif key in ALTERNATIVE_KEYS:
+            alternatives, number = value, 0
+        else:
+            alternatives, number = [], int(value)
+        sections["rule_keys"].extend((name_id(category), subcategory, name_id(key)))
+        sections["rule_numbers"].append(number)
+        for alternative in alternatives:
+            sections["rule_members"].extend(name_id(code) for code in alternative)
+            sections["rule_offsets"].append(len(sections["rule_members"]))
+        sections["rule_alternatives"].append(len(sections["rule_offsets"]) - 1)
+
+    for category, subreqs in data["requirements"].items():
+        for key, value in subreqs.items():
+            if isinstance(value, dict):
+                for subkey, subvalue in value.items():
+                    add_rule(category, name_id(key), subkey, subvalue)
+            else:
+                add_rule(category, NO_NAME, key, value)
+
+    if len(names) >= NO_NAME:
+        raise ValueError(f"catalog has {len(names)} names; the index format holds {NO_NAME - 1}")
+    sections["names"].frombytes("\n".join(names).encode("utf-8"))
+
+    out = bytearray(HEADER.pack(MAGIC, FORMAT_VERSION, digest, len(SECTIONS)))
+    for name in SECTIONS:
+        items = sections[name]
+        out += SECTION.pack(items.typecode.encode("ascii"), len(items))
+        out += items.tobytes()
+        out += b"\0" * (-len(out) % 4)
+    return bytes(out)
+
+
+def build_index(year=CATALOG_YEAR):
+    """Compiles data/catalog_<year>.json into its .idx file; returns the index path."""
+    with open(source_path(year), "rb") as f:
+        raw = f.read()
+    payload = compile_catalog(json.loads(raw), hashlib.sha256(raw).digest())
+    path = index_path(year)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
+    return path
+
+
+# =============================================================================
+# Load
+# =============================================================================
+class Catalog:
+    """
+    One catalog year read from its memory-mapped index. The packed sections stay
+    available as memoryviews in `arrays`; the tables the rest of SlugBot uses
+    (requirements, allowed lists, all_courses, prerequisites) are decoded once.
+    """
+    def __init__(self, year, buffer):
+        self.year = year
+        self.buffer = buffer
+        magic, version, self.digest, count = HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC or version != FORMAT_VERSION or count != len(SECTIONS):
+            raise ValueError(f"{index_path(year)} is not a catalog index (format {FORMAT_VERSION})")
+
+        view = memoryview(buffer)
+        self.arrays = {}
+        offset = HEADER.size
+        for name, typecode in SECTIONS.items():
+            stored, length = SECTION.unpack_from(buffer, offset)
+            offset += SECTION.size
+            if stored.decode("ascii") != typecode:
+                raise ValueError(f"{index_path(year)}: unexpected type for section {name}")
+            size = length * array(typecode).itemsize
+            self.arrays[name] = view[offset:offset + size].cast(typecode)
+            offset += size + (-size % 4)
+
+        # One tolist() per section, then plain list slicing while decoding.
+        a = {name: packed.tolist() for name, packed in self.arrays.items() if name != "names"}
+        self.names = bytes(self.arrays["names"]).decode("utf-8").split("\n")
+        names = self.names
+        self.all_courses = [names[i] for i in a["courses"]]
+        self.allowed_courses = set(self.all_courses)
+
+        self.allowed = {}
+        members = [names[i] for i in a["allowed_members"]]
+        offsets = a["allowed_offsets"]
+        for row, name in enumerate(a["allowed_names"]):
+            self.allowed[names[name]] = members[offsets[row]:offsets[row + 1]]
+
+        self.prerequisites = {}
+        members = [names[i] for i in a["prereq_members"]]
+        offsets = a["prereq_offsets"]
+        groups = a["prereq_groups"]
+        for row, course in enumerate(a["prereq_courses"]):
+            self.prerequisites[names[course]] = [members[offsets[g]:offsets[g + 1]]
+                                                 for g in range(groups[row], groups[row + 1])]
+
+        self.requirements = {}
+        members = [names[i] for i in a["rule_members"]]
+        offsets = a["rule_offsets"]
+        alternatives = a["rule_alternatives"]
+        keys = a["rule_keys"]
+        for row, number in enumerate(a["rule_numbers"]):
+            category, subcategory, key = keys[3 * row:3 * row + 3]
+            target = self.requirements.setdefault(names[category], {})
+            if subcategory != NO_NAME:
+                target = target.setdefault(names[subcategory], {})
+            key = names[key]
+            values = [members[offsets[alt]:offsets[alt + 1]] for alt in range(alternatives[row], alternatives[row + 1])]
+            if key in LIST_KEYS:
+                target[key] = values[0]
+            elif key in ALTERNATIVE_KEYS:
+                target[key] = values
+            else:
+                target[key] = number
+
+
+def _source_digest(year):
+    with open(source_path(year), "rb") as f:
+        return hashlib.sha256(f.read()).digest()
+
+
+def _open_index(year):
+    with open(index_path(year), "rb") as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def load_catalog(year=CATALOG_YEAR):
+    """
+    The Catalog for `year`, memory-mapping its index and (re)building the index
+    first when it is missing or older than the JSON. Loaded once per process.
+    If the data directory is read-only, the index is compiled in memory instead.
+    """
+    year = str(year)
+    if year in _loaded:
+        return _loaded[year]
+    digest = _source_digest(year)
+    buffer = None
+    try:
+        buffer = _open_index(year)
+        if HEADER.unpack_from(buffer, 0)[2] != digest:
+            buffer.close()
+            buffer = None
+    except (OSError, ValueError, struct.error):
+        buffer = None
+    if buffer is None:
+        try:
+            build_index(year)
+            buffer = _open_index(year)
+        except OSError:
+            with open(source_path(year), "rb") as f:
+                raw = f.read()
+            buffer = compile_catalog(json.loads(raw), digest)
+    _loaded[year] = Catalog(year, buffer)
+    return _loaded[year]
+
+
+if __name__ == "__main__":
+    for year in sys.argv[1:] or available_years():
+        print(f"{year}: {build_index(year)}")
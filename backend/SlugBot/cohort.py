@@ -0,0 +1,200 @@
+# --- Cohort-Wide Curriculum Audit ------- #
+#
+# Evaluates eligibility and remaining requirements for a whole cohort at once.
+# Students are rows of a boolean completion matrix (students x courses), and
+# every rule becomes an array operation over all rows:
+#   - prerequisites: each OR-group is a column of a course x group matrix, so
+#     one matrix product tells which groups each student satisfies, and a second
+#     counts satisfied groups per catalog course;
+#   - mandatory/additional lists: missing = list size - courses completed;
+#   - one_of/plus_one_of: missing per alternative, 0 if any is done, else the min;
+#   - Electives: number_required - electives completed.
+#
+# Results match CurriculumRequirements row by row (see benchmarks/bench_cohort.py).
+
+import numpy as np
+
+from prereq_engine import compile_prerequisites
+from equivalencies import EquivalencyTable
+
+
+class CohortResult:
+    """
+    `eligible` is students x catalog courses (bool, columns in `catalog` order).
+    `missing` is students x rules: courses still missing for each requirement
+    rule (electives remaining for the Electives rule), 0 once it is satisfied.
+    `choice` holds, for one_of rules, the alternative the student is closest to.
+    """
+    def __init__(self, audit, eligible, missing, choice, completed):
+        self.audit = audit
+        self.catalog = audit.catalog
+        self.rule_names = [rule["name"] for rule in audit.rules]
+        self.eligible = eligible
+        self.missing = missing
+        self.choice = choice
+        self.completed = completed
+
+    @property
+    def satisfied(self):
+        return self.missing == 0
+
+    # Demand forecast: how many students could take each catalog course next.
+    def eligible_counts(self):
+        return dict(zip(self.catalog, self.eligible.sum(axis=0).tolist()))
+
+    def eligible_courses(self, row):
+        return [course for course, ok in zip(self.catalog, self.eligible[row]) if ok]
+
+    # Same nested dict CurriculumRequirements.remaining_requirements returns.
+    def remaining_requirements(self, row):
+        remaining = {category: {} for category in self.audit.categories}
+        completed = self.completed[row]
+        for r, rule in enumerate(self.audit.rules):
+            count = int(self.missing[row, r])
+            if count == 0:
+                continue
+            if rule["kind"] == "Electives":
+                remaining[rule["category"]]["Electives"] = f"{count} elective(s) remaining"
+                continue
+            columns = rule["columns"] if rule["kind"] in ("mandatory", "additional") \
+                else rule["alternatives"][int(self.choice[row, r])]
+            remaining[rule["category"]][rule["name"]] = \
+                [self.audit.courses[c] for c in columns if not completed[c]]
+        return remaining
+
+
+class CohortAudit:
+    """
+    Compiles the catalog tables (the same ones CurriculumRequirements takes, plus
+    the EquivalencyTable) into index arrays once; `run` then audits any number
+    of students.
+    """
+    def __init__(self, requirements, prerequisites, all_courses, equivalencies=None):
+        equivalencies = equivalencies if equivalencies is not None else EquivalencyTable()
+        compiled = compile_prerequisites(prerequisites, all_courses)
+        self.catalog = list(compiled.courses)
+
+        # Column universe: every course the prerequisites, requirements or
+        # equivalencies mention, in the compiled bit order first.
+        self.courses = list(compiled.names)
+        self.index = dict(compiled.bit)
+        for category in requirements.values():
+            for subreq in category.values():
+                for course in _courses_in(subreq):
+                    self._column(course)
+        for course, implied in equivalencies:
+            for code in [course, *implied]:
+                self._column(code)
+
+        # Already transitively closed, so one pass in any order applies it.
+        self.equivalencies = [(self.index[course], np.array([self.index[code] for code in implied], dtype=np.intp))
+                              for course, implied in equivalencies]
+        self.catalog_columns = np.array([self.index[course] for course in self.catalog], dtype=np.intp)
+
+        # Prerequisites: course x group membership and group -> catalog course.
+        group_columns = []
+        group_owner = []
+        for position, course in enumerate(self.catalog):
+            for group in prerequisites.get(course, []):
+                group_columns.append([self.index[code] for code in group])
+                group_owner.append(position)
+        self.groups = np.zeros((len(self.courses), len(group_columns)), dtype=np.float32)
+        for g, columns in enumerate(group_columns):
+            self.groups[columns, g] = 1.0
+        self.group_owner = np.zeros((len(group_columns), len(self.catalog)), dtype=np.float32)
+        self.group_owner[np.arange(len(group_columns)), group_owner] = 1.0
+        self.groups_needed = self.group_owner.sum(axis=0)
+
+        # Requirement rules, in the order remaining_requirements reports them.
+        self.categories = list(requirements)
+        self.rules = []
+        for category, subreqs in requirements.items():
+            if category == "Electives":
+                self.rules.append({
+                    "category": category, "name": "Electives", "kind": "Electives",
+                    "required": subreqs.get("number_required", 0),
+                    "columns": [self.index[c] for c in subreqs.get("list", [])]
+                })
+                continue
+            for subcat, req in subreqs.items():
+                if not isinstance(req, dict):
+                    continue
+                for kind in ("mandatory", "additional"):
+                    if kind in req:
+                        self.rules.append({
+                            "category": category, "name": f"{subcat} ({kind})", "kind": kind,
+                            "columns": [self.index[c] for c in req[kind]]
+                        })
+                for kind in ("one_of", "plus_one_of"):
+                    if kind in req:
+                        self.rules.append({
+                            "category": category, "name": f"{subcat} ({kind})", "kind": kind,
+                            "alternatives": [[self.index[c] for c in alt] for alt in req[kind]]
+                        })
+
+    def _column(self, course):
+        if course not in self.index:
+            self.index[course] = len(self.courses)
+            self.courses.append(course)
+        return self.index[course]
+
+    def completion_matrix(self, completed_sets):
+        """Students' completed course codes -> bool matrix over `courses`; unknown codes are dropped."""
+        matrix = np.zeros((len(completed_sets), len(self.courses)), dtype=bool)
+        for row, completed in enumerate(completed_sets):
+            columns = [self.index[code] for code in completed if code in self.index]
+            matrix[row, columns] = True
+        return matrix
+
+    def completion_matrix_for_users(self, users):
+        return self.completion_matrix([{course.code for course in user.classes_taken} for user in users])
+
+    def run(self, completed):
+        """
+        `completed` is a students x courses bool matrix (columns in `courses`
+        order) or a list of completed-code sets. Returns a CohortResult.
+        """
+        if not isinstance(completed, np.ndarray):
+            completed = self.completion_matrix(completed)
+        source = completed.astype(bool, copy=False)
+        completed = source.copy()
+        for column, implied in self.equivalencies:
+            completed[:, implied] |= source[:, [column]]
+
+        as_float = completed.astype(np.float32)
+        groups_met = (as_float @ self.groups) > 0
+        satisfied = (groups_met.astype(np.float32) @ self.group_owner) >= self.groups_needed
+        eligible = satisfied & ~completed[:, self.catalog_columns]
+
+        students = completed.shape[0]
+        missing = np.zeros((students, len(self.rules)), dtype=np.int32)
+        choice = np.zeros((students, len(self.rules)), dtype=np.int32)
+        for r, rule in enumerate(self.rules):
+            kind = rule["kind"]
+            if kind == "Electives":
+                done = as_float[:, rule["columns"]].sum(axis=1)
+                missing[:, r] = np.maximum(rule["required"] - done, 0)
+            elif kind in ("mandatory", "additional"):
+                missing[:, r] = len(rule["columns"]) - as_float[:, rule["columns"]].sum(axis=1)
+            else:
+                per_alternative = np.stack(
+                    [len(alt) - as_float[:, alt].sum(axis=1) for alt in rule["alternatives"]], axis=1
+                )
+                # argmin keeps the first of equally short alternatives, like min(..., key=len).
+                choice[:, r] = per_alternative.argmin(axis=1)
+                missing[:, r] = np.where((per_alternative == 0).any(axis=1), 0, per_alternative.min(axis=1))
+        return CohortResult(self, eligible, missing, choice, completed)
+
+
+def _courses_in(subreq):
+    if isinstance(subreq, list):
+        return subreq
+    if not isinstance(subreq, dict):
+        return []
+    courses = []
+    for key in ("mandatory", "additional"):
+        courses.extend(subreq.get(key, []))
+    for key in ("one_of", "plus_one_of"):
+        for alternative in subreq.get(key, []):
+            courses.extend(alternative)
+    return courses
@@ -0,0 +1,84 @@
+# --- Course Unlock Impact --------------- #
+#
+# Static analysis of the prerequisites DAG for one catalog: for every catalog
+# course, which degree courses (anything a requirement lists) sit downstream of
+# it, and how long the longest prerequisite chain through degree courses that
+# starts with it is. Eligible courses can then be ranked by what taking them
+# first opens up. Computed once per catalog (see course_impact) and looked up
+# per request.
+
+from prereq_engine import compile_prerequisites
+
+
+class CourseImpact:
+    """
+    `downstream[course]` is the mask of catalog courses that (transitively) list
+    `course` in a prerequisite group. `unlocks[course]` counts the degree courses
+    in it; `depth[course]` is the number of courses on the longest chain starting
+    with `course` that leads to degree courses (1 when nothing does).
+    """
+    def __init__(self, requirements, prerequisites, all_courses):
+        self.compiled = compile_prerequisites(prerequisites, all_courses)
+        self.position = {course: index for index, course in enumerate(self.compiled.courses)}
+        self.degree_mask = self.compiled.mask(_degree_courses(requirements))
+        self.downstream = {}
+        self.depth = {}
+        for course in self.compiled.courses:
+            self._visit(course)
+        self.unlocks = {course: bin(mask & self.degree_mask).count("1") for course, mask in self.downstream.items()}
+
+    def _visit(self, course):
+        if course in self.depth:
+            return
+        self.downstream[course] = 0
+        self.depth[course] = 1  # cycle guard
+        downstream = 0
+        depth = 1
+        for dependent in self.compiled.unlocks.get(self.compiled.bit[course], []):
+            self._visit(dependent)
+            dependent_bit = 1 << self.compiled.bit[dependent]
+            downstream |= dependent_bit | self.downstream[dependent]
+            # Only chains that reach a degree course count toward the critical path.
+            if (dependent_bit | self.downstream[dependent]) & self.degree_mask:
+                depth = max(depth, self.depth[dependent] + 1)
+        self.downstream[course] = downstream
+        self.depth[course] = depth
+
+    def annotate(self, course):
+        return {"course": course, "unlocks": self.unlocks.get(course, 0), "depth": self.depth.get(course, 1)}
+
+    def rank(self, courses):
+        """Courses annotated and ordered by critical-path depth, then unlock count, then catalog order."""
+        annotated = [self.annotate(course) for course in courses]
+        annotated.sort(key=lambda item: (-item["depth"], -item["unlocks"],
+                                         self.position.get(item["course"], len(self.position))))
+        return annotated
+
+
+def _degree_courses(requirements):
+    courses = set()
+    for category in requirements.values():
+        for subreq in category.values():
+            if not isinstance(subreq, dict):
+                continue
+            for key in ("mandatory", "additional"):
+                courses.update(subreq.get(key, []))
+            for key in ("one_of", "plus_one_of"):
+                for alternative in subreq.get(key, []):
+                    courses.update(alternative)
+        courses.update(category.get("list", []))
+    return courses
+
+
+_analyses = {}
+
+
+# One analysis per catalog: the tables are loaded once per catalog year, so
+# they are keyed by identity like compile_prerequisites.
+def course_impact(requirements, prerequisites, all_courses):
+    key = (id(requirements), id(prerequisites), id(all_courses))
+    entry = _analyses.get(key)
+    if entry is None or entry[0] is not requirements or entry[1] is not prerequisites or entry[2] is not all_courses:
+        entry = (requirements, prerequisites, all_courses, CourseImpact(requirements, prerequisites, all_courses))
+        _analyses[key] = entry
+    return entry[3]
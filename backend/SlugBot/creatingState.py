@@ -1,8 +1,20 @@
 import re
 import json
-from pypdf import PdfReader
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pdf_text import extract_text
+from transcript_cache import TranscriptCache
+from prereq_engine import compile_prerequisites
+from course_impact import course_impact
+from planner import DEFAULT_UNITS, DegreePlanner
+from catalog import load_catalog
+from equivalencies import load_equivalencies
 from webscraping.schedule import extract_course_data
-from webscraping.rmp import get_professor_info
+from webscraping.professor_lookup import get_professor_lookup
+from webscraping.negative_cache import NegativeCache, normalize_name
+from webscraping.snapshot import delta_path_for, read_deltas
 from state import state as shared_state
 
 # =============================================================================
@@ -14,13 +26,37 @@ class User:
         self.credits_taken = credits_taken
         self.classes_taken = classes_taken if classes_taken is not None else []
         self.gpa = gpa
+        # Bumped on every change to classes_taken; CurriculumRequirements caches per version.
+        self.version = 0
 
     def add_course(self, course):
         self.classes_taken.append(course)
+        self.version += 1
 
     def get_courses_by_quarter(self, quarter):
         return [course for course in self.classes_taken if course.quarter == quarter]
 
+    def to_dict(self):
+        # Compact form: each quarter name is stored once and courses refer to it by index.
+        quarters = []
+        quarter_index = {}
+        courses = []
+        for course in self.classes_taken:
+            if course.quarter not in quarter_index:
+                quarter_index[course.quarter] = len(quarters)
+                quarters.append(course.quarter)
+            courses.append([course.code, quarter_index[course.quarter], course.credits])
+        return {"name": self.name, "gpa": self.gpa, "credits_taken": self.credits_taken,
+                "quarters": quarters, "courses": courses}
+
+    @classmethod
+    def from_dict(cls, data):
+        quarters = data["quarters"]
+        classes_taken = [Course(code=code, quarter=quarters[index], credits=credits)
+                         for code, index, credits in data["courses"]]
+        return cls(name=data["name"], credits_taken=data["credits_taken"],
+                   classes_taken=classes_taken, gpa=data["gpa"])
+
     def __str__(self):
         courses_str = "\n".join(f"- {course}" for course in self.classes_taken)
         return (f"User: {self.name}\n"
@@ -41,168 +77,21 @@ class Course:
 # =============================================================================
 # Constants: Requirements, Allowed Courses, and Prerequisites
 # =============================================================================
-requirements = {
-    "Lower_Division": {
-        "Computer_Science_and_Engineering": {
-            "mandatory": ["CSE 12", "CSE 16", "CSE 20", "CSE 30", "CSE 40"],
-            "additional": ["CSE 13S"]
-        },
-        "Mathematics": {
-            "one_of": [
-                ["MATH 19A", "MATH 19B"],
-                ["MATH 20A", "MATH 20B"]
-            ]
-        },
-        "Applied_Mathematics": {
-            "one_of": [["AM 10"], ["MATH 21"]],
-            "plus_one_of": [["AM 30", "MATH 23A"]]
-        },
-        "Engineering_Science": {
-            "mandatory": ["ECE 30"]
-        }
-    },
-    "Upper_Division": {
-        "Core_Computer_Science": {
-            "mandatory": ["CSE 101", "CSE 101M", "CSE 120", "CSE 130"],
-            "one_of": [
-                ["CSE 102", "CSE 103"],
-                ["CSE 112", "CSE 114A"]
-            ]
-        },
-        "Statistics": {"one_of": [["STAT 131", "CSE 107"]]},
-        "DC": {"one_of": [["CSE 115A", "CSE 185E", "CSE 195"]]},
-        "Capstone": {
-            "one_of": [[
-                "CSE 110B", "CSE 115C", "CSE 115D", "CSE 121", "CSE 134", "CSE 138",
-                "CSE 140", "CSE 143", "CSE 144", "CSE 145", "CSE 156+L", "CSE 156L",
-                "CSE 157", "CSE 160", "CSE 161+L", "CSE 161L", "CSE 162+L", "CSE 162L",
-                "CSE 163", "CSE 168", "CSE 181", "CSE 183", "CSE 184", "CSE 187",
-                "CMPM 172"
-            ]]
-        }
-    },
-    "Electives": {
-        "number_required": 4,
-        "list": [
-            "AM 114", "AM 147", "CMPM 120", "CMPM 131", "CMPM 146",
-            "CMPM 163", "CMPM 164+L", "CMPM 164L", "CMPM 171", "CMPM 172",
-            "MATH 110", "MATH 115", "MATH 116", "MATH 117", "MATH 118",
-            "MATH 134", "MATH 145+L", "MATH 145L", "MATH 148", "MATH 160",
-            "MATH 161", "STAT 132"
-        ]
-    }
-}
-
-allowed_lower = [
-    "CSE 12", "CSE 16", "CSE 20", "CSE 30", "CSE 40", "CSE 13S",
-    "MATH 19A", "MATH 19B", "MATH 20A", "MATH 20B",
-    "AM 10", "MATH 21", "AM 30", "MATH 23A", "ECE 30"
-]
-allowed_upper_core = [
-    "CSE 101", "CSE 101M", "CSE 120", "CSE 130",
-    "CSE 102", "CSE 103", "CSE 112", "CSE 114A", "STAT 131", "CSE 107"
-]
-allowed_dc = ["CSE 115A", "CSE 185E", "CSE 195"]
-allowed_capstone = [
-    "CSE 110B", "CSE 115C", "CSE 115D", "CSE 121", "CSE 134", "CSE 138",
-    "CSE 140", "CSE 143", "CSE 144", "CSE 145", "CSE 156+L", "CSE 156L",
-    "CSE 157", "CSE 160", "CSE 161+L", "CSE 161L", "CSE 162+L", "CSE 162L",
-    "CSE 163", "CSE 168", "CSE 181", "CSE 183", "CSE 184", "CSE 187",
-    "CMPM 172"
-]
-allowed_electives = [
-    "AM 114", "AM 147", "CMPM 120", "CMPM 131", "CMPM 146",
-    "CMPM 163", "CMPM 164+L", "CMPM 164L", "CMPM 171", "CMPM 172",
-    "MATH 110", "MATH 115", "MATH 116", "MATH 117", "MATH 118",
-    "MATH 134", "MATH 145+L", "MATH 145L", "MATH 148", "MATH 160",
-    "MATH 161", "STAT 132"
-]
-allowed_courses = set(allowed_lower + allowed_upper_core + allowed_dc + allowed_capstone + allowed_electives)
-all_courses = list(allowed_courses)
-
-prerequisites = {
-    # Lower Division
-    "CSE 12": [["CSE 30"]],
-    "CSE 16": [["MATH 19A"]],
-    "CSE 20": [],
-    "CSE 30": [["CSE 20"]],
-    "CSE 40": [["CSE 30"], ["MATH 19B", "MATH 20B"]],
-    "CSE 13S": [["CSE 12"]],
-    "MATH 19A": [],
-    "MATH 19B": [["MATH 19A"]],
-    "MATH 20A": [],
-    "MATH 20B": [["MATH 20A"]],
-    "AM 10": [],
-    "MATH 21": [["MATH 11A", "MATH 19A", "MATH 20A"]],
-    "AM 30": [["AM 10", "MATH 21"], ["MATH 19B"]],
-    "MATH 23A": [["MATH 19B", "MATH 20A"]],
-    "ECE 30": [],
-    # Upper Division Core
-    "CSE 101": [["CSE 13S"], ["CSE 16"], ["CSE 30"]],
-    "CSE 101M": [["CSE 101"]],
-    "CSE 120": [["CSE 13S"], ["CSE 16"]],
-    "CSE 130": [["CSE 101"]],
-    "CSE 102": [["CSE 101"]],
-    "CSE 103": [["CSE 101"]],
-    "CSE 112": [["CSE 101"]],
-    "CSE 114A": [["CSE 101"]],
-    "STAT 131": [["MATH 11A", "MATH 19A", "MATH 20A"]],
-    "CSE 107": [["CSE 16"], ["AM 30", "MATH 23A", "MATH 22"]],
-    # DC Options
-    "CSE 115A": [["CSE 101"], ["CSE 130"]],
-    "CSE 185E": [["CSE 12", "CSE 30"]],
-    "CSE 195": [["CSE 123A", "CSE 129"]],
-    # Capstone Courses
-    "CSE 110B": [["CSE 110A"]],
-    "CSE 115C": [["CSE 115B"]],
-    "CSE 115D": [["CSE 115A"]],
-    "CSE 121": [["CSE 100"], ["CSE 13S"], ["ECE 101"], ["PHYS 5C"], ["PHYS 5N"]],
-    "CSE 134": [["CSE 120"], ["CSE 130"]],
-    "CSE 138": [["CSE 130", "CSE 131"]],
-    "CSE 140": [["CSE 101"], ["CSE 40", "STAT 132"]],
-    "CSE 143": [["CSE 101"], ["CSE 107", "STAT 131"], ["CSE 40"]],
-    "CSE 144": [["CSE 40", "STAT 132"], ["CSE 101"]],
-    "CSE 145": [["CSE 30", "CSE 13S"], ["AM 30", "MATH 23A", "MATH 22"], ["STAT 5", "CSE 107", "STAT 131"], ["AM 10", "MATH 21"], ["CSE 16", "ECON 113"]],
-    "CSE 156+L": [["CSE 150"], ["CSE 101"]],
-    "CSE 156L": [["CSE 156+L"]],
-    "CSE 157": [["CSE 121"], ["CSE 150"]],
-    "CSE 160": [["CSE 101"], ["AM 10", "MATH 21"]],
-    "CSE 161+L": [["CSE 160"]],
-    "CSE 161L": [["CSE 161+L"]],
-    "CSE 162+L": [["CSE 101"], ["AM 10", "MATH 21"]],
-    "CSE 162L": [["CSE 162+L"]],
-    "CSE 163": [["CSE 101"]],
-    "CSE 168": [["CSE 160"]],
-    "CSE 181": [["CSE 180"]],
-    "CSE 183": [["CSE 101", "CMPM 35"]],
-    "CSE 184": [["CSE 101"]],
-    "CSE 187": [["CSE 186"]],
-    # Electives (Mathematics/AM)
-    "AM 114": [["AM 10", "MATH 21"], ["MATH 24", "AM 20"], ["AM 30", "MATH 23A", "MATH 22"]],
-    "AM 147": [["AM 10", "MATH 21"]],
-    "MATH 110": [["MATH 100", "CSE 101"]],
-    "MATH 115": [["MATH 21", "AM 10"], ["MATH 100", "CSE 101"]],
-    "MATH 116": [["MATH 100", "CSE 101"]],
-    "MATH 117": [["MATH 21", "AM 10"], ["MATH 100", "CSE 101"]],
-    "MATH 118": [["MATH 110", "MATH 11A"]],
-    "MATH 134": [["MATH 100", "CSE 101"]],
-    "MATH 145+L": [["MATH 22", "MATH 23A"], ["MATH 21", "AM 10"], ["MATH 100", "CSE 101"]],
-    "MATH 145L": [["MATH 145+L"]],
-    "MATH 148": [["MATH 22", "MATH 23A"], ["MATH 21", "AM 10"], ["MATH 103A", "MATH 105A", "MATH 152", "AM 147", "CSE 101"]],
-    "MATH 160": [["MATH 100", "CSE 101"]],
-    "MATH 161": [["MATH 100"]],
-    "STAT 132": [["STAT 131", "CSE 107"]],
-    # Electives (CMPM)
-    "CMPM 120": [["CMPM 80K"], ["FILM 80V"], ["CSE 30", "CMPM 35"]],
-    "CMPM 131": [["cred 90>"]],
-    "CMPM 146": [["CSE 101"]],
-    "CMPM 163": [["CSE 120"]],
-    "CMPM 164+L": [["CMPM 163", "CSE 160"], ["CSE 160"]],
-    "CMPM 164L": [["CMPM 164+L"]],
-    "CMPM 171": [["CMPM 121"], ["CMPM 130"], ["CMPM 170"], ["CMPM 176"]],
-    "CMPM 172": [["CMPM 171"]]
-}
-prerequisites = {k: v for k, v in prerequisites.items() if k in allowed_courses}
+# Read from the memory-mapped index of data/catalog_<CATALOG_YEAR>.json (catalog.py).
+catalog = load_catalog()
+requirements = catalog.requirements
+allowed_lower = catalog.allowed["lower"]
+allowed_upper_core = catalog.allowed["upper_core"]
+allowed_dc = catalog.allowed["dc"]
+allowed_capstone = catalog.allowed["capstone"]
+allowed_electives = catalog.allowed["electives"]
+allowed_courses = catalog.allowed_courses
+all_courses = catalog.all_courses
+prerequisites = catalog.prerequisites
+
+# Completing a course also counts as completing the courses it implies
+# (data/equivalencies.json, compiled once into its transitive closure).
+equivalencies = load_equivalencies()
 
 
 # =============================================================================
@@ -211,61 +100,280 @@ prerequisites = {k: v for k, v in prerequisites.items() if k in allowed_courses}
 class TranscriptParser:
     """
     Extracts text from a PDF transcript and parses the student information.
+    Pass `text` instead of a path when the transcript text is already extracted.
     """
-    def __init__(self, pdf_path):
+    # Bump whenever parse_user's output changes; it invalidates the TranscriptCache.
+    VERSION = 1
+
+    def __init__(self, pdf_path=None, text=None):
         self.pdf_path = pdf_path
-        self.text = self._read_pdf()
+        self.text = text if text is not None else self._read_pdf()
 
     def _read_pdf(self):
-        reader = PdfReader(self.pdf_path)
-        textdata = ""
-        for page in reader.pages:
-            text = page.extract_text()
-            if text:
-                textdata += text
-        return textdata
+        # Long transcripts are extracted page-parallel; see pdf_text.extract_pages.
+        return extract_text(self.pdf_path)
+
+    # Token rules for parse_user. Each line is split on whitespace once and the
+    # rules below are full matches on its tokens, so nothing backtracks across lines.
+    _YEAR = re.compile(r'\d{4}')
+    _SEASONS = {"Summer", "Fall", "Winter", "Spring"}
+    _CODE = re.compile(r'[A-Z]+\d+[A-Z]*')      # "CSE12A"
+    _SUBJECT = re.compile(r'[A-Z]+')            # "CSE" of "CSE 12A"
+    _NUMBER = re.compile(r'\d+[A-Z]*')          # "12A" of "CSE 12A"
+    _TITLE = re.compile(r'[\w:,&\-/]+(?: [\w:,&\-/]+)*')  # title words joined by single spaces
+    _DECIMAL = re.compile(r'\d+\.\d+')
+    _GRADE = re.compile(r'[A-F][+-]?')
+    _SPACED_VALUE = re.compile(r'\s+([\d.]+)')
+
+    def _quarter_header(self, line, tokens):
+        # "2024 Fall Quarter ..." -> "2024 Fall Quarter" (original spacing kept)
+        if (len(tokens) >= 3 and tokens[1] in self._SEASONS and tokens[2].startswith("Quarter")
+                and self._YEAR.fullmatch(tokens[0])):
+            season_at = line.find(tokens[1], 4)
+            return line[:line.find("Quarter", season_at + len(tokens[1])) + len("Quarter")]
+        return None
+
+    def _course_row(self, line, tokens):
+        # CODE  TITLE WORDS...  ATTEMPTED  EARNED  GRADE  POINTS -> (code, attempted credits)
+        if self._CODE.fullmatch(tokens[0]):
+            code = tokens[0]
+            i = 1
+        elif len(tokens) > 1 and self._SUBJECT.fullmatch(tokens[0]) and self._NUMBER.fullmatch(tokens[1]):
+            # Keep the spacing between subject and number as it appears on the line.
+            code = line[:line.find(tokens[1], len(tokens[0])) + len(tokens[1])]
+            i = 2
+        else:
+            return None
+
+        # Title words never contain ".", and the attempted credits always do, so
+        # the title runs up to the first token with a "." in it.
+        for end in range(i, len(tokens)):
+            if "." in tokens[end]:
+                break
+        else:
+            return None
+        if end == i or len(tokens) < end + 4 or not self._TITLE.fullmatch(" ".join(tokens[i:end])):
+            return None
+        attempted, earned, grade, points = tokens[end:end + 4]
+        if (self._DECIMAL.fullmatch(attempted) and self._DECIMAL.fullmatch(earned)
+                and self._GRADE.fullmatch(grade) and self._DECIMAL.match(points)):
+            return code, float(attempted)
+        return None
 
     def parse_user(self):
-        # Extract student's name.
-        name_match = re.search(r"Name:\s*(.+)", self.text)
-        full_name = name_match.group(1).strip() if name_match else "Unknown"
+        """
+        Single forward pass over the transcript lines. Picks up the name (first
+        "Name:"), quarter headers, course rows under the current quarter, and the
+        last "Cum GPA ... Cum Totals" pair, which may span lines.
+        """
+        full_name = None
+        awaiting_name = False
+        name_padded = False
+        courses = []
+        current_quarter = None
+        # Cumulative totals: a "Cum GPA" value waits for the next "Cum Totals" value.
+        pending_gpa = None
+        awaiting_value = None  # keyword whose value should start the next non-blank line
+        last_totals = None
+
+        for raw_line in self.text.splitlines():
+            # Name: text after the first "Name:", or the next non-blank line if it's empty.
+            if full_name is None:
+                if awaiting_name:
+                    if raw_line.strip():
+                        full_name = raw_line.strip()
+                    name_padded = name_padded or bool(raw_line)
+                else:
+                    name_at = raw_line.find("Name:")
+                    if name_at >= 0:
+                        rest = raw_line[name_at + len("Name:"):]
+                        full_name = rest.strip() or None
+                        awaiting_name = full_name is None
+                        name_padded = bool(rest)
+
+            # Cumulative GPA / credit totals.
+            pos = 0
+            if awaiting_value is not None and raw_line.strip():
+                value = self._SPACED_VALUE.match(" " + raw_line)
+                if value:
+                    if awaiting_value == "Cum GPA":
+                        pending_gpa = value.group(1)
+                    else:
+                        last_totals = (pending_gpa, value.group(1))
+                        pending_gpa = None
+                    pos = value.end() - 1
+                awaiting_value = None
+            while awaiting_value is None:
+                keyword = "Cum GPA" if pending_gpa is None else "Cum Totals"
+                found = raw_line.find(keyword, pos)
+                if found < 0:
+                    break
+                after = found + len(keyword)
+                value = self._SPACED_VALUE.match(raw_line, after)
+                if value:
+                    if pending_gpa is None:
+                        pending_gpa = value.group(1)
+                    else:
+                        last_totals = (pending_gpa, value.group(1))
+                        pending_gpa = None
+                    pos = value.end()
+                elif not raw_line[after:].strip():
+                    # Keyword ends the line; its value may start the next one.
+                    awaiting_value = keyword
+                else:
+                    pos = found + 1
+
+            # Quarter headers start with a year, course rows with a subject code;
+            # the first character rules out most lines before tokenizing.
+            line = raw_line.strip()
+            if not line:
+                continue
+            first = line[0]
+            if first.isdigit():
+                quarter = self._quarter_header(line, line.split())
+                if quarter is not None:
+                    current_quarter = quarter
+            elif "A" <= first <= "Z" and current_quarter is not None:
+                row = self._course_row(line, line.split())
+                if row and row[0] in allowed_courses:
+                    courses.append(Course(code=row[0], quarter=current_quarter, credits=row[1]))
+
+        if full_name is None:
+            # A "Name:" followed only by blanks still counts as an (empty) name.
+            full_name = "" if awaiting_name and name_padded else "Unknown"
         if full_name == "Unknown":
             print("Error: Unable to extract student's name.")
         user = User(name=full_name)
+        for course in courses:
+            user.add_course(course)
 
-        # Parse course lines.
-        current_quarter = None
-        lines = self.text.splitlines()
-        quarter_pattern = re.compile(r'^(\d{4}\s+(Summer|Fall|Winter|Spring)\s+Quarter)')
-        course_pattern = re.compile(
-            r'^([A-Z]+\s*\d+[A-Z]*)\s+[\w:,&\-/]+(?:\s+[\w:,&\-/]+)*\s+([\d]+\.[\d]+)\s+([\d]+\.[\d]+)\s+[A-F][+-]?\s+[\d]+\.[\d]+'
-        )
-        for line in lines:
-            line = line.strip()
-            q_match = quarter_pattern.match(line)
-            if q_match:
-                current_quarter = q_match.group(0)
-                continue
-            c_match = course_pattern.match(line)
-            if c_match and current_quarter:
-                course_code = c_match.group(1)
-                if course_code not in allowed_courses:
-                    continue
-                credits = float(c_match.group(2))
-                course = Course(code=course_code, quarter=current_quarter, credits=credits)
-                user.add_course(course)
-
-        # Extract cumulative GPA and credits.
-        cum_matches = re.findall(r'Cum GPA\s+([\d.]+).*?Cum Totals\s+([\d.]+)', self.text, flags=re.DOTALL)
-        if cum_matches:
-            last_gpa, last_credits = cum_matches[-1]
-            user.gpa = float(last_gpa)
-            user.credits_taken = float(last_credits)
+        if last_totals:
+            user.gpa = float(last_totals[0])
+            user.credits_taken = float(last_totals[1])
         else:
             print("Error: Unable to extract cumulative GPA and credit totals.")
         return user
 
 
+# parse_user keeps only courses in this catalog's allowed list, so cached parses are
+# namespaced by the catalog year and the digest of its source file.
+def open_transcript_cache(**kwargs):
+    namespace = f"{catalog.year}-{catalog.digest.hex()[:16]}"
+    return TranscriptCache(version=TranscriptParser.VERSION, namespace=namespace, **kwargs)
+
+
+def parse_transcript(pdf_path, cache=None, max_workers=None):
+    """
+    Returns the parsed User for a transcript PDF, answering repeat uploads of the
+    same file from the TranscriptCache without touching the PDF library.
+    `max_workers` caps the processes used to extract a long PDF's pages.
+    """
+    with open(pdf_path, "rb") as f:
+        pdf_bytes = f.read()
+    return parse_transcript_bytes(pdf_bytes, cache, lambda data: extract_text(data, max_workers=max_workers))[0]
+
+
+def parse_transcript_bytes(pdf_bytes, cache=None, extract=extract_text, key=None):
+    """
+    (User, text) for a transcript PDF's bytes (or any buffer), looked up in the
+    TranscriptCache first; on a hit the PDF is not read and text is None.
+    `extract` turns the bytes into text; `key` skips hashing when it's known.
+    """
+    if cache is None:
+        cache = open_transcript_cache()
+    if key is None:
+        key = cache.key_for(pdf_bytes)
+    cached = cache.get(key)
+    if cached is not None:
+        return User.from_dict(cached), None
+
+    text = extract(pdf_bytes)
+    user = TranscriptParser(text=text).parse_user()
+    cache.put(key, user.to_dict())
+    return user, text
+
+
+# =============================================================================
+# Class: CurriculumResultCache
+# =============================================================================
+class CurriculumResultCache:
+    """
+    LRU of remaining/eligible results shared by every CurriculumRequirements in
+    the process (e.g. across web requests), keyed by the catalog tables and the
+    student's completed-course snapshot. The stored values are shared between
+    students, so CurriculumRequirements only ever hands out copies of them.
+    """
+    def __init__(self, max_entries=int(os.getenv("CURRICULUM_CACHE_SIZE", "1024"))):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, kind, tables, completed, compute):
+        key = (kind, tuple(id(table) for table in tables), completed)
+        with self._lock:
+            entry = self._entries.get(key)
+            # The entry keeps its tables alive, so a matching id is the same table.
+            if entry is not None and all(a is b for a, b in zip(entry[0], tables)):
+                self._entries.move_to_end(key)
+                return entry[1]
+        value = compute()
+        with self._lock:
+            self._entries[key] = (tables, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+curriculum_cache = CurriculumResultCache()
+
+
+# Copies the dict/list nesting of a cached result (the leaves are strings/ints).
+def _copy_result(value):
+    if isinstance(value, dict):
+        return {key: _copy_result(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_result(item) for item in value]
+    return value
+
+
+_requirement_entries = {}
+
+
+def requirement_entries(requirements):
+    """
+    (category, entry name) -> (kind, rule value, courses it mentions) for every
+    entry remaining_requirements can report; built once per requirements table.
+    """
+    cached = _requirement_entries.get(id(requirements))
+    if cached is not None and cached[0] is requirements:
+        return cached[1]
+    entries = {}
+    for cat, subreqs in requirements.items():
+        if cat == "Electives":
+            elective_list = subreqs.get("list", [])
+            entries[(cat, "Electives")] = (
+                "Electives", (subreqs.get("number_required", 0), elective_list), frozenset(elective_list)
+            )
+            continue
+        for subcat, req in subreqs.items():
+            if not isinstance(req, dict):
+                continue
+            for kind in ("mandatory", "additional"):
+                if kind in req:
+                    entries[(cat, f"{subcat} ({kind})")] = (kind, req[kind], frozenset(req[kind]))
+            for kind in ("one_of", "plus_one_of"):
+                if kind in req:
+                    courses = frozenset(c for alternatives in req[kind] for c in alternatives)
+                    entries[(cat, f"{subcat} ({kind})")] = (kind, req[kind], courses)
+    _requirement_entries[id(requirements)] = (requirements, entries)
+    return entries
+
+
 # =============================================================================
 # Class: CurriculumRequirements
 # =============================================================================
@@ -274,11 +382,16 @@ class CurriculumRequirements:
     Manages curriculum requirements and computes remaining requirements
     as well as eligible courses based on the transcript.
     """
-    def __init__(self, user, requirements, prerequisites, all_courses):
+    def __init__(self, user, requirements, prerequisites, all_courses, cache=curriculum_cache):
         self.user = user
         self.requirements = requirements
         self.prerequisites = prerequisites
         self.all_courses = all_courses
+        self.compiled = compile_prerequisites(prerequisites, all_courses)
+        self.cache = cache
+        self._version = None
+        self._completed = None
+        self._results = {}
 
     def _check_requirement_group(self, group, completed):
         return [course for course in group if course not in completed]
@@ -294,29 +407,34 @@ class CurriculumRequirements:
 
     def _enhance_completed(self, completed):
         """Auto-add prerequisites based on equivalencies."""
-        enhanced = set(completed)
-        if "CSE 30" in enhanced:
-            enhanced.add("CSE 20")
-        if "MATH 19B" in enhanced:
-            enhanced.add("MATH 19A")
-            enhanced.add("MATH 20A")
-            enhanced.add("MATH 20B")
-        if "MATH 20B" in enhanced:
-            enhanced.add("MATH 20A")
-        if "MATH 21" in enhanced:
-            enhanced.add("AM 10")
-        if "AM 10" in enhanced:
-            enhanced.add("MATH 21")
-        if "MATH 23A" in enhanced:
-            enhanced.add("AM 30")
-        if "AM 30" in enhanced:
-            enhanced.add("MATH 23A")
-        return enhanced
+        return equivalencies.enhance(completed)
+
+    def _snapshot(self):
+        # Rebuilt only when User.add_course has changed the course list since the last read.
+        version = getattr(self.user, "version", None)
+        if self._completed is None or version is None or version != self._version:
+            completed = {course.code for course in self.user.classes_taken}
+            self._completed = frozenset(self._enhance_completed(completed))
+            self._version = version
+            self._results = {}
+        return self._completed
+
+    def _cached(self, kind, compute):
+        completed = self._snapshot()
+        if kind not in self._results:
+            if self.cache is None:
+                self._results[kind] = compute(completed)
+            else:
+                tables = (self.requirements, self.prerequisites, self.all_courses)
+                self._results[kind] = self.cache.get_or_compute(kind, tables, completed, lambda: compute(completed))
+        # Results are shared with other students through the cache; callers get their own copy.
+        return _copy_result(self._results[kind])
 
     @property
     def remaining_requirements(self):
-        completed = {course.code for course in self.user.classes_taken}
-        completed = self._enhance_completed(completed)
+        return self._cached("remaining", self._remaining_requirements)
+
+    def _remaining_requirements(self, completed):
         remaining = {}
         for cat, subreqs in self.requirements.items():
             remaining[cat] = {}
@@ -350,21 +468,52 @@ class CurriculumRequirements:
 
     @property
     def eligible_courses(self):
-        completed = {course.code for course in self.user.classes_taken}
-        completed = self._enhance_completed(completed)
-        eligible = []
-        for course in self.all_courses:
-            if course in completed:
-                continue
-            prereq_groups = self.prerequisites.get(course, [])
-            satisfied = True
-            for group in prereq_groups:
-                if not any(req in completed for req in group):
-                    satisfied = False
-                    break
-            if satisfied:
-                eligible.append(course)
-        return eligible
+        # Bitmask check per course; see prereq_engine.CompiledPrerequisites.
+        return self._cached("eligible", self.compiled.eligible)
+
+    def what_if(self, codes):
+        """
+        What changes if the student also completes `codes` (equivalencies
+        applied): courses that become eligible, eligible courses that would be
+        done, and requirements that would be satisfied. Eligibility is only
+        re-checked for courses whose prerequisites mention an added course.
+        """
+        completed = self._snapshot()
+        added = self._enhance_completed(codes) - completed
+        unlocked, done = self.compiled.what_if(self._cached("mask", self.compiled.mask), self.compiled.mask(added))
+
+        # Satisfied entries stay satisfied, so only reported entries that mention
+        # an added course need re-checking.
+        before = self.remaining_requirements
+        after = {cat: dict(entries) for cat, entries in before.items()}
+        satisfied = []
+        after_completed = completed | added
+        entries = requirement_entries(self.requirements)
+        for cat, reported in before.items():
+            for name in reported:
+                kind, value, courses = entries[(cat, name)]
+                if courses.isdisjoint(added):
+                    continue
+                if kind == "Electives":
+                    required, elective_list = value
+                    electives_done = sum(1 for c in elective_list if c in after_completed)
+                    missing = f"{required - electives_done} elective(s) remaining" if electives_done < required else None
+                elif kind in ("mandatory", "additional"):
+                    missing = self._check_requirement_group(value, after_completed)
+                else:
+                    missing = self._check_one_of_group(value, after_completed)
+                if missing:
+                    after[cat][name] = missing
+                else:
+                    del after[cat][name]
+                    satisfied.append([cat, name])
+        return {
+            "added": sorted(added),
+            "unlocked": self.compiled.codes(unlocked),
+            "done": self.compiled.codes(done),
+            "satisfied": satisfied,
+            "remaining": after
+        }
 
 
 # =============================================================================
@@ -373,7 +522,8 @@ class CurriculumRequirements:
 class CourseGrouper:
     """
     Provides a method to group eligible courses into
-    Lower Division, Upper Division, and Electives.
+    Lower Division, Upper Division, and Electives, plus a "Priority" list
+    ranking them by unlock impact (see course_impact.py).
     """
     @staticmethod
     def group_eligible_courses(curriculum):
@@ -426,16 +576,39 @@ class CourseGrouper:
             if eligible_electives:
                 grouped["Electives"] = eligible_electives
 
+        # Every eligible course with its unlock count and critical-path depth, most impactful first.
+        impact = course_impact(curriculum.requirements, curriculum.prerequisites, curriculum.all_courses)
+        grouped["Priority"] = impact.rank(curriculum.eligible_courses)
+
         return grouped
 
 
+def summarize_curriculum(user):
+    """
+    Remaining requirements, eligible courses and their grouping for `user`, as
+    plain JSON-serializable data (used by the web app's transcript jobs).
+    """
+    curriculum = CurriculumRequirements(user, requirements, prerequisites, all_courses)
+    return {
+        "remaining": curriculum.remaining_requirements,
+        "eligible": curriculum.eligible_courses,
+        "grouped": CourseGrouper.group_eligible_courses(curriculum)
+    }
+
+
+def what_if(user, codes):
+    """CurriculumRequirements.what_if for `user`, as JSON-serializable data."""
+    return CurriculumRequirements(user, requirements, prerequisites, all_courses).what_if(codes)
+
+
 # =============================================================================
 # Class: ScheduleLoader
 # =============================================================================
 class ScheduleLoader:
     """
     Loads a JSON file containing schedule data and extracts
-    information only for eligible courses.
+    information only for eligible courses. When the schedule is refreshed
+    incrementally, get_schedule_changes reads just the logged section changes.
     """
     def __init__(self, schedule_filepath):
         self.schedule_filepath = schedule_filepath
@@ -454,10 +627,18 @@ class ScheduleLoader:
                     break
         return eligible_schedule
 
+    def get_schedule_changes(self, since=None):
+        # Entries look like {"op": "changed", "key": "<course>|<section>", "before": ..., "after": ..., "at": ...}
+        return list(read_deltas(delta_path_for(self.schedule_filepath), since))
+
 
 # =============================================================================
 # Class: ProfessorScraper
 # =============================================================================
+# Returned by ProfessorScraper._lookup when the lookup errored rather than missed.
+LOOKUP_FAILED = object()
+
+
 class ProfessorScraper:
     """
     Retrieves professor information from RateMyProfessors for courses in the schedule.
@@ -466,17 +647,73 @@ class ProfessorScraper:
     and, if no data is found and the name has a middle name, retries with the full name.
     Only data for a maximum of 10 courses is scraped.
     Additionally, the 'tags' list is converted to a minimal dictionary with tag frequencies.
+
+    `backend` picks the lookup implementation ("selenium" or "http"); by default
+    it comes from the RMP_BACKEND environment variable.
+
+    With max_workers > 1 the schedule is first collapsed into the set of unique
+    instructors, each instructor is looked up once on a bounded thread pool, and
+    the results are joined back into the {course: {section: info}} shape.
+
+    Instructors RMP had no match for are remembered in a NegativeCache and are
+    not looked up again until that entry expires.
     """
+    max_courses = 10  # Limit for courses to scrape
+    university = "University of California Santa Cruz"
+
     @staticmethod
-    def scrape_professors(eligible_schedule):
+    def _clean_name(professor_name):
+        # Clean professor name: remove any text within parentheses.
+        return re.sub(r'\s*\(.*?\)', '', professor_name).strip()
+
+    @staticmethod
+    def _lookup(get_professor_info, clean_name):
+        # Determine short name (without middle name) if possible.
+        name_parts = clean_name.split()
+        if len(name_parts) >= 3:
+            short_name = f"{name_parts[0]} {name_parts[-1]}"
+        else:
+            short_name = clean_name
+
+        try:
+            # Try scraping using the short name first.
+            print(f"\nScraping info for Professor '{short_name}' using short name...")
+            prof_info = get_professor_info(short_name, ProfessorScraper.university)
+
+            # If no info was found and the short name differs from the full name, try with the full name.
+            if not prof_info and short_name != clean_name:
+                print(f"No data with short name '{short_name}'. Retrying with full name '{clean_name}'...")
+                prof_info = get_professor_info(clean_name, ProfessorScraper.university)
+        except Exception as e:
+            # Network/browser/page errors are not "no match"; the caller must not cache them.
+            print(f"Lookup failed for Professor '{clean_name}': {e}")
+            return LOOKUP_FAILED
+
+        # Convert the tags list into a dictionary of tag frequencies.
+        if prof_info and "tags" in prof_info:
+            tag_counts = {}
+            for tag in prof_info["tags"]:
+                tag_counts[tag] = tag_counts.get(tag, 0) + 1
+            prof_info["tags"] = tag_counts
+
+        return prof_info
+
+    @staticmethod
+    def scrape_professors(eligible_schedule, max_workers=1, backend=None, negative_cache=None):
+        get_professor_info = get_professor_lookup(backend)
+        if negative_cache is None:
+            negative_cache = NegativeCache()
         prof_data = {}
+        # Normalized instructor name -> cleaned name to look up (first spelling seen wins).
+        instructors = {}
+        # (course, section, normalized name) for every section that needs a lookup.
+        pending = []
         scraped_courses = 0
-        max_courses = 10  # Limit for courses to scrape
 
         for course, sections in eligible_schedule.items():
             prof_data[course] = {}
             # Enforce max course scraping limit.
-            if scraped_courses >= max_courses:
+            if scraped_courses >= ProfessorScraper.max_courses:
                 print(f"\nMax course scrape limit reached. Skipping scraping for course {course}.")
                 for section in sections:
                     prof_data[course][section] = None
@@ -484,37 +721,51 @@ class ProfessorScraper:
 
             scraped_courses += 1
             for section, professor_name in sections.items():
-                # Clean professor name: remove any text within parentheses.
-                clean_name = re.sub(r'\s*\(.*?\)', '', professor_name).strip()
+                clean_name = ProfessorScraper._clean_name(professor_name)
                 if clean_name.lower() == "staff":
                     print(f"\nSkipping web scrape for professor '{clean_name}' (Course {course}, Section {section})...")
                     prof_data[course][section] = None
                     continue
 
-                # Determine short name (without middle name) if possible.
-                name_parts = clean_name.split()
-                if len(name_parts) >= 3:
-                    short_name = f"{name_parts[0]} {name_parts[-1]}"
-                else:
-                    short_name = clean_name
-
-                # Try scraping using the short name first.
-                print(f"\nScraping info for Professor '{short_name}' (Course {course}, Section {section}) using short name...")
-                prof_info = get_professor_info(short_name)
-
-                # If no info was found and the short name differs from the full name, try with the full name.
-                if not prof_info and short_name != clean_name:
-                    print(f"No data with short name '{short_name}'. Retrying with full name '{clean_name}'...")
-                    prof_info = get_professor_info(clean_name)
-
-                # Convert the tags list into a dictionary of tag frequencies.
-                if prof_info and "tags" in prof_info:
-                    tag_counts = {}
-                    for tag in prof_info["tags"]:
-                        tag_counts[tag] = tag_counts.get(tag, 0) + 1
-                    prof_info["tags"] = tag_counts
+                # Placeholder keeps the original section order; filled in after the lookups.
+                prof_data[course][section] = None
+                key = normalize_name(clean_name)
+                instructors.setdefault(key, clean_name)
+                pending.append((course, section, key))
+
+        # Known misses are answered from the negative cache without any network work.
+        results = {}
+        for key, name in list(instructors.items()):
+            if negative_cache.contains(name, ProfessorScraper.university):
+                print(f"\nSkipping web scrape for professor '{name}' (no RMP match on a recent run)...")
+                results[key] = None
+                del instructors[key]
+
+        # Each instructor is scraped once, no matter how many sections they teach.
+        if max_workers > 1 and len(instructors) > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {key: executor.submit(ProfessorScraper._lookup, get_professor_info, name)
+                           for key, name in instructors.items()}
+                looked_up = {key: future.result() for key, future in futures.items()}
+        else:
+            looked_up = {key: ProfessorScraper._lookup(get_professor_info, name) for key, name in instructors.items()}
+
+        for key, prof_info in looked_up.items():
+            if prof_info is LOOKUP_FAILED:
+                # Only real misses go into the negative cache; errors are retried next run.
+                looked_up[key] = None
+            elif prof_info:
+                negative_cache.discard(instructors[key], ProfessorScraper.university)
+            else:
+                negative_cache.add(instructors[key], ProfessorScraper.university)
+        if looked_up:
+            negative_cache.save()
+        results.update(looked_up)
 
-                prof_data[course][section] = prof_info
+        for course, section, key in pending:
+            prof_info = results[key]
+            # Give every section its own copy so callers can annotate them independently.
+            prof_data[course][section] = dict(prof_info) if prof_info else None
 
         return prof_data
 
@@ -528,6 +779,10 @@ class Application:
     """
     def __init__(self):
         self.schedule_filepath = "courses_2025_Fall25.json"
+        self.scrape_workers = 4
+        self.rmp_backend = None  # None -> RMP_BACKEND env var, "selenium" by default
+        self.unit_cap = 15.0
+        self.plan_time_budget = 2.0
         self.state = {}
 
     def run(self):
@@ -536,8 +791,7 @@ class Application:
         # Parse the Transcript.
         # -------------------------
         pdf_file = input("Enter the PDF file path: ")
-        transcript_parser = TranscriptParser(pdf_file)
-        user = transcript_parser.parse_user()
+        user = parse_transcript(pdf_file)
     
         # Add user information to the state
         self.state["user"] = {
@@ -588,6 +842,27 @@ class Application:
             for course in grouped["Electives"]:
                 print(f"- {course}")
 
+        print("\n----- Eligible Courses by Priority -----\n")
+        for item in grouped["Priority"]:
+            print(f"- {item['course']}: unlocks {item['unlocks']} degree course(s), "
+                  f"chain of {item['depth']} to go")
+
+        # -------------------------
+        # Plan the Remaining Quarters.
+        # -------------------------
+        planner = DegreePlanner(requirements, prerequisites, all_courses, equivalencies, unit_cap=self.unit_cap)
+        plan = planner.plan({course.code for course in user.classes_taken}, time_budget=self.plan_time_budget)
+        print("\n----- Suggested Plan to Graduation -----\n")
+        if plan is None:
+            print("No plan found from the courses on this transcript.")
+        else:
+            print(plan)
+            print(f"(Unit totals assume {DEFAULT_UNITS:g} units per course, labs included, "
+                  f"against a cap of {self.unit_cap:g}.)")
+            if not plan.optimal:
+                print("(Best plan found within the time budget; a shorter one may exist.)")
+            self.state["plan"] = plan.quarters
+
         # -------------------------
         # Load Schedule Data.
         # -------------------------
@@ -607,7 +882,9 @@ class Application:
         # -------------------------
         # Scrape Professor Information.
         # -------------------------
-        self.state["professors"] = ProfessorScraper.scrape_professors(eligible_schedule_info)
+        self.state["professors"] = ProfessorScraper.scrape_professors(
+            eligible_schedule_info, max_workers=self.scrape_workers, backend=self.rmp_backend
+        )
         print("\n----- Professor Information -----\n")
         for course, sections in self.state["professors"].items():
             print(f"{course}:")
@@ -0,0 +1,69 @@
+# --- Course Equivalencies --------------- #
+#
+# Completing a course can count as completing others (equivalent courses, AP
+# credit, transfer articulation). The table lives in data/equivalencies.json as
+# {course: [implied courses]} and is compiled once into its transitive closure,
+# so enhancing a completed set is one union per completed course regardless of
+# how the rules chain.
+
+import json
+import os
+
+DEFAULT_EQUIVALENCIES_PATH = os.getenv(
+    "EQUIVALENCIES_PATH", os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "equivalencies.json")
+)
+
+_loaded = {}
+
+
+class EquivalencyTable:
+    """
+    `closure[course]` is every course `course` implies, directly or through other
+    rules (never the course itself). `implied_by` is the reverse map. Iterating
+    yields (course, sorted implied courses) pairs.
+    """
+    def __init__(self, rules=None):
+        rules = {course: list(implied) for course, implied in dict(rules or {}).items()}
+        self.closure = {}
+        for course in rules:
+            seen = set()
+            stack = list(rules[course])
+            while stack:
+                code = stack.pop()
+                if code in seen:
+                    continue
+                seen.add(code)
+                stack.extend(rules.get(code, ()))
+            seen.discard(course)
+            if seen:
+                self.closure[course] = frozenset(seen)
+        self.implied_by = {}
+        for course, implied in self.closure.items():
+            for code in implied:
+                self.implied_by.setdefault(code, set()).add(course)
+
+    def __iter__(self):
+        for course, implied in self.closure.items():
+            yield course, sorted(implied)
+
+    def __len__(self):
+        return len(self.closure)
+
+    def enhance(self, completed):
+        """Completed codes plus everything they imply, as a new set."""
+        enhanced = set(completed)
+        closure = self.closure
+        for code in completed:
+            implied = closure.get(code)
+            if implied:
+                enhanced |= implied
+        return enhanced
+
+
+def load_equivalencies(path=DEFAULT_EQUIVALENCIES_PATH):
+    """Reads and compiles the table at `path`; each file is compiled only once per process."""
+    path = os.path.abspath(path)
+    if path not in _loaded:
+        with open(path, "r") as f:
+            _loaded[path] = EquivalencyTable(json.load(f))
+    return _loaded[path]
@@ -0,0 +1,396 @@
+# --- Multi-Quarter Degree Planner ------- #
+#
+# Finds a minimum-quarter plan that finishes the `requirements` in
+# creatingState.py, taking courses only once their `prerequisites` are met and
+# staying under a per-quarter unit cap.
+#
+# The search works on completed-course bitmasks (prereq_engine) and relies on
+# everything being monotone: completing more never makes a course ineligible
+# or a requirement less satisfied. So each quarter only needs to consider
+# maximal course sets drawn from courses that still help ("useful" courses).
+# Iterative deepening on the number of quarters then finds the shortest plan:
+#   - a greedy critical-path plan gives the starting upper bound;
+#   - states proven unable to finish within k quarters are memoized by mask;
+#   - branches are cut when a lower bound (courses still needed / courses per
+#     quarter, or the longest prerequisite chain still ahead) exceeds the
+#     quarters left.
+# The search stops at `time_budget` seconds and returns the best plan so far.
+#
+# Requirements that can never be completed from this catalog (e.g. an option
+# whose prerequisite is not offered) are reported in Plan.unsatisfiable; the
+# planner finishes everything else.
+#
+# The catalog has no unit counts, so every course counts DEFAULT_UNITS (5)
+# against the cap unless `units` gives its real value; 2-unit labs such as
+# "CSE 156L" are over-counted by default. The search is fastest when units are
+# uniform (see _moves).
+
+import math
+import time
+from itertools import combinations
+
+from prereq_engine import compile_prerequisites
+from equivalencies import EquivalencyTable
+
+DEFAULT_UNITS = 5.0
+DEFAULT_UNIT_CAP = 15.0
+
+
+class Plan:
+    """
+    `quarters` is a list of course lists, one per quarter, and `units` the unit
+    total of each quarter as counted against the cap (courses missing from the
+    planner's `units` count DEFAULT_UNITS). `optimal` is True when the search
+    proved no shorter plan exists within the time budget.
+    """
+    def __init__(self, quarters, optimal, unsatisfiable, elapsed, units=None):
+        self.quarters = quarters
+        self.optimal = optimal
+        self.unsatisfiable = unsatisfiable
+        self.elapsed = elapsed
+        self.units = units or [0.0] * len(quarters)
+
+    def __len__(self):
+        return len(self.quarters)
+
+    def __str__(self):
+        lines = [f"Quarter {number} ({units:g} units): {', '.join(courses)}"
+                 for number, (courses, units) in enumerate(zip(self.quarters, self.units), start=1)]
+        if self.unsatisfiable:
+            lines.append(f"Not completable from this catalog: {', '.join(self.unsatisfiable)}")
+        return "\n".join(lines)
+
+
+class DegreePlanner:
+    def __init__(self, requirements, prerequisites, all_courses, equivalencies=None,
+                 unit_cap=DEFAULT_UNIT_CAP, units=None):
+        self.compiled = compile_prerequisites(prerequisites, all_courses)
+        self.unit_cap = unit_cap
+        self.units = units or {}
+
+        # The table is already transitively closed, so one pass over it is enough.
+        equivalencies = equivalencies if equivalencies is not None else EquivalencyTable()
+        bit = self.compiled.bit
+        self.equivalencies = [(1 << bit[course], self.compiled.mask(implied))
+                              for course, implied in equivalencies if course in bit]
+        # Sources that imply each course, for the chain-depth bound.
+        self.implied_by = equivalencies.implied_by
+
+        # Requirement rules as masks: ("all", name, mask), ("any", name, [alt masks]),
+        # ("count", name, mask, number_required).
+        self.rules = []
+        for category, subreqs in requirements.items():
+            if category == "Electives":
+                self.rules.append(("count", "Electives", self.compiled.mask(subreqs.get("list", [])),
+                                   subreqs.get("number_required", 0)))
+                continue
+            for subcat, req in subreqs.items():
+                if not isinstance(req, dict):
+                    continue
+                for kind in ("mandatory", "additional"):
+                    if kind in req:
+                        self.rules.append(("all", f"{subcat} ({kind})", self.compiled.mask(req[kind])))
+                for kind in ("one_of", "plus_one_of"):
+                    if kind in req:
+                        self.rules.append(("any", f"{subcat} ({kind})",
+                                           [self.compiled.mask(alt) for alt in req[kind]]))
+
+        # Every course that could lead to each course: all options of all groups, transitively.
+        self.ancestors = {}
+        for course in self.compiled.courses:
+            self._ancestors(1 << bit[course])
+
+    # ------------------------------------------------------------------
+    # Bitmask helpers
+    # ------------------------------------------------------------------
+    def _ancestors(self, course_bit):
+        if course_bit in self.ancestors:
+            return self.ancestors[course_bit]
+        self.ancestors[course_bit] = 0  # guards against prerequisite cycles
+        course = self.compiled.names[course_bit.bit_length() - 1]
+        mask = 0
+        for group in self.compiled.requires.get(course, []):
+            mask |= group
+            remaining = group
+            while remaining:
+                low = remaining & -remaining
+                mask |= self._ancestors(low)
+                remaining ^= low
+        self.ancestors[course_bit] = mask
+        return mask
+
+    def _close(self, mask):
+        for source, implied in self.equivalencies:
+            if mask & source:
+                mask |= implied
+        return mask
+
+    def _reachable(self, completed):
+        # Everything that could ever be taken: keep "taking" all eligible courses.
+        reachable = completed
+        while True:
+            grown = self._close(reachable | self.compiled.eligible_mask(reachable))
+            if grown == reachable:
+                return reachable
+            reachable = grown
+
+    def _bits(self, mask):
+        while mask:
+            low = mask & -mask
+            yield low
+            mask ^= low
+
+    def _course_units(self, course_bit):
+        return self.units.get(self.compiled.names[course_bit.bit_length() - 1], DEFAULT_UNITS)
+
+    # ------------------------------------------------------------------
+    # Goal, useful courses and lower bounds
+    # ------------------------------------------------------------------
+    def _targets(self, reachable):
+        # Rules restricted to what can be completed; impossible ones are set aside.
+        targets = []
+        unsatisfiable = []
+        for rule in self.rules:
+            kind, name = rule[0], rule[1]
+            if kind == "all":
+                if rule[2] & ~reachable:
+                    unsatisfiable.append(name)
+                targets.append(("all", name, rule[2] & reachable))
+            elif kind == "any":
+                alternatives = [alt for alt in rule[2] if not alt & ~reachable]
+                if alternatives:
+                    targets.append(("any", name, alternatives))
+                else:
+                    unsatisfiable.append(name)
+            else:
+                available = bin(rule[2] & reachable).count("1")
+                if available < rule[3]:
+                    unsatisfiable.append(name)
+                targets.append(("count", name, rule[2] & reachable, min(rule[3], available)))
+        return targets, unsatisfiable
+
+    def _is_done(self, completed):
+        for target in self.targets:
+            if target[0] == "all":
+                if target[2] & ~completed:
+                    return False
+            elif target[0] == "any":
+                if not any(not alt & ~completed for alt in target[2]):
+                    return False
+            elif bin(target[2] & completed).count("1") < target[3]:
+                return False
+        return True
+
+    def _needed(self, completed):
+        """
+        (must-take mask, extra course count, open rule candidates) for a state.
+        Must-take courses are the missing ones from "all" rules. The extra count
+        only adds rules whose candidates are disjoint from everything counted so
+        far, so it never overestimates.
+        """
+        must = 0
+        for target in self.targets:
+            if target[0] == "all":
+                must |= target[2] & ~completed
+        extra = 0
+        counted = must
+        candidates = must
+        for target in self.targets:
+            if target[0] == "any":
+                if any(not alt & ~completed for alt in target[2]):
+                    continue
+                union = 0
+                for alt in target[2]:
+                    union |= alt
+                union &= ~completed
+                candidates |= union
+                still = min(bin(alt & ~completed & ~must).count("1") for alt in target[2])
+            elif target[0] == "count":
+                done = bin(target[2] & completed).count("1")
+                if done >= target[3]:
+                    continue
+                union = target[2] & ~completed
+                candidates |= union
+                still = max(0, target[3] - done - bin(union & must).count("1"))
+            else:
+                continue
+            if not union & counted & ~must:
+                extra += still
+                counted |= union
+        return must, extra, candidates
+
+    def _useful(self, candidates):
+        useful = candidates
+        for course_bit in self._bits(candidates):
+            useful |= self.ancestors.get(course_bit, 0)
+        return useful & self.reachable
+
+    def _depth(self, course, completed, memo):
+        # Quarters until `course` is done: 0 if completed, else one more than its
+        # slowest prerequisite group (taking that group's fastest option), or
+        # less if an equivalent course gets there sooner.
+        if course in memo:
+            return memo[course]
+        course_bit = 1 << self.compiled.bit[course]
+        if completed & course_bit:
+            memo[course] = 0
+            return 0
+        memo[course] = math.inf  # cycle guard
+        best = self._take_depth(course, completed, memo)
+        for source in self.implied_by.get(course, ()):
+            if source in self.compiled.requires:
+                best = min(best, self._take_depth(source, completed, memo))
+        memo[course] = best
+        return best
+
+    def _take_depth(self, course, completed, memo):
+        if course not in self.compiled.requires:
+            return math.inf  # not in the catalog, so it can only be inherited
+        slowest = 0
+        for group in self.compiled.requires[course]:
+            fastest = min((self._depth(self.compiled.names[b.bit_length() - 1], completed, memo)
+                           for b in self._bits(group)), default=math.inf)
+            slowest = max(slowest, fastest)
+        return slowest + 1
+
+    def _lower_bound(self, completed):
+        must, extra, _ = self._needed(completed)
+        per_quarter = max(1, int(self.unit_cap // self.min_units))
+        bound = math.ceil((bin(must).count("1") + extra) / per_quarter)
+
+        memo = {}
+        for course_bit in self._bits(must):
+            bound = max(bound, self._depth(self.compiled.names[course_bit.bit_length() - 1], completed, memo))
+        for target in self.targets:
+            if target[0] == "any" and not any(not alt & ~completed for alt in target[2]):
+                chain = min(max((self._depth(self.compiled.names[b.bit_length() - 1], completed, memo)
+                                 for b in self._bits(alt & ~completed)), default=0)
+                            for alt in target[2])
+                bound = max(bound, chain)
+        return bound
+
+    # ------------------------------------------------------------------
+    # Quarter moves
+    # ------------------------------------------------------------------
+    def _moves(self, completed):
+        # Maximal sets of useful, eligible courses that fit under the unit cap,
+        # most urgent (longest chain still hanging on them) first.
+        _, _, candidates = self._needed(completed)
+        options = self.compiled.eligible_mask(completed) & self._useful(candidates)
+        ordered = sorted(self._bits(options), key=lambda b: (-self.height.get(b, 0), b))
+        if not ordered:
+            return
+        units = [self._course_units(b) for b in ordered]
+        if sum(units) <= self.unit_cap:
+            yield sum(ordered)
+            return
+        most = int(self.unit_cap // self.min_units)
+        for size in range(min(most, len(ordered)), 0, -1):
+            found = False
+            for picks in combinations(range(len(ordered)), size):
+                total = sum(units[i] for i in picks)
+                if total > self.unit_cap:
+                    continue
+                leftover = self.unit_cap - total
+                if any(units[i] <= leftover for i in range(len(ordered)) if i not in picks):
+                    continue  # not maximal: another course still fits
+                found = True
+                yield sum(ordered[i] for i in picks)
+            if found and len(set(units)) == 1:
+                return
+
+    def _heights(self, useful):
+        # Longest chain of useful courses that depend on each course.
+        heights = {}
+
+        def height(course_bit):
+            if course_bit in heights:
+                return heights[course_bit]
+            heights[course_bit] = 0  # cycle guard
+            course = self.compiled.names[course_bit.bit_length() - 1]
+            best = 0
+            for dependent in self.compiled.unlocks.get(self.compiled.bit[course], []):
+                dependent_bit = 1 << self.compiled.bit[dependent]
+                if dependent_bit & useful:
+                    best = max(best, height(dependent_bit) + 1)
+            heights[course_bit] = best
+            return best
+
+        for course_bit in self._bits(useful):
+            height(course_bit)
+        return heights
+
+    # ------------------------------------------------------------------
+    # Search
+    # ------------------------------------------------------------------
+    def _greedy(self, completed):
+        plan = []
+        while not self._is_done(completed):
+            move = next(self._moves(completed), 0)
+            if not move:
+                return None
+            plan.append(move)
+            completed = self._close(completed | move)
+        return plan
+
+    def _search(self, completed, quarters_left, path):
+        if self._is_done(completed):
+            return list(path)
+        if quarters_left == 0 or time.perf_counter() > self.deadline:
+            return None
+        if self.failed.get(completed, -1) >= quarters_left:
+            return None
+        if self._lower_bound(completed) > quarters_left:
+            self.failed[completed] = quarters_left
+            return None
+        for move in self._moves(completed):
+            path.append(move)
+            found = self._search(self._close(completed | move), quarters_left - 1, path)
+            path.pop()
+            if found is not None:
+                return found
+        if time.perf_counter() <= self.deadline:
+            self.failed[completed] = quarters_left
+        return None
+
+    def plan(self, completed_codes, time_budget=2.0):
+        """
+        Plans from the given completed course codes (equivalencies applied).
+        Returns a Plan, or None if nothing can be scheduled at all.
+        """
+        start = time.perf_counter()
+        self.deadline = start + time_budget
+        self.failed = {}
+        self.min_units = min([self.unit_cap] + [self._course_units(1 << i) for i in range(len(self.compiled.names))])
+
+        completed = self._close(self.compiled.mask(completed_codes))
+        self.reachable = self._reachable(completed)
+        self.targets, unsatisfiable = self._targets(self.reachable)
+        self.height = self._heights(self._useful(self._needed(completed)[2]))
+
+        best = self._greedy(completed)
+        if best is None:
+            return None
+        # Deepen from the lower bound; the first depth with a plan is optimal as
+        # long as every shallower depth was searched to completion.
+        optimal = False
+        depth = self._lower_bound(completed)
+        while True:
+            if depth >= len(best):
+                optimal = True
+                break
+            found = self._search(completed, depth, [])
+            if time.perf_counter() > self.deadline:
+                if found is not None:
+                    best = found
+                break
+            if found is not None:
+                best = found
+                optimal = True
+                break
+            depth += 1
+
+        quarters = [[course for course in self.compiled.courses if (1 << self.compiled.bit[course]) & move]
+                    for move in best]
+        units = [sum(self._course_units(b) for b in self._bits(move)) for move in best]
+        return Plan(quarters, optimal, unsatisfiable, time.perf_counter() - start, units)
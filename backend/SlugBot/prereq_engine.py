@@ -0,0 +1,151 @@
+# --- Compiled Prerequisite Engine ------- #
+#
+# The prerequisites table maps a course to an AND of OR-groups, e.g.
+# "CSE 40": [["CSE 30"], ["MATH 19B", "MATH 20B"]]. Compiling it gives every
+# course an integer ID (its bit) and turns each OR-group into a bitmask, so a
+# course is eligible for a completed-set mask when every group mask shares a
+# bit with it: one AND per group instead of string set lookups. Single-course
+# groups are folded into one "all of" mask, checked with a single AND.
+
+
+class CompiledPrerequisites:
+    """
+    `prerequisites` compiled against the catalog order in `all_courses`.
+    Courses that only appear as prerequisites (e.g. "PHYS 5C") get bits too.
+    `unlocks` is the reverse index: bit -> catalog courses whose prerequisites
+    mention that course; `what_if` uses it to re-check only those courses.
+    """
+    def __init__(self, prerequisites, all_courses):
+        self.courses = list(all_courses)
+        self.bit = {}
+        for course in self.courses:
+            self._bit_for(course)
+        for groups in prerequisites.values():
+            for group in groups:
+                for course in group:
+                    self._bit_for(course)
+        self.names = sorted(self.bit, key=self.bit.get)
+
+        # (course bit, course name, all-of mask, [any-of masks]) in catalog order.
+        self.rules = []
+        self.rule_for = {}
+        self.requires = {}
+        self.unlocks = {}
+        for course in self.courses:
+            groups = prerequisites.get(course, [])
+            group_masks = [self.mask(group) for group in groups]
+            all_of = 0
+            any_of = []
+            for group, group_mask in zip(groups, group_masks):
+                if len(group) == 1:
+                    all_of |= group_mask
+                else:
+                    any_of.append(group_mask)
+            self.rules.append((1 << self.bit[course], course, all_of, any_of))
+            self.rule_for[course] = self.rules[-1]
+            self.requires[course] = group_masks
+            for group in groups:
+                for required in group:
+                    dependents = self.unlocks.setdefault(self.bit[required], [])
+                    if course not in dependents:
+                        dependents.append(course)
+
+    def _bit_for(self, course):
+        if course not in self.bit:
+            self.bit[course] = len(self.bit)
+        return self.bit[course]
+
+    # Codes outside the compiled universe can't satisfy anything and are ignored.
+    def mask(self, codes):
+        mask = 0
+        bit = self.bit
+        for code in codes:
+            index = bit.get(code)
+            if index is not None:
+                mask |= 1 << index
+        return mask
+
+    def codes(self, mask):
+        names = self.names
+        codes = []
+        while mask:
+            low = mask & -mask
+            codes.append(names[low.bit_length() - 1])
+            mask ^= low
+        return codes
+
+    def is_eligible(self, course, completed_mask):
+        course_bit = 1 << self.bit[course]
+        return not completed_mask & course_bit and all(group & completed_mask for group in self.requires[course])
+
+    def eligible_mask(self, completed_mask):
+        eligible = 0
+        for course_bit, _, all_of, any_of in self.rules:
+            if completed_mask & course_bit or completed_mask & all_of != all_of:
+                continue
+            for group in any_of:
+                if not group & completed_mask:
+                    break
+            else:
+                eligible |= course_bit
+        return eligible
+
+    @staticmethod
+    def _met(rule, completed_mask):
+        _, _, all_of, any_of = rule
+        return completed_mask & all_of == all_of and all(group & completed_mask for group in any_of)
+
+    def what_if(self, completed_mask, added_mask):
+        """
+        Eligibility change from also completing `added_mask`, as
+        (newly eligible mask, mask of courses that stop being eligible because
+        they would be done). Only the dependents of added courses are checked.
+        """
+        added_mask &= ~completed_mask
+        after = completed_mask | added_mask
+        unlocked = 0
+        dropped = 0
+        checked = set()
+        remaining = added_mask
+        while remaining:
+            low = remaining & -remaining
+            remaining ^= low
+            rule = self.rule_for.get(self.names[low.bit_length() - 1])
+            if rule is not None and self._met(rule, completed_mask):
+                dropped |= low
+            for course in self.unlocks.get(low.bit_length() - 1, ()):
+                if course in checked:
+                    continue
+                checked.add(course)
+                rule = self.rule_for[course]
+                if not after & rule[0] and self._met(rule, after) and not self._met(rule, completed_mask):
+                    unlocked |= rule[0]
+        return unlocked, dropped
+
+    # Catalog courses not yet completed whose prerequisites are all met, in catalog order.
+    def eligible(self, completed):
+        completed_mask = completed if isinstance(completed, int) else self.mask(completed)
+        eligible = []
+        for course_bit, course, all_of, any_of in self.rules:
+            if completed_mask & course_bit or completed_mask & all_of != all_of:
+                continue
+            for group in any_of:
+                if not group & completed_mask:
+                    break
+            else:
+                eligible.append(course)
+        return eligible
+
+
+_compiled = {}
+
+
+# The catalog tables are module-level constants, so compile each (prerequisites,
+# all_courses) pair once and reuse it for every CurriculumRequirements.
+def compile_prerequisites(prerequisites, all_courses):
+    key = (id(prerequisites), id(all_courses))
+    entry = _compiled.get(key)
+    if entry is None or entry[0] is not prerequisites or entry[1] is not all_courses:
+        entry = (prerequisites, all_courses, CompiledPrerequisites(prerequisites, all_courses))
+        _compiled[key] = entry
+    return entry[2]
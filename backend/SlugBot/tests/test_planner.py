@@ -0,0 +1,82 @@
+# --- Tests: Degree Planner --- #
+#
+# Plans must be legal (prerequisites met by earlier quarters, unit cap kept),
+# must finish every completable requirement, and must be as short as the
+# search proved possible.
+#
+#   python -m unittest discover -s backend/SlugBot/tests
+
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from creatingState import (Course, CurriculumRequirements, User, all_courses, allowed_courses, equivalencies,
+                           prerequisites, requirements)
+from planner import DEFAULT_UNITS, DegreePlanner
+
+
+class DegreePlannerTest(unittest.TestCase):
+    def assert_legal(self, plan, completed, planner):
+        compiled = planner.compiled
+        done = planner._close(compiled.mask(completed))
+        for quarter in plan.quarters:
+            self.assertLessEqual(sum(planner.units.get(course, DEFAULT_UNITS) for course in quarter), planner.unit_cap)
+            for course in quarter:
+                self.assertTrue(compiled.is_eligible(course, done), f"{course} planned before its prerequisites")
+            done = planner._close(done | compiled.mask(quarter))
+
+    def assert_finishes(self, plan, completed):
+        user = User("planned")
+        for code in completed:
+            user.add_course(Course(code, "Before", DEFAULT_UNITS))
+        for number, quarter in enumerate(plan.quarters, start=1):
+            for code in quarter:
+                user.add_course(Course(code, f"Quarter {number}", DEFAULT_UNITS))
+        curriculum = CurriculumRequirements(user, requirements, prerequisites, all_courses, cache=None)
+        left = {subreq for category in curriculum.remaining_requirements.values() for subreq in category}
+        self.assertEqual(left, set(plan.unsatisfiable))
+
+    def test_freshman_plan_lengths(self):
+        for unit_cap, quarters in ((10.0, 12), (15.0, 8), (20.0, 7)):
+            with self.subTest(unit_cap=unit_cap):
+                planner = DegreePlanner(requirements, prerequisites, all_courses, equivalencies, unit_cap=unit_cap)
+                plan = planner.plan([])
+                self.assertEqual(len(plan), quarters)
+                self.assertTrue(plan.optimal)
+                self.assertEqual(plan.unsatisfiable, ["DC (one_of)", "Capstone (one_of)"])
+                self.assert_legal(plan, [], planner)
+                self.assert_finishes(plan, [])
+
+    def test_random_students(self):
+        rng = random.Random(0)
+        catalog = sorted(allowed_courses)
+        planner = DegreePlanner(requirements, prerequisites, all_courses, equivalencies)
+        for _ in range(15):
+            completed = rng.sample(catalog, rng.randint(0, 20))
+            plan = planner.plan(completed)
+            self.assert_legal(plan, completed, planner)
+            self.assert_finishes(plan, completed)
+
+    def test_completed_courses_are_not_replanned(self):
+        planner = DegreePlanner(requirements, prerequisites, all_courses, equivalencies)
+        completed = ["CSE 20", "CSE 12", "MATH 19A"]
+        plan = planner.plan(completed)
+        planned = {course for quarter in plan.quarters for course in quarter}
+        self.assertFalse(planned & set(completed))
+        self.assertLessEqual(len(plan), len(planner.plan([])))
+
+    def test_unit_totals(self):
+        units = {"CSE 30": 7.0, "MATH 19A": 4.0}
+        planner = DegreePlanner(requirements, prerequisites, all_courses, equivalencies, units=units)
+        plan = planner.plan(["CSE 20"])
+        self.assert_legal(plan, ["CSE 20"], planner)
+        for quarter, total in zip(plan.quarters, plan.units):
+            self.assertEqual(total, sum(units.get(course, DEFAULT_UNITS) for course in quarter))
+        self.assertIn(f"({plan.units[0]:g} units)", str(plan).splitlines()[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+# --- Tests: Compiled Prerequisite Engine --- #
+#
+# The bitmask engine against the plain set-lookup loop it replaced, and
+# what_if against recomputing eligibility from scratch.
+#
+#   python -m unittest discover -s backend/SlugBot/tests
+
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from creatingState import all_courses, prerequisites
+from prereq_engine import CompiledPrerequisites, compile_prerequisites
+
+
+def naive_eligible(completed, prerequisites=prerequisites, all_courses=all_courses):
+    return [course for course in all_courses
+            if course not in completed
+            and all(any(req in completed for req in group) for group in prerequisites.get(course, []))]
+
+
+class SmallCatalogTest(unittest.TestCase):
+    PREREQUISITES = {
+        "CSE 30": [["CSE 20"]],
+        "CSE 40": [["CSE 30"], ["MATH 19B", "MATH 20B"]],
+        "CSE 101": [["CSE 30"], ["CSE 16"]],
+    }
+    ALL_COURSES = ["CSE 16", "CSE 20", "CSE 30", "CSE 40", "CSE 101", "MATH 19B"]
+
+    def setUp(self):
+        self.compiled = CompiledPrerequisites(self.PREREQUISITES, self.ALL_COURSES)
+
+    def test_prerequisite_only_courses_get_bits(self):
+        self.assertIn("MATH 20B", self.compiled.bit)
+        self.assertNotIn("MATH 20B", self.compiled.eligible([]))
+
+    def test_and_of_or_groups(self):
+        eligible = self.compiled.eligible({"CSE 20", "CSE 30", "MATH 20B"})
+        self.assertEqual(eligible, ["CSE 16", "CSE 40", "MATH 19B"])
+        self.assertFalse(self.compiled.is_eligible("CSE 101", self.compiled.mask({"CSE 30"})))
+        self.assertTrue(self.compiled.is_eligible("CSE 101", self.compiled.mask({"CSE 30", "CSE 16"})))
+        self.assertFalse(self.compiled.is_eligible("CSE 30", self.compiled.mask({"CSE 20", "CSE 30"})))
+
+    def test_unknown_codes_are_ignored(self):
+        self.assertEqual(self.compiled.mask(["NOPE 1"]), 0)
+        self.assertEqual(self.compiled.eligible({"NOPE 1"}), self.compiled.eligible(set()))
+
+    def test_codes_round_trip(self):
+        codes = ["CSE 20", "MATH 20B", "CSE 101"]
+        self.assertEqual(sorted(self.compiled.codes(self.compiled.mask(codes))), sorted(codes))
+
+    def test_reverse_index(self):
+        self.assertEqual(self.compiled.unlocks[self.compiled.bit["CSE 30"]], ["CSE 40", "CSE 101"])
+
+
+class CatalogTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.compiled = compile_prerequisites(prerequisites, all_courses)
+        rng = random.Random(0)
+        universe = sorted(cls.compiled.bit)
+        cls.completed_sets = [set(rng.sample(universe, rng.randint(0, len(universe) // 2))) for _ in range(300)]
+        cls.additions = [rng.sample(universe, rng.randint(1, 3)) for _ in cls.completed_sets]
+
+    def test_compiled_once_per_catalog(self):
+        self.assertIs(compile_prerequisites(prerequisites, all_courses), self.compiled)
+
+    def test_eligible_matches_naive_loop(self):
+        for completed in self.completed_sets:
+            expected = naive_eligible(completed)
+            self.assertEqual(self.compiled.eligible(completed), expected)
+            mask = self.compiled.mask(completed)
+            self.assertEqual(self.compiled.eligible(mask), expected)
+            self.assertEqual(set(self.compiled.codes(self.compiled.eligible_mask(mask))), set(expected))
+
+    def test_what_if_matches_recompute(self):
+        for completed, added in zip(self.completed_sets, self.additions):
+            before = set(naive_eligible(completed))
+            after = set(naive_eligible(completed | set(added)))
+            unlocked, dropped = self.compiled.what_if(self.compiled.mask(completed), self.compiled.mask(added))
+            self.assertEqual(set(self.compiled.codes(unlocked)), after - before)
+            self.assertEqual(set(self.compiled.codes(dropped)), before - after)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,150 @@
+# --- Tests: HTTP RMP Backend --- #
+#
+# Runs HttpProfessorLookup against a local fixture server that answers the
+# GraphQL search with a canned payload.
+#
+#   python -m unittest discover -s backend/SlugBot/tests
+
+import json
+import os
+import sys
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from webscraping.rmp_http import SCHOOL_IDS, HttpProfessorLookup
+
+UCSC_ID = SCHOOL_IDS["university of california santa cruz"]
+
+# Enough namesakes elsewhere to fill the first page of a nationwide search.
+NAMESAKES = [
+    {
+        "firstName": "Pat", "lastName": "Smith", "avgRating": 3.0, "avgDifficulty": 3.0,
+        "wouldTakeAgainPercent": 50, "school": {"id": f"other-{n}", "name": f"State College {n}"},
+        "teacherRatingTags": []
+    }
+    for n in range(25)
+]
+
+TEACHERS = NAMESAKES + [
+    {   # Same name at another school: must be skipped.
+        "firstName": "Patrick", "lastName": "Tantalo", "avgRating": 2.0, "avgDifficulty": 1.0,
+        "wouldTakeAgainPercent": 10, "school": {"id": "sjsu", "name": "San Jose State University"},
+        "teacherRatingTags": []
+    },
+    {
+        "firstName": "Patrick", "lastName": "Tantalo", "avgRating": 4.5, "avgDifficulty": 3.0,
+        "wouldTakeAgainPercent": 87.6, "school": {"id": UCSC_ID, "name": "University of California Santa Cruz"},
+        "teacherRatingTags": [
+            {"tagName": "Clear grading criteria", "tagCount": 3},
+            {"tagName": "Caring", "tagCount": 12},
+            {"tagName": "Tough grader", "tagCount": 7}
+        ]
+    },
+    {
+        "firstName": "New", "lastName": "Lecturer", "avgRating": 0, "avgDifficulty": 2.25,
+        "wouldTakeAgainPercent": -1, "school": {"id": UCSC_ID, "name": "University of California Santa Cruz"},
+        "teacherRatingTags": None
+    },
+    {
+        "firstName": "Pat", "lastName": "Smith", "avgRating": 4.0, "avgDifficulty": None,
+        "wouldTakeAgainPercent": None, "school": {"id": UCSC_ID, "name": "University of California Santa Cruz"},
+        "teacherRatingTags": []
+    },
+]
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    requests_seen = []
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        FixtureHandler.requests_seen.append((dict(self.headers), body))
+        if self.path == "/broken":
+            self.send_response(500)
+            self.end_headers()
+            return
+        # Like RMP: filtered by name and optional school, first 20 results only.
+        text = body["variables"]["text"].lower()
+        school_id = body["variables"].get("schoolID")
+        edges = [{"node": t} for t in TEACHERS if text in f"{t['firstName']} {t['lastName']}".lower()
+                 and school_id in (None, t["school"]["id"])][:20]
+        payload = json.dumps({"data": {"newSearch": {"teachers": {"edges": edges}}}}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class HttpProfessorLookupTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = HTTPServer(("127.0.0.1", 0), FixtureHandler)
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_port}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        FixtureHandler.requests_seen.clear()
+        self.lookup = HttpProfessorLookup(url=f"{self.base_url}/graphql")
+
+    def test_match_returns_the_rmp_dict(self):
+        info = self.lookup("Patrick Tantalo")
+        self.assertEqual(info, {
+            "name": "Patrick Tantalo",
+            "university": "University of California Santa Cruz",
+            "rating": "4.5",
+            "difficulty": "3",
+            "take_again": "88%",
+            "tags": ["Caring", "Tough grader", "Clear grading criteria"],
+        })
+
+    def test_request_carries_query_and_credentials(self):
+        self.lookup("patrick tantalo")
+        headers, body = FixtureHandler.requests_seen[0]
+        self.assertEqual(body["variables"], {"text": "patrick tantalo", "schoolID": UCSC_ID})
+        self.assertIn("TeacherSearchQuery", body["query"])
+        self.assertTrue(headers["Authorization"].startswith("Basic "))
+
+    def test_common_name_is_searched_within_the_school(self):
+        info = self.lookup("Pat Smith")
+        self.assertEqual(info["university"], "University of California Santa Cruz")
+        self.assertEqual(info["rating"], "4")
+        # Unscoped, the namesakes elsewhere fill the first page.
+        self.assertIsNone(HttpProfessorLookup(url=f"{self.base_url}/graphql", school_ids={})("Pat Smith"))
+
+    def test_unanswered_take_again_and_missing_tags(self):
+        info = self.lookup("New Lecturer")
+        self.assertEqual(info["take_again"], "N/A")
+        self.assertEqual(info["rating"], "0")
+        self.assertEqual(info["difficulty"], "2.25")
+        self.assertEqual(info["tags"], [])
+        self.assertEqual(self.lookup("Pat Smith")["difficulty"], "N/A")
+
+    def test_school_filter(self):
+        self.assertIsNone(self.lookup("Patrick Tantalo", university="Stanford University"))
+        info = self.lookup("Patrick Tantalo", university="San Jose State")
+        self.assertEqual(info["rating"], "2")
+
+    def test_no_match_is_none(self):
+        self.assertIsNone(self.lookup("Nobody Here"))
+
+    def test_errors_are_raised_not_reported_as_misses(self):
+        broken = HttpProfessorLookup(url=f"{self.base_url}/broken")
+        with self.assertRaises(Exception):
+            broken("Patrick Tantalo")
+
+
+if __name__ == "__main__":
+    unittest.main()
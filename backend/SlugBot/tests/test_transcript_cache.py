@@ -0,0 +1,85 @@
+# --- Tests: Parsed Transcript Cache --- #
+#
+#   python -m unittest discover -s backend/SlugBot/tests
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from transcript_cache import TranscriptCache
+
+
+def record(n):
+    # Distinct, poorly compressible payloads of roughly the same size.
+    return {"name": f"Student {n}", "courses": [f"{n * 7919 + i:08x}" for i in range(200)]}
+
+
+def entry_sizes(cache):
+    return [entry.stat().st_size for entry in os.scandir(cache.cache_dir) if entry.name.endswith(".json.z")]
+
+
+class TranscriptCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root, ignore_errors=True)
+
+    def make(self, **kwargs):
+        return TranscriptCache(version=1, cache_dir=self.root, **kwargs)
+
+    def test_round_trip(self):
+        cache = self.make()
+        key = cache.key_for(b"%PDF-1.7 fake")
+        self.assertIsNone(cache.get(key))
+        cache.put(key, record(1))
+        self.assertEqual(cache.get(key), record(1))
+
+    def test_size_stays_bounded_and_keeps_recent_entries(self):
+        probe = self.make()
+        probe.put("probe", record(0))
+        entry_size = entry_sizes(probe)[0]
+        probe.clear()
+
+        cache = self.make(max_bytes=entry_size * 20)
+        for n in range(200):
+            cache.put(f"k{n}", record(n))
+            self.assertLessEqual(sum(entry_sizes(cache)), cache.max_bytes + entry_size)
+        self.assertEqual(cache.get("k199"), record(199))
+        self.assertIsNone(cache.get("k0"))
+
+    def test_writes_do_not_rescan_every_time(self):
+        cache = self.make(max_bytes=10 * 1024 * 1024)
+        with mock.patch("transcript_cache.os.scandir", wraps=os.scandir) as scandir:
+            for n in range(50):
+                cache.put(f"k{n}", record(n))
+        self.assertEqual(scandir.call_count, 0)
+
+    def test_writes_from_other_processes_are_picked_up(self):
+        cache = self.make(max_bytes=200_000)
+        other = self.make(max_bytes=200_000)
+        for n in range(100):
+            other.put(f"other{n}", record(n))
+        for n in range(100):
+            cache.put(f"k{n}", record(1000 + n))
+        self.assertLessEqual(sum(entry_sizes(cache)), 2 * cache.max_bytes)
+
+    def test_entry_evicted_between_read_and_touch(self):
+        cache = self.make()
+        cache.put("k", record(1))
+        with mock.patch("transcript_cache.os.utime", side_effect=FileNotFoundError):
+            self.assertEqual(cache.get("k"), record(1))
+
+    def test_namespaces_are_separate(self):
+        first = self.make(namespace="2024-aaaa")
+        second = self.make(namespace="2025-bbbb")
+        first.put("k", record(1))
+        self.assertIsNone(second.get("k"))
+        self.assertEqual(first.get("k"), record(1))
+
+
+if __name__ == "__main__":
+    unittest.main()
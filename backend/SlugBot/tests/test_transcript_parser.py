@@ -0,0 +1,120 @@
+# --- Tests: Transcript Parser --- #
+#
+# The single-pass TranscriptParser must give the same User as the original
+# regex-based parse_user (kept below as legacy_parse) on every transcript shape
+# we have seen, including the awkward ones.
+#
+#   python -m unittest discover -s backend/SlugBot/tests
+
+import contextlib
+import glob
+import importlib.util
+import io
+import os
+import re
+import sys
+import unittest
+
+SLUGBOT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, SLUGBOT_DIR)
+
+from creatingState import Course, TranscriptParser, User, allowed_courses
+
+
+def legacy_parse(text):
+    name_match = re.search(r"Name:\s*(.+)", text)
+    user = User(name=name_match.group(1).strip() if name_match else "Unknown")
+    current_quarter = None
+    quarter_pattern = re.compile(r'^(\d{4}\s+(Summer|Fall|Winter|Spring)\s+Quarter)')
+    course_pattern = re.compile(
+        r'^([A-Z]+\s*\d+[A-Z]*)\s+[\w:,&\-/]+(?:\s+[\w:,&\-/]+)*\s+([\d]+\.[\d]+)\s+([\d]+\.[\d]+)\s+[A-F][+-]?\s+[\d]+\.[\d]+'
+    )
+    for line in text.splitlines():
+        line = line.strip()
+        q_match = quarter_pattern.match(line)
+        if q_match:
+            current_quarter = q_match.group(0)
+            continue
+        c_match = course_pattern.match(line)
+        if c_match and current_quarter and c_match.group(1) in allowed_courses:
+            user.add_course(Course(code=c_match.group(1), quarter=current_quarter, credits=float(c_match.group(2))))
+    cum_matches = re.findall(r'Cum GPA\s+([\d.]+).*?Cum Totals\s+([\d.]+)', text, flags=re.DOTALL)
+    if cum_matches:
+        user.gpa, user.credits_taken = (float(value) for value in cum_matches[-1])
+    return user
+
+
+def parse(text):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return TranscriptParser(text=text).parse_user()
+
+
+def summary(user):
+    return (user.name, user.gpa, user.credits_taken,
+            [(course.code, course.quarter, course.credits) for course in user.classes_taken])
+
+
+QUARTER = """2023 Fall Quarter
+Course Description Attempted Earned Grade Points
+CSE 20 Beginning Programming in Python 5.00 5.00 A 20.000
+MATH 19A Calculus for Science, Engineering & Math 5.00 5.00 B+ 16.500
+HIS 10 Not A Degree Course 5.00 5.00 A 20.000
+CSE 12 Computer Systems/Assembly Language 7.00 7.00 A- 25.900
+Term GPA 3.80 Term Totals 22.00 22.00
+"""
+
+FIXTURES = {
+    "standard": "Unofficial Transcript\nName: Sammy Slug\nStudent ID: 1234567\n\n" + QUARTER
+                + "Cum GPA 3.80\nCum Totals 22.00 22.00\n"
+                + QUARTER.replace("2023 Fall", "2024 Winter").replace("CSE 20", "CSE 30")
+                + "Cum GPA 3.75\nCum Totals 44.00 44.00\n",
+    "name_then_blank_line": "Name:\n\n  Sammy Slug  \n" + QUARTER + "Cum GPA 3.80\nCum Totals 22.00 22.00\n",
+    "no_name": QUARTER + "Cum GPA 3.80\nCum Totals 22.00 22.00\n",
+    "cum_values_on_next_line": "Name: Sammy Slug\n" + QUARTER + "Cum GPA\n3.80\nCum Totals\n22.00 22.00\n",
+    "cum_gpa_and_totals_far_apart": "Name: Sammy Slug\n" + QUARTER
+                                    + "Cum GPA 3.80\nTerm GPA 3.80\nPage 2 of 2\nCum Totals 22.00 22.00\n",
+    "cum_on_one_line": "Name: Sammy Slug\n" + QUARTER + "Cum GPA 3.80 Cum Totals 22.00 22.00\n",
+    "cum_gpa_without_totals": "Name: Sammy Slug\n" + QUARTER + "Cum GPA 3.80\n" + QUARTER + "Cum GPA 3.70\n",
+    "course_before_any_quarter": "Name: Sammy Slug\nCSE 20 Beginning Programming 5.00 5.00 A 20.000\n" + QUARTER,
+    "indented_lines": "\n".join("   " + line for line in ("Name: Sammy Slug\n" + QUARTER).splitlines()),
+    "empty": "",
+}
+
+
+class TranscriptParserTest(unittest.TestCase):
+    def test_matches_legacy_parser_on_fixtures(self):
+        for label, text in FIXTURES.items():
+            with self.subTest(label):
+                self.assertEqual(summary(parse(text)), summary(legacy_parse(text)))
+
+    def test_name_after_blank_line(self):
+        self.assertEqual(parse(FIXTURES["name_then_blank_line"]).name, "Sammy Slug")
+
+    def test_split_cumulative_totals(self):
+        user = parse(FIXTURES["cum_values_on_next_line"])
+        self.assertEqual((user.gpa, user.credits_taken), (3.8, 22.0))
+        user = parse(FIXTURES["cum_gpa_and_totals_far_apart"])
+        self.assertEqual((user.gpa, user.credits_taken), (3.8, 22.0))
+
+    def test_courses_and_quarters(self):
+        user = parse(FIXTURES["standard"])
+        self.assertEqual(user.name, "Sammy Slug")
+        self.assertEqual((user.gpa, user.credits_taken), (3.75, 44.0))
+        self.assertEqual(summary(user)[3][:3], [
+            ("CSE 20", "2023 Fall Quarter", 5.0),
+            ("MATH 19A", "2023 Fall Quarter", 5.0),
+            ("CSE 12", "2023 Fall Quarter", 7.0),
+        ])
+
+    @unittest.skipUnless(importlib.util.find_spec("pypdf") and importlib.util.find_spec("cryptography"),
+                         "the sample transcripts need pypdf with cryptography")
+    def test_matches_legacy_parser_on_sample_pdfs(self):
+        from pdf_text import extract_text
+        for path in sorted(glob.glob(os.path.join(SLUGBOT_DIR, "Transcripts", "*.pdf"))):
+            with self.subTest(os.path.basename(path)):
+                text = extract_text(path, max_workers=1)
+                self.assertEqual(summary(parse(text)), summary(legacy_parse(text)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+# --- Parsed Transcript Cache ------------ #
+#
+# Parsed transcripts are stored under the SHA-256 of the PDF bytes, so uploading
+# the same PDF again skips both PDF extraction and parsing. Entries live in a
+# directory per parser version; bumping the version invalidates all of them.
+# Within a version, `namespace` keeps apart parses that depend on other inputs
+# (creatingState uses the catalog the courses were filtered against).
+
+import hashlib
+import json
+import os
+import shutil
+import zlib
+
+DEFAULT_CACHE_DIR = os.getenv("TRANSCRIPT_CACHE_DIR", ".transcript_cache")
+DEFAULT_MAX_BYTES = int(os.getenv("TRANSCRIPT_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+
+
+class TranscriptCache:
+    """
+    Size-bounded, content-addressed store of parsed transcripts. Values are plain
+    dicts (see User.to_dict), written as zlib-compressed compact JSON. When the
+    total size exceeds `max_bytes` the least recently used entries are evicted,
+    down to LOW_WATER of it.
+
+    Writes don't rescan the directory: a running total (from one scan at startup
+    plus this process's writes) triggers the scan once it passes `max_bytes`.
+    Other processes write to the same directory, so a scan also runs after every
+    `max_bytes // RESCAN_FRACTION` bytes written here.
+    """
+    LOW_WATER = 0.9
+    RESCAN_FRACTION = 8
+
+    def __init__(self, version, cache_dir=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES, namespace=None):
+        self.root = cache_dir
+        self.max_bytes = max_bytes
+        self.version_dir = os.path.join(cache_dir, f"v{version}")
+        self.cache_dir = os.path.join(self.version_dir, namespace) if namespace else self.version_dir
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._drop_other_versions()
+        self._total = 0
+        self._written = 0
+        self._evict()
+
+    # Entries written by other parser versions can never be served again. Other
+    # namespaces of this version are left alone: they may be in use elsewhere.
+    def _drop_other_versions(self):
+        current = os.path.basename(self.version_dir)
+        for name in os.listdir(self.root):
+            path = os.path.join(self.root, name)
+            if name != current and name.startswith("v") and os.path.isdir(path):
+                shutil.rmtree(path, ignore_errors=True)
+
+    @staticmethod
+    def key_for(pdf_bytes):
+        return hashlib.sha256(pdf_bytes).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.json.z")
+
+    def get(self, key):
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                data = json.loads(zlib.decompress(f.read()))
+        except (OSError, ValueError, zlib.error):
+            return None
+        # Reads refresh the mtime, which is what eviction orders by. Another
+        # process may have evicted the file since; the data read is still good.
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return data
+
+    def put(self, key, data):
+        payload = zlib.compress(json.dumps(data, separators=(",", ":")).encode("utf-8"))
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+        self._total += len(payload)
+        self._written += len(payload)
+        if self._total > self.max_bytes or self._written > self.max_bytes // self.RESCAN_FRACTION:
+            self._evict()
+
+    # Scans the directory, evicts least recently used entries when over max_bytes
+    # and resets the running total to what is left.
+    def _evict(self):
+        entries = []
+        total = 0
+        for entry in os.scandir(self.cache_dir):
+            if entry.is_file() and entry.name.endswith(".json.z"):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+        if total > self.max_bytes:
+            target = int(self.max_bytes * self.LOW_WATER)
+            for _, size, path in sorted(entries):
+                if total <= target:
+                    break
+                try:
+                    os.remove(path)
+                    total -= size
+                except OSError:
+                    pass
+        self._total = total
+        self._written = 0
+
+    def clear(self):
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._total = 0
+        self._written = 0
@@ -0,0 +1,70 @@
+# --- Negative Cache For RMP Lookups ----- #
+
+import json
+import os
+import re
+import threading
+import time
+
+DEFAULT_PATH = os.getenv("RMP_NEGATIVE_CACHE", "rmp_negative_cache.json")
+# Misses expire sooner than positive results: a professor may get an RMP page mid-quarter.
+DEFAULT_TTL = int(os.getenv("RMP_NEGATIVE_TTL", str(60 * 60 * 24 * 3)))
+
+
+# "Patrick  Tantalo (ptantalo)" -> "patrick tantalo"
+def normalize_name(name):
+    name = re.sub(r'\s*\(.*?\)', '', name)
+    return " ".join(name.lower().split())
+
+
+def is_staff(name):
+    return normalize_name(name) == "staff"
+
+
+class NegativeCache:
+    """
+    Remembers (name, university) pairs that RMP had no match for, persisted as a
+    small JSON file so later runs skip the browser/HTTP lookup (and its timeout).
+    Entries older than `ttl` seconds are ignored and dropped on the next save.
+    """
+    def __init__(self, path=DEFAULT_PATH, ttl=DEFAULT_TTL):
+        self.path = path
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries = self._load()
+
+    @staticmethod
+    def _key(name, university):
+        return f"{normalize_name(name)}|{university.lower().strip()}"
+
+    def _load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def contains(self, name, university):
+        with self._lock:
+            missed_at = self._entries.get(self._key(name, university))
+        return missed_at is not None and time.time() - missed_at < self.ttl
+
+    def add(self, name, university):
+        with self._lock:
+            self._entries[self._key(name, university)] = time.time()
+
+    def discard(self, name, university):
+        with self._lock:
+            self._entries.pop(self._key(name, university), None)
+
+    def save(self):
+        now = time.time()
+        with self._lock:
+            self._entries = {key: missed_at for key, missed_at in self._entries.items()
+                             if now - missed_at < self.ttl}
+            entries = dict(self._entries)
+        # Write to a temp file first so a crash never leaves half a JSON file behind.
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(entries, f)
+        os.replace(tmp_path, self.path)
@@ -1,36 +1,48 @@
 # --- WebScraper For RMP ----------------- #
 # --- By: Kyle Delmo --------------------- #
 
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
-import time
+from .driver_pool import get_driver_pool, is_driver_crash
+
+# Search result cards, and the notice RMP shows instead of them when nothing matches.
+PROFESSOR_CARD = "a[href*='/professor/']"
+NO_RESULTS = "div[class*='NoResultsFoundArea']"
 
 # Gets the information of a professor from the given university.
-def get_professor_info(name, university="University of California Santa Cruz"):
-    # Setup Chrome options
-    options = Options()
-    options.add_argument("--headless")  # run in background
-    options.add_argument("--disable-gpu")
-    options.add_argument("--no-sandbox")
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
+# Returns None only when RMP has no matching professor; errors (network, browser,
+# page changes) are raised so callers don't record them as misses.
+# Browsers are leased from a shared pool of warm headless Chrome instances instead
+# of being launched per lookup; pass `pool` to use a specific DriverPool.
+def get_professor_info(name, university="University of California Santa Cruz", pool=None):
+    if pool is None:
+        pool = get_driver_pool()
+
+    with pool.lease() as session:
+        return _scrape_professor(session, name, university)
+
+def _scrape_professor(session, name, university):
+    driver = session.driver
 
     # Formatted search url given the name of the professor (has to be exact).
     search_url = f"https://www.ratemyprofessors.com/search/professors?q={name.replace(' ', '%20')}"
-    driver.get(search_url)
+    session.get(search_url)
 
-    try:
-        # Wait until the resulting list of professors load.
-        # 3 SECOND DELAY; INITIALLY 10 SECONDS; CHANGE AT YOUR OWN RISK.
-        WebDriverWait(driver, 3).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, "a[href*='/professor/']"))
-        )
+    # Wait until the resulting list of professors, or RMP's "no results" notice, loads.
+    # 3 SECOND DELAY; INITIALLY 10 SECONDS; CHANGE AT YOUR OWN RISK.
+    # A timeout means the page is slow or has changed, not that there is no match, so
+    # the TimeoutException is raised like any other error instead of returning None.
+    WebDriverWait(driver, 3).until(
+        EC.presence_of_element_located((By.CSS_SELECTOR, f"{PROFESSOR_CARD}, {NO_RESULTS}"))
+    )
+    if not driver.find_elements(By.CSS_SELECTOR, PROFESSOR_CARD):
+        # RMP explicitly reports that the search has no results.
+        print(f"No matching professor found for {name} at {university}")
+        return None
 
-        cards = driver.find_elements(By.CSS_SELECTOR, "a[href*='/professor/']")
+    try:
+        cards = driver.find_elements(By.CSS_SELECTOR, PROFESSOR_CARD)
         prof_url = None
         prof_name = None
         school = None
@@ -50,12 +62,11 @@ def get_professor_info(name, university="University of California Santa Cruz"):
 
         if prof_url is None:
             print(f"No matching professor found for {name} at {university}")
-            driver.quit()
             return None
 
         # Go to the professor's page.
         # 3 SECOND DELAY; INITIALLY 10; CHANGE AT YOUR OWN RISK.
-        driver.get(prof_url)
+        session.get(prof_url)
         WebDriverWait(driver, 3).until(
             EC.presence_of_element_located((By.CSS_SELECTOR, "div.RatingValue__Numerator-qw8sqy-2"))
         )
@@ -89,7 +100,6 @@ def get_professor_info(name, university="University of California Santa Cruz"):
         print(f"Tags: {tags}")
         # ----------------------------------------------- #
 
-        driver.quit()
         return {
             "name": prof_name,
             "university": school,
@@ -101,8 +111,10 @@ def get_professor_info(name, university="University of California Santa Cruz"):
 
     except Exception as e:
         print(f"Error: {e}")
-        driver.quit()
-        return None
+        # A crashed browser is recycled instead of going back into the pool.
+        if is_driver_crash(e):
+            session.discard()
+        raise
 
 # # Testing.
 # professor = "Patrick Tantalo"
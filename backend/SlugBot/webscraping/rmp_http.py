@@ -0,0 +1,121 @@
+# --- HTTP Client For RMP ---------------- #
+
+import os
+import threading
+
+import requests
+
+# The public site talks to this GraphQL endpoint; point RMP_GRAPHQL_URL at a local
+# fixture server to exercise the client without hitting RateMyProfessors.
+DEFAULT_GRAPHQL_URL = os.getenv("RMP_GRAPHQL_URL", "https://www.ratemyprofessors.com/graphql")
+
+# Same anonymous credentials the RMP web client sends.
+AUTH_HEADER = "Basic dGVzdDp0ZXN0"
+
+# RMP school IDs (base64 of "School-<legacy id>"). Searches are scoped to the school
+# when it is listed here, so a common name doesn't push its match out of the first
+# page of nationwide results; other universities fall back to a name-only search.
+SCHOOL_IDS = {
+    "university of california santa cruz": "U2Nob29sLTEwNzg=",
+}
+
+# Shown (and stored on Professor, whose columns are not nullable) when RMP has no value.
+NOT_AVAILABLE = "N/A"
+
+TEACHER_SEARCH_QUERY = """
+query TeacherSearchQuery($text: String!, $schoolID: ID) {
+  newSearch {
+    teachers(query: {text: $text, schoolID: $schoolID}, first: 20) {
+      edges {
+        node {
+          firstName
+          lastName
+          avgRating
+          avgDifficulty
+          wouldTakeAgainPercent
+          school { name }
+          teacherRatingTags { tagName tagCount }
+        }
+      }
+    }
+  }
+}
+"""
+
+
+def _format_number(value):
+    if value is None:
+        return NOT_AVAILABLE
+    return format(value, "g")
+
+
+def _format_percent(value):
+    # RMP reports -1 when nobody has answered "Would take again".
+    if value is None or value < 0:
+        return NOT_AVAILABLE
+    return f"{round(value)}%"
+
+
+class HttpProfessorLookup:
+    """
+    Looks professors up through RMP's GraphQL API over one keep-alive
+    requests.Session. Returns the same dict as webscraping.rmp.get_professor_info,
+    or None when no teacher at `university` has exactly the given name. Request
+    and response errors are raised, so callers never mistake them for a miss.
+    """
+    def __init__(self, url=DEFAULT_GRAPHQL_URL, session=None, timeout=10, school_ids=None):
+        self.url = url
+        self.timeout = timeout
+        self.school_ids = SCHOOL_IDS if school_ids is None else school_ids
+        self.session = session or requests.Session()
+        self.session.headers.update({
+            "Authorization": AUTH_HEADER,
+            "Content-Type": "application/json",
+            "User-Agent": "Mozilla/5.0",
+        })
+
+    def search(self, name, school_id=None):
+        variables = {"text": name}
+        if school_id is not None:
+            variables["schoolID"] = school_id
+        payload = {"query": TEACHER_SEARCH_QUERY, "variables": variables}
+        response = self.session.post(self.url, json=payload, timeout=self.timeout)
+        response.raise_for_status()
+        edges = response.json()["data"]["newSearch"]["teachers"]["edges"]
+        return [edge["node"] for edge in edges]
+
+    def __call__(self, name, university="University of California Santa Cruz"):
+        teachers = self.search(name, self.school_ids.get(university.lower().strip()))
+        for teacher in teachers:
+            prof_name = f"{teacher.get('firstName', '')} {teacher.get('lastName', '')}".strip()
+            school = (teacher.get("school") or {}).get("name", "")
+            if name.lower() == prof_name.lower() and university.lower() in school.lower():
+                print(f"Found match: {prof_name} at {school}")
+                rating_tags = sorted(teacher.get("teacherRatingTags") or [],
+                                     key=lambda tag: tag.get("tagCount", 0), reverse=True)
+                return {
+                    "name": prof_name,
+                    "university": school,
+                    "rating": _format_number(teacher.get("avgRating")),
+                    "difficulty": _format_number(teacher.get("avgDifficulty")),
+                    "take_again": _format_percent(teacher.get("wouldTakeAgainPercent")),
+                    "tags": [tag["tagName"] for tag in rating_tags]
+                }
+
+        print(f"No matching professor found for {name} at {university}")
+        return None
+
+
+_default_lookup = None
+_default_lookup_lock = threading.Lock()
+
+
+# Module-level entry point with the same signature as rmp.get_professor_info.
+# Scrapers call it from several threads, so the shared lookup is created under a lock.
+def get_professor_info(name, university="University of California Santa Cruz"):
+    global _default_lookup
+    with _default_lookup_lock:
+        if _default_lookup is None:
+            _default_lookup = HttpProfessorLookup()
+        lookup = _default_lookup
+    return lookup(name, university)
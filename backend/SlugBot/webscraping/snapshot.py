@@ -0,0 +1,95 @@
+# --- Incremental Snapshot Refresh ------- #
+#
+# A scrape's output file (courses_YEAR_QUARTER.json, classes.json) is treated as a
+# snapshot. Refreshing it diffs the new records against it, keyed by course and
+# section, appends only the differences to an NDJSON delta log next to it, and
+# rewrites the snapshot in place only when something actually changed.
+
+import json
+import os
+import time
+
+
+# courses_YEAR_QUARTER.json records -> {"<course>|<section>": "<instructor>"}
+def schedule_sections(records):
+    sections = {}
+    for entry in records:
+        for section, instructor in entry["sections"].items():
+            sections[f"{entry['course']}|{section}"] = instructor
+    return sections
+
+
+# classes.json records -> {"<title>": record}; the title carries course and section,
+# e.g. "CSE 12 - 01   Computer Systems and Assembly Language".
+def class_sections(records):
+    return {record["title"]: record for record in records}
+
+
+# Returns the delta between two flattened snapshots as a list of entries:
+# {"op": "added"|"removed"|"changed", "key": ..., "before": ..., "after": ...}
+def diff_snapshots(old, new):
+    delta = []
+    for key, after in new.items():
+        if key not in old:
+            delta.append({"op": "added", "key": key, "after": after})
+        elif old[key] != after:
+            entry = {"op": "changed", "key": key, "before": old[key], "after": after}
+            if isinstance(after, dict) and isinstance(old[key], dict):
+                entry["fields"] = sorted(field for field in set(old[key]) | set(after)
+                                         if old[key].get(field) != after.get(field))
+            delta.append(entry)
+    for key, before in old.items():
+        if key not in new:
+            delta.append({"op": "removed", "key": key, "before": before})
+    return delta
+
+
+# "courses_2025_Fall25.json" -> "courses_2025_Fall25.delta.ndjson"
+def delta_path_for(snapshot_path):
+    root, _ = os.path.splitext(snapshot_path)
+    return f"{root}.delta.ndjson"
+
+
+def _load_snapshot(snapshot_path):
+    try:
+        with open(snapshot_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return []
+
+
+# Diffs `records` against the snapshot at `snapshot_path` using `flatten` to key
+# them, appends the differences to the delta log and updates the snapshot.
+# Returns the list of delta entries (empty when nothing changed).
+def refresh_snapshot(records, snapshot_path, flatten, delta_path=None):
+    delta_path = delta_path or delta_path_for(snapshot_path)
+    existed = os.path.exists(snapshot_path)
+    delta = diff_snapshots(flatten(_load_snapshot(snapshot_path)), flatten(records))
+
+    if delta:
+        refreshed_at = time.time()
+        with open(delta_path, "a", encoding="utf-8") as f:
+            for entry in delta:
+                f.write(json.dumps(dict(entry, at=refreshed_at)) + "\n")
+
+    if delta or not existed:
+        tmp_path = f"{snapshot_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(records, f, indent=2)
+        os.replace(tmp_path, snapshot_path)
+    return delta
+
+
+# Yields delta entries logged after `since` (a time.time() timestamp), oldest first.
+def read_deltas(delta_path, since=None):
+    try:
+        f = open(delta_path, "r", encoding="utf-8")
+    except OSError:
+        return
+    with f:
+        for line in f:
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            if since is None or entry["at"] > since:
+                yield entry
@@ -1,6 +1,8 @@
 from django.contrib import admin
 
 # Register your models here.
-from .models import UploadedPDF
+from .models import UploadedPDF, StudentRecord, TranscriptCourse
 
-admin.site.register(UploadedPDF)
\ No newline at end of file
+admin.site.register(UploadedPDF)
+admin.site.register(StudentRecord)
+admin.site.register(TranscriptCourse)
\ No newline at end of file
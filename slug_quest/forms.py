@@ -1,5 +1,12 @@
 # forms.py
 from django import forms
 
+from .uploads import validate_transcript_upload
+
 class PDFUploadForm(forms.Form):
     file = forms.FileField()
+
+    def clean_file(self):
+        uploaded_file = self.cleaned_data["file"]
+        validate_transcript_upload(uploaded_file)
+        return uploaded_file
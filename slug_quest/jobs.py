@@ -0,0 +1,155 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+
+from .models import StudentRecord, TranscriptCourse, TranscriptJob
+from .pdf_text import PdfBudgetError, extract_text
+from .slugbot import load_slugbot
+from .uploads import mapped_file, transcript_budget
+
+logger = logging.getLogger(__name__)
+
+# Transcript jobs run here, off the request thread. The TranscriptJob row is the
+# durable record: status and result live in the database, so any request (or
+# another process sharing the SQLite file) can poll it.
+_job_executor = ThreadPoolExecutor(
+    max_workers=getattr(settings, "TRANSCRIPT_JOB_WORKERS", 2), thread_name_prefix="transcript-job"
+)
+
+_resume_lock = threading.Lock()
+_resumed = False
+
+_transcript_cache = None
+_transcript_cache_lock = threading.Lock()
+
+# Jobs still queued when a previous process exited are picked up by the first
+# enqueue in this one. Workers claim rows atomically, so a job submitted twice
+# still runs once.
+def _resume_queued_jobs():
+    global _resumed
+    with _resume_lock:
+        if _resumed:
+            return
+        _resumed = True
+    for job_id in TranscriptJob.objects.filter(status=TranscriptJob.QUEUED).values_list("pk", flat=True):
+        _job_executor.submit(run_transcript_job, job_id)
+
+# `pdf_bytes` is the upload's content when it is still in memory; otherwise the
+# job reads the stored file through an mmap.
+def enqueue_transcript_job(upload, pdf_bytes=None):
+    _resume_queued_jobs()
+    job = TranscriptJob.objects.create(upload=upload)
+    # Only hand the job to a worker once the row is visible to other connections.
+    transaction.on_commit(lambda: _job_executor.submit(run_transcript_job, job.pk, pdf_bytes))
+    return job
+
+def _set_status(job_id, status, **fields):
+    # update() skips auto_now, so bump updated_at by hand.
+    TranscriptJob.objects.filter(pk=job_id).update(status=status, updated_at=timezone.now(), **fields)
+
+# Stores the extracted text and the parsed user on the upload, replacing any
+# earlier parse of the same upload.
+def save_student_record(upload, text, user):
+    with transaction.atomic():
+        upload.extracted_text = text
+        upload.save(update_fields=["extracted_text"])
+        record, _ = StudentRecord.objects.update_or_create(
+            upload=upload,
+            defaults={"name": user.name, "gpa": user.gpa, "credits_taken": user.credits_taken}
+        )
+        record.courses.all().delete()
+        TranscriptCourse.objects.bulk_create([
+            TranscriptCourse(record=record, code=course.code, quarter=course.quarter, credits=course.credits)
+            for course in user.classes_taken
+        ])
+    return record
+
+# Rebuilds the SlugBot User for an upload from its stored rows, or None if the
+# upload hasn't been parsed yet.
+def load_student_user(upload):
+    record = StudentRecord.objects.filter(upload=upload).first()
+    if record is None:
+        return None
+    return load_slugbot().User.from_dict(record.to_dict())
+
+# One content-addressed TranscriptCache per process, shared by the job workers.
+def _get_transcript_cache(slugbot):
+    global _transcript_cache
+    with _transcript_cache_lock:
+        if _transcript_cache is None:
+            _transcript_cache = slugbot.open_transcript_cache()
+        return _transcript_cache
+
+# Extraction stays in this worker thread (no process pool copies of the PDF)
+# and stops once the page or text budget is exceeded.
+def _extract_upload_text(pdf_buffer):
+    budget = transcript_budget()
+    return extract_text(pdf_buffer, max_workers=1, max_pages=budget["max_pages"], max_chars=budget["max_chars"])
+
+# Text stored for an earlier upload of the same PDF, used when the parse came from the cache.
+def _earlier_text(content_key, job_id):
+    earlier = (TranscriptJob.objects.filter(content_key=content_key, status=TranscriptJob.DONE)
+               .exclude(pk=job_id).select_related("upload").order_by("-pk").first())
+    return earlier.upload.extracted_text if earlier else ""
+
+# Parses through slugbot.parse_transcript_bytes, so re-uploads of a PDF skip
+# extraction and parsing. The job is keyed on the PDF's content hash.
+def _parse_upload(slugbot, job, pdf_bytes):
+    cache = _get_transcript_cache(slugbot)
+    if pdf_bytes is not None:
+        return _parse_buffer(slugbot, cache, job, pdf_bytes)
+    with mapped_file(job.upload.file.path) as buffer:
+        return _parse_buffer(slugbot, cache, job, buffer)
+
+def _parse_buffer(slugbot, cache, job, pdf_buffer):
+    content_key = cache.key_for(pdf_buffer)
+    TranscriptJob.objects.filter(pk=job.pk).update(content_key=content_key)
+    user, text = slugbot.parse_transcript_bytes(pdf_buffer, cache, _extract_upload_text, key=content_key)
+    if text is None:
+        text = _earlier_text(content_key, job.pk)
+    return user, text
+
+def run_transcript_job(job_id, pdf_bytes=None):
+    try:
+        # Claim the row; if another worker got there first, leave it alone.
+        claimed = TranscriptJob.objects.filter(pk=job_id, status=TranscriptJob.QUEUED).update(
+            status=TranscriptJob.RUNNING, updated_at=timezone.now()
+        )
+        if not claimed:
+            return
+        job = TranscriptJob.objects.select_related("upload").get(pk=job_id)
+
+        slugbot = load_slugbot()
+        user, text = _parse_upload(slugbot, job, pdf_bytes)
+        save_student_record(job.upload, text, user)
+        result = {
+            "user": {
+                "name": user.name,
+                "gpa": user.gpa,
+                "credits_taken": user.credits_taken,
+                "courses_taken": [str(course) for course in user.classes_taken]
+            },
+            **slugbot.summarize_curriculum(user)
+        }
+        _set_status(job_id, TranscriptJob.DONE, result=result)
+    except PdfBudgetError as e:
+        _set_status(job_id, TranscriptJob.FAILED, error=str(e))
+    except Exception as e:
+        logger.exception(f"Transcript job {job_id} failed")
+        _set_status(job_id, TranscriptJob.FAILED, error=str(e))
+    finally:
+        # Worker threads get their own DB connection; don't leak it.
+        connection.close()
+
+def job_payload(job):
+    return {
+        "id": job.pk,
+        "status": job.status,
+        "result": job.result,
+        "error": job.error,
+        "updated_at": job.updated_at.isoformat()
+    }
@@ -0,0 +1,18 @@
+# Generated by Django 5.2 on 2026-10-18 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('slug_quest', '0002_professor'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='professor',
+            name='fetched_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2 on 2026-10-18 10:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('slug_quest', '0003_professor_fetched_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProfessorMiss',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name_key', models.CharField(max_length=255)),
+                ('university_key', models.CharField(max_length=255)),
+                ('missed_at', models.DateTimeField()),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('name_key', 'university_key'), name='unique_professor_miss')],
+            },
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.2 on 2026-10-18 11:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('slug_quest', '0005_transcriptjob'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='uploadedpdf',
+            name='extracted_text',
+            field=models.TextField(blank=True),
+        ),
+        migrations.CreateModel(
+            name='StudentRecord',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=255)),
+                ('gpa', models.FloatField(default=0.0)),
+                ('credits_taken', models.FloatField(default=0.0)),
+                ('parsed_at', models.DateTimeField(auto_now=True)),
+                ('upload', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='student', to='slug_quest.uploadedpdf')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='TranscriptCourse',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('code', models.CharField(db_index=True, max_length=20)),
+                ('quarter', models.CharField(db_index=True, max_length=40)),
+                ('credits', models.FloatField()),
+                ('record', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='courses', to='slug_quest.studentrecord')),
+            ],
+            options={
+                'ordering': ['id'],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2 on 2026-10-18 12:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('slug_quest', '0006_uploadedpdf_extracted_text_studentrecord_transcriptcourse'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='transcriptjob',
+            name='content_key',
+            field=models.CharField(blank=True, db_index=True, max_length=64),
+        ),
+    ]
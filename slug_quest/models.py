@@ -4,6 +4,65 @@ from django.db import models
 class UploadedPDF(models.Model):
     file = models.FileField(upload_to='pdfs/')
     uploaded_at = models.DateTimeField(auto_now_add=True)
+    # Filled in by the transcript job so nothing has to reopen the PDF.
+    extracted_text = models.TextField(blank=True)
+
+class StudentRecord(models.Model):
+    # Parsed transcript of one upload; its courses are TranscriptCourse rows.
+    upload = models.OneToOneField(UploadedPDF, on_delete=models.CASCADE, related_name="student")
+    name = models.CharField(max_length=255)
+    gpa = models.FloatField(default=0.0)
+    credits_taken = models.FloatField(default=0.0)
+    parsed_at = models.DateTimeField(auto_now=True)
+
+    def to_dict(self):
+        # Same shape as SlugBot's User.to_dict, so User.from_dict can rebuild the user.
+        quarters = []
+        quarter_index = {}
+        courses = []
+        for course in self.courses.all():
+            if course.quarter not in quarter_index:
+                quarter_index[course.quarter] = len(quarters)
+                quarters.append(course.quarter)
+            courses.append([course.code, quarter_index[course.quarter], course.credits])
+        return {"name": self.name, "gpa": self.gpa, "credits_taken": self.credits_taken,
+                "quarters": quarters, "courses": courses}
+
+    def __str__(self):
+        return f"{self.name} (GPA {self.gpa})"
+
+class TranscriptCourse(models.Model):
+    record = models.ForeignKey(StudentRecord, on_delete=models.CASCADE, related_name="courses")
+    code = models.CharField(max_length=20, db_index=True)
+    quarter = models.CharField(max_length=40, db_index=True)
+    credits = models.FloatField()
+
+    class Meta:
+        # Transcript order (rows are inserted in the order they were parsed).
+        ordering = ["id"]
+
+    def __str__(self):
+        return f"{self.code} ({self.quarter}, {self.credits} credits)"
+
+class TranscriptJob(models.Model):
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+    STATUS_CHOICES = [(QUEUED, "Queued"), (RUNNING, "Running"), (DONE, "Done"), (FAILED, "Failed")]
+
+    upload = models.ForeignKey(UploadedPDF, on_delete=models.CASCADE, related_name="jobs")
+    # SHA-256 of the PDF (TranscriptCache.key_for); set once the job has read the file.
+    content_key = models.CharField(max_length=64, blank=True, db_index=True)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=QUEUED, db_index=True)
+    # Parsed student info plus remaining/eligible courses once the job is done.
+    result = models.JSONField(null=True, blank=True)
+    error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Job {self.pk} ({self.status})"
 
 class Professor(models.Model):
     name = models.CharField(max_length=255)
@@ -12,6 +71,22 @@ class Professor(models.Model):
     difficulty = models.CharField(max_length=10)
     take_again = models.CharField(max_length=10)
     tags = models.JSONField(default=list)
+    # When the row was last scraped; rows older than PROFESSOR_CACHE_TTL are refreshed.
+    fetched_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f"{self.name} ({self.university})"
+
+class ProfessorMiss(models.Model):
+    # Normalized name/university that RMP had no match for, so repeat misses skip the scrape.
+    name_key = models.CharField(max_length=255)
+    university_key = models.CharField(max_length=255)
+    missed_at = models.DateTimeField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["name_key", "university_key"], name="unique_professor_miss")
+        ]
 
     def __str__(self):
-        return f"{self.name} ({self.university})"
\ No newline at end of file
+        return f"{self.name_key} ({self.university_key})"
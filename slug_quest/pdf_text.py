@@ -0,0 +1,88 @@
+# --- PDF Text Extraction ---------------- #
+#
+# Page text extraction is CPU-bound and independent per page, so long PDFs are
+# split into contiguous page ranges and extracted on a process pool.
+
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    from pypdf import PdfReader
+except ImportError:  # the Django app ships with PyPDF2
+    from PyPDF2 import PdfReader
+
+# Below this many pages, starting worker processes costs more than it saves.
+MIN_PAGES_FOR_POOL = 8
+
+
+class PdfBudgetError(ValueError):
+    """Raised when a PDF has more pages or text than the caller allowed."""
+
+
+# `source` can also be an mmap or any seekable binary buffer; it is read in place.
+def _open_reader(source):
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return PdfReader(io.BytesIO(source))
+    return PdfReader(source)
+
+
+def count_pages(source):
+    return len(_open_reader(source).pages)
+
+
+def _check_text_budget(total_chars, max_chars):
+    if max_chars is not None and total_chars > max_chars:
+        raise PdfBudgetError(f"PDF text is longer than {max_chars} characters")
+
+
+# Runs in a worker process: reopens the PDF and extracts pages [start, stop).
+def _extract_range(source, start, stop):
+    reader = _open_reader(source)
+    return [reader.pages[index].extract_text() or "" for index in range(start, stop)]
+
+
+# Returns the text of every page, in page order. `source` is a path, the PDF's
+# bytes, or a binary file object. PDFs with at least `min_pages_for_pool` pages
+# are spread over up to `max_workers` processes (default: one per CPU).
+# `max_pages` and `max_chars` bound the work done for untrusted PDFs; going over
+# either raises PdfBudgetError (in-process extraction stops at the page that did).
+def extract_pages(source, max_workers=None, min_pages_for_pool=MIN_PAGES_FOR_POOL,
+                  max_pages=None, max_chars=None):
+    reader = _open_reader(source)
+    page_count = len(reader.pages)
+    if max_pages is not None and page_count > max_pages:
+        raise PdfBudgetError(f"PDF has {page_count} pages; the limit is {max_pages}")
+
+    workers = min(max_workers or os.cpu_count() or 1, page_count)
+    if workers <= 1 or page_count < min_pages_for_pool:
+        pages = []
+        total_chars = 0
+        for page in reader.pages:
+            text = page.extract_text() or ""
+            total_chars += len(text)
+            _check_text_budget(total_chars, max_chars)
+            pages.append(text)
+        return pages
+
+    # Workers need something picklable they can reopen: a path or the raw bytes.
+    if not isinstance(source, (str, os.PathLike)):
+        if hasattr(source, "read"):
+            source.seek(0)
+            source = source.read()
+        source = bytes(source)
+
+    chunk = -(-page_count // workers)  # ceiling division
+    ranges = [(start, min(start + chunk, page_count)) for start in range(0, page_count, chunk)]
+    pages = []
+    with ProcessPoolExecutor(max_workers=len(ranges)) as executor:
+        futures = [executor.submit(_extract_range, source, start, stop) for start, stop in ranges]
+        for future in futures:
+            pages.extend(future.result())
+            _check_text_budget(sum(map(len, pages)), max_chars)
+    return pages
+
+
+# Whole-document text; a single join instead of growing a string page by page.
+def extract_text(source, **kwargs):
+    return "".join(extract_pages(source, **kwargs))
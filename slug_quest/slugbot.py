@@ -0,0 +1,13 @@
+import sys
+
+from django.conf import settings
+
+# Imports the SlugBot backend's creatingState module (transcript parsing and
+# curriculum logic). SLUGBOT_DIR goes first on sys.path so its `webscraping` and
+# `pdf_text` modules are the ones creatingState picks up.
+def load_slugbot():
+    slugbot_dir = str(settings.SLUGBOT_DIR)
+    if slugbot_dir not in sys.path:
+        sys.path.insert(0, slugbot_dir)
+    import creatingState
+    return creatingState
@@ -1,3 +1,44 @@
 from django.test import TestCase
+from django.utils import timezone
 
-# Create your tests here.
+from .models import Professor
+from .webscraping.rmp_http import HttpProfessorLookup
+
+
+class CannedResponse:
+    def __init__(self, payload):
+        self.payload = payload
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.payload
+
+
+class CannedSession:
+    """Stands in for requests.Session, answering every search with `teachers`."""
+    def __init__(self, teachers):
+        self.headers = {}
+        self.teachers = teachers
+
+    def post(self, url, json=None, timeout=None):
+        edges = [{"node": teacher} for teacher in self.teachers]
+        return CannedResponse({"data": {"newSearch": {"teachers": {"edges": edges}}}})
+
+
+class HttpProfessorStorageTest(TestCase):
+    def test_http_result_with_missing_values_is_stored(self):
+        # RMP sends -1 for an unanswered "would take again" and null ratings for
+        # professors without reviews; the non-null Professor columns must accept both.
+        lookup = HttpProfessorLookup(session=CannedSession([{
+            "firstName": "New", "lastName": "Lecturer", "avgRating": None, "avgDifficulty": None,
+            "wouldTakeAgainPercent": -1, "school": {"name": "University of California Santa Cruz"},
+            "teacherRatingTags": None
+        }]))
+        info = lookup("New Lecturer")
+        Professor.objects.create(**info, fetched_at=timezone.now())
+
+        professor = Professor.objects.get(name="New Lecturer")
+        self.assertEqual((professor.rating, professor.difficulty, professor.take_again), ("N/A", "N/A", "N/A"))
+        self.assertEqual(professor.tags, [])
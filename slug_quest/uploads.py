@@ -0,0 +1,68 @@
+import mmap
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+
+from .pdf_text import count_pages
+
+DEFAULT_MAX_BYTES = 10 * 1024 * 1024
+DEFAULT_MAX_PAGES = 40
+DEFAULT_MAX_TEXT_CHARS = 500_000
+
+def transcript_budget():
+    return {
+        "max_bytes": getattr(settings, "TRANSCRIPT_MAX_BYTES", DEFAULT_MAX_BYTES),
+        "max_pages": getattr(settings, "TRANSCRIPT_MAX_PAGES", DEFAULT_MAX_PAGES),
+        "max_chars": getattr(settings, "TRANSCRIPT_MAX_TEXT_CHARS", DEFAULT_MAX_TEXT_CHARS),
+    }
+
+@contextmanager
+def mapped_file(path):
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        yield buffer
+
+# Yields something the PDF reader can parse without copying the upload: the
+# in-memory upload's own BytesIO, or a read-only mmap of the temporary file
+# Django spooled a large upload to.
+@contextmanager
+def upload_buffer(uploaded_file):
+    if hasattr(uploaded_file, "temporary_file_path"):
+        with mapped_file(uploaded_file.temporary_file_path()) as buffer:
+            yield buffer
+    else:
+        uploaded_file.seek(0)
+        yield getattr(uploaded_file, "file", uploaded_file)
+        uploaded_file.seek(0)
+
+def validate_transcript_upload(uploaded_file):
+    """
+    Checks size, PDF header and page count straight from the upload buffer, so
+    nothing is written to media/ for a file that would be rejected anyway.
+    """
+    budget = transcript_budget()
+    if uploaded_file.size == 0:
+        raise ValidationError("The uploaded file is empty.")
+    if uploaded_file.size > budget["max_bytes"]:
+        raise ValidationError(f"Transcripts must be smaller than {budget['max_bytes'] // (1024 * 1024)} MB.")
+
+    with upload_buffer(uploaded_file) as buffer:
+        if buffer.read(5) != b"%PDF-":
+            raise ValidationError("Please upload your transcript as a PDF.")
+        buffer.seek(0)
+        try:
+            page_count = count_pages(buffer)
+        except Exception:
+            raise ValidationError("That PDF couldn't be read.")
+    if page_count > budget["max_pages"]:
+        raise ValidationError(f"Transcripts can be at most {budget['max_pages']} pages.")
+    return page_count
+
+# Bytes to hand to the transcript job for small uploads that Django kept in
+# memory. Spooled uploads return None: saving one moves the temporary file into
+# media/ instead of copying it, and the job maps the stored file.
+def in_memory_bytes(uploaded_file):
+    if hasattr(uploaded_file, "temporary_file_path"):
+        return None
+    uploaded_file.seek(0)
+    return uploaded_file.read()
@@ -7,5 +7,7 @@ urlpatterns = [
     path("sign-in-callback", views.sign_in_callback, name="sign_in_callback"),
     path("dashboard/", views.dashboard, name="dashboard"),
     path('upload/', views.upload_pdf, name='upload_pdf'),
-    path('main/', views.main, name='main')
+    path('main/', views.main, name='main'),
+    path('jobs/<int:job_id>/', views.job_status, name='job_status'),
+    path('what-if/', views.what_if, name='what_if')
 ]
\ No newline at end of file
@@ -0,0 +1,131 @@
+# --- Headless Chrome Pool For RMP ------- #
+
+import atexit
+import os
+import queue
+import threading
+from contextlib import contextmanager
+
+from selenium import webdriver
+from selenium.common.exceptions import NoSuchElementException, TimeoutException, WebDriverException
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.chrome.options import Options
+from webdriver_manager.chrome import ChromeDriverManager
+
+# Defaults can be overridden through the environment without touching code.
+DEFAULT_POOL_SIZE = int(os.getenv("RMP_POOL_SIZE", "2"))
+DEFAULT_MAX_PAGES = int(os.getenv("RMP_POOL_MAX_PAGES", "50"))
+
+
+# Returns True when the exception means the browser itself is unusable, as opposed
+# to a page that simply did not contain what we were waiting for.
+def is_driver_crash(error):
+    if isinstance(error, (TimeoutException, NoSuchElementException)):
+        return False
+    return isinstance(error, WebDriverException)
+
+
+class PooledDriver:
+    """
+    A leased browser. Navigate through get() so the pool can count pages
+    and recycle the browser once it has served max_pages of them.
+    """
+    def __init__(self, driver):
+        self.driver = driver
+        self.pages = 0
+        self.broken = False
+
+    def get(self, url):
+        self.pages += 1
+        self.driver.get(url)
+
+    def discard(self):
+        self.broken = True
+
+
+class DriverPool:
+    """
+    Keeps up to `size` warm headless Chrome instances alive and leases them out
+    one lookup at a time. Browsers are created lazily, recycled after `max_pages`
+    page loads, and thrown away if a lookup reports them as crashed.
+    """
+    _driver_path = None
+    _driver_path_lock = threading.Lock()
+
+    def __init__(self, size=DEFAULT_POOL_SIZE, max_pages=DEFAULT_MAX_PAGES):
+        self.size = max(1, size)
+        self.max_pages = max_pages
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(self.size)
+        self._closed = False
+
+    # ChromeDriverManager().install() hits the network, so only do it once per process.
+    @classmethod
+    def _get_driver_path(cls):
+        with cls._driver_path_lock:
+            if cls._driver_path is None:
+                cls._driver_path = ChromeDriverManager().install()
+            return cls._driver_path
+
+    def _create_driver(self):
+        options = Options()
+        options.add_argument("--headless")  # run in background
+        options.add_argument("--disable-gpu")
+        options.add_argument("--no-sandbox")
+        driver = webdriver.Chrome(service=Service(self._get_driver_path()), options=options)
+        return PooledDriver(driver)
+
+    @staticmethod
+    def _quit(pooled):
+        try:
+            pooled.driver.quit()
+        except Exception as e:
+            print(f"Error shutting down browser: {e}")
+
+    @contextmanager
+    def lease(self, timeout=None):
+        if self._closed:
+            raise RuntimeError("DriverPool is closed")
+        if not self._slots.acquire(timeout=timeout):
+            raise TimeoutError("Timed out waiting for a free browser")
+
+        pooled = None
+        try:
+            try:
+                pooled = self._idle.get_nowait()
+            except queue.Empty:
+                pooled = self._create_driver()
+            yield pooled
+        except Exception as e:
+            if pooled is not None and is_driver_crash(e):
+                pooled.discard()
+            raise
+        finally:
+            if pooled is not None:
+                if pooled.broken or pooled.pages >= self.max_pages or self._closed:
+                    self._quit(pooled)
+                else:
+                    self._idle.put(pooled)
+            self._slots.release()
+
+    def close(self):
+        self._closed = True
+        while True:
+            try:
+                self._quit(self._idle.get_nowait())
+            except queue.Empty:
+                break
+
+
+_default_pool = None
+_default_pool_lock = threading.Lock()
+
+
+# Returns the process-wide pool, creating it on first use.
+def get_driver_pool():
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = DriverPool()
+            atexit.register(_default_pool.close)
+        return _default_pool
@@ -1,21 +1,157 @@
-from models import Professor
-from rmp import get_professor_info  # your existing scraper
+import logging
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
 
-def get_or_create_professor(name, university="University of California Santa Cruz"):
+from django.conf import settings
+from django.db import connection
+from django.utils import timezone
+from models import Professor, ProfessorMiss
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_TTL = 60 * 60 * 24 * 14  # two weeks
+DEFAULT_MISS_TTL = 60 * 60 * 24 * 3  # three days
+DEFAULT_RETRY_AFTER = 60 * 60  # after a failed refresh (error, not a miss)
+
+# Background scrapes run here so a stale row never blocks the request that found it.
+_refresh_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="professor-refresh")
+# Single-flight guard: normalized (name, university) -> Future of the scrape in progress.
+_inflight = {}
+_inflight_lock = threading.Lock()
+
+# Picks the scraper named by settings.RMP_BACKEND: "selenium" drives a headless
+# browser, "http" calls the RMP GraphQL API over a shared keep-alive session.
+def get_lookup_backend():
+    if getattr(settings, "RMP_BACKEND", "selenium") == "http":
+        from rmp_http import get_professor_info
+    else:
+        from rmp import get_professor_info  # your existing scraper
+    return get_professor_info
+
+# "Patrick  Tantalo (ptantalo)" -> ("patrick tantalo", "university of california santa cruz")
+def _cache_key(name, university):
+    name = re.sub(r'\s*\(.*?\)', '', name)
+    return " ".join(name.lower().split()), university.lower().strip()
+
+def has_recent_miss(name, university):
+    name_key, university_key = _cache_key(name, university)
+    ttl = getattr(settings, "PROFESSOR_MISS_TTL", DEFAULT_MISS_TTL)
+    cutoff = timezone.now() - timedelta(seconds=ttl)
+    return ProfessorMiss.objects.filter(
+        name_key=name_key, university_key=university_key, missed_at__gte=cutoff
+    ).exists()
+
+def is_fresh(professor):
+    if professor.fetched_at is None:
+        return False
+    ttl = getattr(settings, "PROFESSOR_CACHE_TTL", DEFAULT_CACHE_TTL)
+    return timezone.now() - professor.fetched_at < timedelta(seconds=ttl)
+
+# After a refresh that found nothing, push fetched_at forward so an existing row
+# goes stale again in `seconds` instead of triggering a scrape on every request.
+def _defer_refresh(name, university, seconds):
+    ttl = getattr(settings, "PROFESSOR_CACHE_TTL", DEFAULT_CACHE_TTL)
+    Professor.objects.filter(name__iexact=name, university__iexact=university).update(
+        fetched_at=timezone.now() - timedelta(seconds=ttl) + timedelta(seconds=seconds)
+    )
+
+# Professor's rating columns are not nullable; scrapers report None for values RMP
+# doesn't show (e.g. nobody answered "Would take again").
+MISSING_VALUE = "N/A"
+
+def _or_missing(value):
+    return MISSING_VALUE if value is None else value
+
+def _store(name, university, scraped_data):
+    name_key, university_key = _cache_key(name, university)
+    if not scraped_data:
+        ProfessorMiss.objects.update_or_create(
+            name_key=name_key, university_key=university_key,
+            defaults={"missed_at": timezone.now()}
+        )
+        _defer_refresh(name, university, getattr(settings, "PROFESSOR_MISS_TTL", DEFAULT_MISS_TTL))
+        return None
+    ProfessorMiss.objects.filter(name_key=name_key, university_key=university_key).delete()
+
+    fields = {
+        "rating": _or_missing(scraped_data["rating"]),
+        "difficulty": _or_missing(scraped_data["difficulty"]),
+        "take_again": _or_missing(scraped_data["take_again"]),
+        "tags": scraped_data["tags"] or [],
+        "fetched_at": timezone.now(),
+    }
     professor = Professor.objects.filter(name__iexact=name, university__iexact=university).first()
     if professor:
+        for field, value in fields.items():
+            setattr(professor, field, value)
+        professor.save(update_fields=list(fields))
         return professor
-    
-    scraped_data = get_professor_info(name, university)
-    if not scraped_data:
-        return None
 
-    professor = Professor.objects.create(
+    return Professor.objects.create(
         name=scraped_data["name"],
         university=scraped_data["university"],
-        rating=scraped_data["rating"],
-        difficulty=scraped_data["difficulty"],
-        take_again=scraped_data["take_again"],
-        tags=scraped_data["tags"]
+        **fields
     )
-    return professor
+
+def _refresh(name, university):
+    retry_after = getattr(settings, "PROFESSOR_RETRY_AFTER", DEFAULT_RETRY_AFTER)
+    try:
+        try:
+            scraped_data = get_lookup_backend()(name, university)
+        except Exception:
+            # An error is not a miss: record nothing, so the next request retries.
+            logger.exception(f"RMP lookup failed for {name} ({university})")
+            _defer_refresh(name, university, retry_after)
+            return None
+        try:
+            return _store(name, university, scraped_data)
+        except Exception:
+            # Nobody reads this Future, so a failed write must still push fetched_at
+            # forward; otherwise every later request would start another scrape.
+            logger.exception(f"Saving RMP data failed for {name} ({university})")
+            _defer_refresh(name, university, retry_after)
+            return None
+    finally:
+        # Worker threads get their own DB connection; don't leak it.
+        connection.close()
+
+def _forget(key, future):
+    with _inflight_lock:
+        if _inflight.get(key) is future:
+            del _inflight[key]
+
+# Starts a background scrape for the professor unless one is already running,
+# and returns the Future for it. Concurrent callers share the same Future.
+def refresh_professor(name, university="University of California Santa Cruz"):
+    key = _cache_key(name, university)
+    with _inflight_lock:
+        future = _inflight.get(key)
+        started = future is None
+        if started:
+            future = _refresh_executor.submit(_refresh, name, university)
+            _inflight[key] = future
+    if started:
+        # Registered outside the lock: it runs inline if the scrape already finished.
+        future.add_done_callback(lambda done: _forget(key, done))
+    return future
+
+# Returns the cached Professor, serving stale rows immediately while a refresh runs
+# in the background. "Staff" and names RMP recently had no match for return None
+# without scraping. On a miss a background scrape (shared with any concurrent
+# caller) is started and None is returned right away; pass wait=True to block on it.
+def get_or_create_professor(name, university="University of California Santa Cruz", wait=False):
+    professor = Professor.objects.filter(name__iexact=name, university__iexact=university).first()
+    if professor:
+        if not is_fresh(professor):
+            refresh_professor(name, university)
+        return professor
+
+    if _cache_key(name, university)[0] == "staff" or has_recent_miss(name, university):
+        return None
+
+    future = refresh_professor(name, university)
+    if not wait:
+        return None
+    return future.result()
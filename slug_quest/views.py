@@ -6,8 +6,10 @@ from google.auth.transport import requests
 from django.http import HttpResponse
 from django.shortcuts import render, redirect
 from .forms import PDFUploadForm
-from .models import UploadedPDF
-from PyPDF2 import PdfReader  # or fitz from PyMuPDF if you prefer
+from .models import UploadedPDF, TranscriptJob
+from .jobs import enqueue_transcript_job, job_payload, load_student_user
+from .slugbot import load_slugbot
+from .uploads import in_memory_bytes
 import os
 from django.http import JsonResponse
 
@@ -18,23 +20,15 @@ def upload_pdf(request):
     if request.method == 'POST':
         form = PDFUploadForm(request.POST, request.FILES)
         if form.is_valid():
-            uploaded_file = request.FILES['file']
+            uploaded_file = form.cleaned_data['file']
 
-            # Create and save model instance
+            # Only validated uploads (size, PDF header, page count) get this far
+            pdf_bytes = in_memory_bytes(uploaded_file)
             pdf_instance = UploadedPDF.objects.create(file=uploaded_file)
 
-            # Get the path to the uploaded file
-            file_path = pdf_instance.file.path
-
-            # Read the PDF
-            reader = PdfReader(file_path)
-            text = ""
-            for page in reader.pages:
-                text += page.extract_text()
-
-            # Optional: Store the extracted text in the model (you can add a `text` field for this)
-            # pdf_instance.extracted_text = text
-            # pdf_instance.save()
+            # Parse in the background; the page polls jobs/<id>/ for the result
+            job = enqueue_transcript_job(pdf_instance, pdf_bytes)
+            request.session['transcript_job_id'] = job.pk
 
             return redirect('main')
     else:
@@ -84,6 +78,31 @@ def sign_in_callback(request):
         logger.error(f"Error during login: {str(e)}")
         return HttpResponse(f"Login error: {str(e)}", status=500)
 
+def job_status(request, job_id):
+    # Jobs carry a student's transcript, so only the session that uploaded it may read it.
+    if job_id != request.session.get('transcript_job_id'):
+        return JsonResponse({"error": "Job not found"}, status=404)
+    try:
+        job = TranscriptJob.objects.get(pk=job_id)
+    except TranscriptJob.DoesNotExist:
+        return JsonResponse({"error": "Job not found"}, status=404)
+    return JsonResponse(job_payload(job))
+
+# "Suppose I also finish ...": eligibility delta for this session's transcript,
+# e.g. what-if/?course=CSE+101&course=CSE+130
+def what_if(request):
+    codes = [code.strip().upper() for code in request.GET.getlist('course') if code.strip()]
+    if not codes:
+        return JsonResponse({"error": "No courses given"}, status=400)
+    job_id = request.session.get('transcript_job_id')
+    job = TranscriptJob.objects.select_related('upload').filter(pk=job_id).first() if job_id else None
+    if job is None:
+        return JsonResponse({"error": "No transcript uploaded"}, status=404)
+    user = load_student_user(job.upload)
+    if user is None:
+        return JsonResponse({"error": "Transcript not processed yet"}, status=409)
+    return JsonResponse(load_slugbot().what_if(user, codes))
+
 def home(request):
     return render(request, 'slug_quest/home.html')
 
@@ -91,7 +110,8 @@ def login_page(request):
     return render(request, 'slug_quest/login.html')
 
 def main(request):
-    return render(request, 'slug_quest/main.html')
+    job_id = request.session.get('transcript_job_id')
+    return render(request, 'slug_quest/main.html', {'transcript_job_id': job_id})
 
 def dashboard(request):
     # Check if user is logged in
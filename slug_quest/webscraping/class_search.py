@@ -2,8 +2,47 @@
 # --- By: Kyle Delmo --------------------- #
 
 import json
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from time import monotonic, sleep
+from urllib.parse import urlsplit
+
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup, SoupStrainer
+from .http_cache import CachedResponse, get_http_cache
+from .snapshot import class_sections, refresh_snapshot
+
+# lxml builds the tree several times faster than html.parser; it is optional.
+try:
+    import lxml  # noqa: F401
+    PARSER = "lxml"
+except ImportError:
+    PARSER = "html.parser"
+
+# URL for UCSC Class Search.
+URL = "https://pisa.ucsc.edu/class_search/index.php"
+HEADERS = {"User-Agent": "Mozilla/5.0"}
+
+# Every subject the curriculum in creatingState.py draws courses from.
+CURRICULUM_SUBJECTS = ["CSE", "MATH", "AM", "STAT", "CMPM", "ECE"]
+
+# Only the result panels and the results summary are ever read, so nothing else
+# on the page gets turned into a tree. A regex rather than a class list so it
+# matches "panel" inside "panel panel-default row" on every bs4 version.
+RESULTS_STRAINER = SoupStrainer("div", class_=re.compile(r"(^|\s)(panel|hide-print)(\s|$)"))
+
+FIELD_SELECTOR = "div.col-xs-6.col-sm-3, div.col-xs-6.col-sm-6"
+INSTRUCTION_MODES = ["In Person", "Synchronous Online", "Asynchronous Online", "Hybrid"]
+
+# Labels of the fields read from each result panel.
+PANEL_FIELDS = ("Instructor", "Location", "Day and Time", "Session", "Enrolled")
+
+# Parses a results page, keeping only the parts the scraper reads.
+def make_soup(html):
+    return BeautifulSoup(html, PARSER, parse_only=RESULTS_STRAINER)
 
 # Returns the total number of courses in the results from the first preliminary search.
 def get_total_results(soup):
@@ -20,21 +59,33 @@ def get_total_results(soup):
 # Looks for a div that contains the given keyword (e.g. "Instructor:", "Location:")
 # Returns the text associated with that keyword.
 def get_field_text(panel, keyword):
-    for div in panel.select("div.col-xs-6.col-sm-3, div.col-xs-6.col-sm-6"):
+    for div in panel.select(FIELD_SELECTOR):
         if div and keyword in div.get_text():
             return div.get_text(strip=True).replace(f"{keyword}:", "").strip()
     return "N/A"
 
-# Given a term and a subject, fetches the list of courses from the UCSC Class
-# Search and saves them into a .json file.
-def fetch_and_scrape_all(term, subject):
+def _has_classes(tag, *names):
+    classes = tag.get("class") or []
+    return all(name in classes for name in names)
 
-    # URL for UCSC Class Search.
-    url = "https://pisa.ucsc.edu/class_search/index.php"
-    headers = {"User-Agent": "Mozilla/5.0"}
+# Same result as calling get_field_text once per keyword, but walks the field
+# divs of the panel only once (and without going through the CSS selector engine).
+def extract_panel_fields(panel, keywords=PANEL_FIELDS):
+    found = {}
+    for div in panel.find_all("div", class_="col-xs-6"):
+        if not (_has_classes(div, "col-sm-3") or _has_classes(div, "col-sm-6")):
+            continue
+        text = div.get_text()
+        for keyword in keywords:
+            if keyword not in found and keyword in text:
+                found[keyword] = div.get_text(strip=True).replace(f"{keyword}:", "").strip()
+        if len(found) == len(keywords):
+            break
+    return {keyword: found.get(keyword, "N/A") for keyword in keywords}
 
-    # Search filters.
-    initial_payload = {
+# Search filters for one term/subject, showing `rec_dur` results starting at `rec_start`.
+def build_payload(term, subject, rec_start=0, rec_dur=25):
+    return {
         "action": "results",
         "binds[:term]": term,
         "binds[:reg_status]": "all",
@@ -43,75 +94,153 @@ def fetch_and_scrape_all(term, subject):
         "binds[:hybrid]": "H",
         "binds[:synch]": "S",
         "binds[:person]": "P",
-        "rec_start": "0",
-        "rec_dur": "25"
+        "rec_start": str(rec_start),
+        "rec_dur": str(rec_dur)
+    }
+
+# Turns one result panel into the dictionary saved in the .json file.
+def parse_panel(panel):
+
+    # Getting the class name.
+    title_tag = None
+    for heading in panel.find_all("div", class_="panel-heading"):
+        title_tag = heading.find("a")
+        if title_tag:
+            break
+    title = title_tag.text.strip() if title_tag else "N/A"
+
+    # Getting important information about the class.
+    fields = extract_panel_fields(panel)
+
+    # Getting the instruction mode of the class.
+    instruction_mode = "N/A"
+    for body in panel.find_all("div", class_="panel-body"):
+        for b in body.find_all("b"):
+            if b.text in INSTRUCTION_MODES:
+                instruction_mode = b.text
+                break
+        if instruction_mode != "N/A":
+            break
+
+    # Storing the class info in a dictionary (.json).
+    return {
+        "title": title,
+        "instructor": fields["Instructor"],
+        "location": fields["Location"],
+        "time": fields["Day and Time"],
+        "instruction_mode": instruction_mode,
+        "enrollment": fields["Enrolled"]
     }
 
+# Parses every class panel on a results page.
+def parse_panels(soup):
+    return [parse_panel(panel) for panel in soup.find_all("div", class_="panel")
+            if _has_classes(panel, "panel-default", "row")]
+
+
+class HostLimiter:
+    """
+    Politeness limit shared by all crawler threads: at most `per_host` requests
+    in flight to any one host, and at least `min_interval` seconds between the
+    starts of two requests to it.
+    """
+    def __init__(self, per_host=4, min_interval=0.0):
+        self.per_host = per_host
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._semaphores = {}
+        self._last_start = {}
+
+    @contextmanager
+    def slot(self, url):
+        host = urlsplit(url).netloc
+        with self._lock:
+            semaphore = self._semaphores.setdefault(host, threading.BoundedSemaphore(self.per_host))
+        with semaphore:
+            if self.min_interval:
+                with self._lock:
+                    start = max(monotonic(), self._last_start.get(host, 0.0) + self.min_interval)
+                    self._last_start[host] = start
+                sleep(max(0.0, start - monotonic()))
+            yield
+
+
+# One keep-alive session whose connection pool is big enough for every worker.
+def make_session(pool_size=8):
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update(HEADERS)
+    return session
+
+# POSTs a search. With a cache the response may come from disk (or be revalidated
+# instead of refetched); without one it is always fetched and marked as changed.
+def _post(session, payload, limiter=None, cache=None):
+    if cache is not None:
+        return cache.post(URL, data=payload, headers=HEADERS, session=session, limiter=limiter)
+    if limiter is None:
+        response = session.post(URL, data=payload, headers=HEADERS, timeout=30)
+    else:
+        with limiter.slot(URL):
+            response = session.post(URL, data=payload, headers=HEADERS, timeout=30)
+    response.raise_for_status()
+    return CachedResponse(None, response.text, None, False, True)
+
+# Returns (total_results, classes) for a results page, reusing the parse stored in
+# the cache while the page content is unchanged.
+def _parse_page(response, cache=None):
+    if cache is not None:
+        parsed = cache.load_parsed(response, "page")
+        if parsed is not None:
+            return parsed["total_results"], parsed["classes"]
+
+    soup = make_soup(response.text)
+    total_results = get_total_results(soup)
+    classes = parse_panels(soup)
+    soup.decompose()
+
+    if cache is not None:
+        cache.store_parsed(response, {"total_results": total_results, "classes": classes}, "page")
+    return total_results, classes
+
+# Fetches every class for one term and subject and returns them as a list.
+def scrape_subject(term, subject, session=None, limiter=None, cache=None):
+    session = session or make_session(1)
+    initial_payload = build_payload(term, subject)
+
     # -- COMMENT OUT LATER; FOR DEBUGGING PURPOSES -- #
-    print("Fetching total class count...")
+    print(f"Fetching total class count for {subject} ({term})...")
     # ----------------------------------------------- #
-    
+
     # Getting how many results there are as a preliminary action
     # so that for the next request, it knows how many classes to
     # display, thus making it easier to scrape.
-    resp1 = requests.post(url, data=initial_payload, headers=headers)
-    soup1 = BeautifulSoup(resp1.text, "html.parser")
-    total_results = get_total_results(soup1)
+    total_results, _ = _parse_page(_post(session, initial_payload, limiter, cache), cache)
 
     # -- COMMENT OUT LATER; FOR DEBUGGING PURPOSES -- #
-    print(f"Total classes found: {total_results}")
+    print(f"Total {subject} classes found: {total_results}")
     # ----------------------------------------------- #
 
     # Second request, showing all classes.
-    full_payload = initial_payload.copy()
-    full_payload["rec_dur"] = str(total_results)
+    full_payload = build_payload(term, subject, rec_dur=total_results)
+    _, classes = _parse_page(_post(session, full_payload, limiter, cache), cache)
+    return classes
 
-    # -- COMMENT OUT LATER; FOR DEBUGGING PURPOSES -- #
-    print("Fetching all results...")
-    # ----------------------------------------------- #
-    
-    # Getting classes from second request.
-    resp2 = requests.post(url, data=full_payload, headers=headers)
-    soup2 = BeautifulSoup(resp2.text, "html.parser")
-    panels = soup2.select("div.panel.panel-default.row")
-
-    # For .json purposes.
-    all_classes = []
-    
-    # Iterating through each class.
-    for panel in panels:
-
-        # Getting the class name.
-        title_tag = panel.select_one("div.panel-heading a")
-        title = title_tag.text.strip() if title_tag else "N/A"
-
-        # Getting important information about the class.
-        instructor = get_field_text(panel, "Instructor")
-        location = get_field_text(panel, "Location")
-        time = get_field_text(panel, "Day and Time")
-        session = get_field_text(panel, "Session")
-        enrollment = get_field_text(panel, "Enrolled")
-
-        # Getting the instruction mode of the class.
-        instruction_mode = "N/A"
-        for b in panel.select("div.panel-body b"):
-            if b.text in ["In Person", "Synchronous Online", "Asynchronous Online", "Hybrid"]:
-                instruction_mode = b.text
-                break
+# Given a term and a subject, fetches the list of courses from the UCSC Class
+# Search and saves them into a .json file. Responses go through the on-disk
+# HTTP cache unless another cache is passed in. With incremental=True only the
+# classes that were added, removed or changed are appended to classes.delta.ndjson.
+def fetch_and_scrape_all(term, subject, cache=None, incremental=False):
+    all_classes = scrape_subject(term, subject, cache=cache or get_http_cache())
+
+    if incremental:
+        delta = refresh_snapshot(all_classes, "classes.json", class_sections)
+        # -- COMMENT OUT LATER; FOR DEBUGGING PURPOSES -- #
+        print(f"{len(delta)} class changes written for classes.json")
+        # ----------------------------------------------- #
+        return
 
-        # Storing the class info in a dictionary (.json).
-        class_info = {
-            "title": title,
-            "instructor": instructor,
-            "location": location,
-            "time": time,
-            "instruction_mode": instruction_mode,
-            "enrollment": enrollment
-        }
-
-        # Adding it to the whole data structure.
-        all_classes.append(class_info)
-    
     # Saving the .json file.
     with open("classes.json", "w", encoding="utf-8") as f:
         json.dump(all_classes, f, indent=2)
@@ -120,5 +249,76 @@ def fetch_and_scrape_all(term, subject):
     print("Data saved to classes.json")
     # ----------------------------------------------- #
 
-# 2252 = 2025 Spring Quarter (adjacent quarters differ by 2).
-fetch_and_scrape_all("2256", "CSE")
+# Walks the results `page_size` classes at a time (rec_start/rec_dur) and yields
+# each class as soon as its page is parsed, so only one page of HTML and one
+# parse tree are in memory at any point, however large the subject is.
+def iter_classes(term, subject, page_size=25, session=None, limiter=None, cache=None):
+    session = session or make_session(1)
+    rec_start = 0
+    total_results = None
+
+    while total_results is None or rec_start < total_results:
+        payload = build_payload(term, subject, rec_start=rec_start, rec_dur=page_size)
+        page_total, classes = _parse_page(_post(session, payload, limiter, cache), cache)
+        if total_results is None:
+            total_results = page_total
+
+        yield from classes
+        # A short page means we ran off the end of the results.
+        if len(classes) < page_size:
+            break
+        rec_start += page_size
+
+# Appends one JSON object per line to `path` and returns how many were written.
+# Records are written as they arrive, so the sink never holds more than one.
+def write_ndjson(records, path):
+    count = 0
+    with open(path, "a", encoding="utf-8") as f:
+        for record in records:
+            f.write(json.dumps(record) + "\n")
+            count += 1
+    return count
+
+# Streaming counterpart of fetch_and_scrape_all: pages through the results and
+# appends each class, tagged with its term and subject, to an NDJSON file.
+def stream_classes(term, subject, path="classes.ndjson", page_size=25, session=None, limiter=None,
+                   cache=None):
+    records = (dict(class_info, term=term, subject=subject)
+               for class_info in iter_classes(term, subject, page_size, session, limiter, cache))
+    count = write_ndjson(records, path)
+
+    # -- COMMENT OUT LATER; FOR DEBUGGING PURPOSES -- #
+    print(f"Appended {count} {subject} classes to {path}")
+    # ----------------------------------------------- #
+    return count
+
+# Scrapes every (term, subject) pair concurrently over one pooled session and
+# saves a single file keyed as {term: {subject: [classes]}}. A subject that fails
+# is reported and left out instead of aborting the whole crawl.
+def crawl_class_search(terms, subjects=CURRICULUM_SUBJECTS, max_workers=8, per_host=4,
+                       min_interval=0.0, output="classes_by_term.json", cache=None):
+    session = make_session(max(max_workers, per_host))
+    limiter = HostLimiter(per_host=per_host, min_interval=min_interval)
+    cache = cache or get_http_cache()
+    results = {term: {} for term in terms}
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {(term, subject): executor.submit(scrape_subject, term, subject, session, limiter, cache)
+                   for term in terms for subject in subjects}
+        for (term, subject), future in futures.items():
+            try:
+                results[term][subject] = future.result()
+            except Exception as e:
+                print(f"Error scraping {subject} ({term}): {e}")
+
+    if output:
+        with open(output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"Data saved to {output}")
+    return results
+
+if __name__ == "__main__":
+    # Uses package-relative imports: run it from the repository root with
+    #   python -m slug_quest.webscraping.class_search
+    # 2252 = 2025 Spring Quarter (adjacent quarters differ by 2).
+    fetch_and_scrape_all("2256", "CSE")
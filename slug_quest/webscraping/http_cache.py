@@ -0,0 +1,155 @@
+# --- On-Disk HTTP Cache For The Scrapers --- #
+
+import hashlib
+import json
+import os
+import threading
+import time
+
+import requests
+
+DEFAULT_CACHE_DIR = os.getenv("SCRAPE_CACHE_DIR", ".scrape_cache")
+# Responses younger than this are reused without even a conditional request.
+DEFAULT_MAX_AGE = int(os.getenv("SCRAPE_CACHE_MAX_AGE", "3600"))
+
+
+class CachedResponse:
+    """
+    Body of a fetch plus what the cache knows about it. `changed` is False when
+    the content hash matches what was stored before, so callers can reuse their
+    previously parsed result instead of parsing again.
+    """
+    def __init__(self, key, text, content_hash, from_cache, changed):
+        self.key = key
+        self.text = text
+        self.content_hash = content_hash
+        self.from_cache = from_cache
+        self.changed = changed
+
+
+def _hash_text(text):
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class HttpCache:
+    """
+    Stores responses on disk keyed by method, URL and form payload. Entries older
+    than `max_age` seconds are revalidated with If-None-Match / If-Modified-Since
+    when the server sent an ETag or Last-Modified, and refetched otherwise.
+    Parsed results can be stored next to a response and are only handed back
+    while the response's content hash is unchanged.
+    """
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_age=DEFAULT_MAX_AGE, session=None, timeout=30):
+        self.cache_dir = cache_dir
+        self.max_age = max_age
+        self.timeout = timeout
+        self.session = session or requests.Session()
+        os.makedirs(cache_dir, exist_ok=True)
+
+    @staticmethod
+    def make_key(method, url, data=None):
+        payload = json.dumps(sorted((data or {}).items()))
+        return hashlib.sha256(f"{method.upper()} {url} {payload}".encode("utf-8")).hexdigest()
+
+    def _path(self, key, suffix):
+        return os.path.join(self.cache_dir, f"{key}.{suffix}")
+
+    def _read_json(self, path):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write(self, path, text):
+        # Unique temp name per thread, then an atomic rename, so concurrent
+        # crawler threads never see a half-written entry.
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+
+    def _read_body(self, key):
+        try:
+            with open(self._path(key, "body"), "r", encoding="utf-8") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def fetch(self, method, url, data=None, headers=None, session=None, limiter=None):
+        key = self.make_key(method, url, data)
+        meta = self._read_json(self._path(key, "meta.json"))
+        body = self._read_body(key) if meta else None
+        if body is None:
+            meta = None
+
+        if meta and time.time() - meta["fetched_at"] < self.max_age:
+            return CachedResponse(key, body, meta["content_hash"], True, False)
+
+        request_headers = dict(headers or {})
+        if meta and meta.get("etag"):
+            request_headers["If-None-Match"] = meta["etag"]
+        if meta and meta.get("last_modified"):
+            request_headers["If-Modified-Since"] = meta["last_modified"]
+
+        session = session or self.session
+        if limiter is None:
+            response = session.request(method, url, data=data, headers=request_headers, timeout=self.timeout)
+        else:
+            with limiter.slot(url):
+                response = session.request(method, url, data=data, headers=request_headers, timeout=self.timeout)
+
+        if response.status_code == 304 and meta:
+            meta["fetched_at"] = time.time()
+            self._write(self._path(key, "meta.json"), json.dumps(meta))
+            return CachedResponse(key, body, meta["content_hash"], True, False)
+
+        response.raise_for_status()
+        text = response.text
+        content_hash = _hash_text(text)
+        changed = meta is None or meta["content_hash"] != content_hash
+        if changed:
+            self._write(self._path(key, "body"), text)
+        self._write(self._path(key, "meta.json"), json.dumps({
+            "method": method.upper(),
+            "url": url,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "content_hash": content_hash,
+            "fetched_at": time.time()
+        }))
+        return CachedResponse(key, text, content_hash, False, changed)
+
+    def get(self, url, **kwargs):
+        return self.fetch("GET", url, **kwargs)
+
+    def post(self, url, data=None, **kwargs):
+        return self.fetch("POST", url, data=data, **kwargs)
+
+    # `tag` names the parse (e.g. which quarter column) so one page can back several.
+    def _parsed_path(self, response, tag):
+        tag_hash = hashlib.sha1(tag.encode("utf-8")).hexdigest()[:12]
+        return self._path(response.key, f"{tag_hash}.parsed.json")
+
+    def load_parsed(self, response, tag=""):
+        entry = self._read_json(self._parsed_path(response, tag))
+        if entry and entry.get("content_hash") == response.content_hash:
+            return entry["data"]
+        return None
+
+    def store_parsed(self, response, data, tag=""):
+        self._write(self._parsed_path(response, tag),
+                    json.dumps({"content_hash": response.content_hash, "data": data}))
+
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+
+# Returns the process-wide cache in DEFAULT_CACHE_DIR, creating it on first use.
+def get_http_cache():
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = HttpCache()
+        return _default_cache
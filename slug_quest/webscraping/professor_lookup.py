@@ -0,0 +1,20 @@
+# --- RMP Lookup Backend Selection ------- #
+
+import os
+
+# "selenium" drives a headless browser (webscraping.rmp); "http" calls the
+# GraphQL API directly (webscraping.rmp_http).
+DEFAULT_BACKEND = os.getenv("RMP_BACKEND", "selenium")
+
+
+# Returns a callable with the get_professor_info(name, university) signature.
+# Backends are imported lazily so the HTTP one does not need selenium installed.
+def get_professor_lookup(backend=None):
+    backend = (backend or DEFAULT_BACKEND).lower()
+    if backend == "http":
+        from .rmp_http import get_professor_info
+    elif backend == "selenium":
+        from .rmp import get_professor_info
+    else:
+        raise ValueError(f"Unknown RMP backend: {backend}")
+    return get_professor_info
@@ -1,16 +1,55 @@
 # -- WebScraper For UCSC Engineering Course Schedule -- $
 # --- By: Kyle Delmo ---------------------------------- $
 
-import requests
+import os
 from bs4 import BeautifulSoup
 import re
 import json
+from .http_cache import get_http_cache
+from .snapshot import refresh_snapshot, schedule_sections
 
 # Gets all courses from the given year and quarter.
-def extract_course_data(YEAR, QUARTER, QUARTER_INDEX):
+# The page goes through the on-disk HTTP cache; when its content is unchanged the
+# previously parsed courses are reused and an existing output file is left alone.
+# With incremental=True the output file is diffed against the new scrape and only
+# the added/removed/changed sections are appended to courses_YEAR_QUARTER.delta.ndjson.
+def extract_course_data(YEAR, QUARTER, QUARTER_INDEX, cache=None, incremental=False):
     url = f"https://courses.engineering.ucsc.edu/courses/cse/{YEAR}"
-    response = requests.get(url)
-    soup = BeautifulSoup(response.text, 'html.parser')
+    cache = cache or get_http_cache()
+    response = cache.get(url)
+    filename = f"courses_{YEAR}_{QUARTER}.json"
+    parse_tag = f"{QUARTER}:{QUARTER_INDEX}"
+
+    results = cache.load_parsed(response, parse_tag)
+    if results is not None:
+        if not response.changed and os.path.exists(filename):
+            # -- DEBUGGING; COMMENT OUT LATER -- #
+            print(f"{filename} is up to date ({len(results)} courses)")
+            # ---------------------------------- #
+            return results
+    else:
+        results = _parse_course_page(response.text, QUARTER, QUARTER_INDEX)
+        cache.store_parsed(response, results, parse_tag)
+
+    if incremental:
+        delta = refresh_snapshot(results, filename, schedule_sections)
+        # -- DEBUGGING; COMMENT OUT LATER -- #
+        print(f"{len(delta)} section changes written for {filename}")
+        # ---------------------------------- #
+        return results
+
+    # Save to .json.
+    with open(filename, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+
+    # -- DEBUGGING; COMMENT OUT LATER -- #
+    print(f"Saved {len(results)} courses to {filename}")
+    # ---------------------------------- #
+    return results
+
+# Pulls the {course, sections} records for one quarter column out of the page.
+def _parse_course_page(html, QUARTER, QUARTER_INDEX):
+    soup = BeautifulSoup(html, 'html.parser')
 
     # Matching href tags that point to the given quarter.
     quarter_link_pattern = re.compile(rf"^/courses/[^/]+/{QUARTER}/")
@@ -49,15 +88,10 @@ def extract_course_data(YEAR, QUARTER, QUARTER_INDEX):
                     'sections': sections
                 })
 
-    # Save to .json.
-    filename = f"courses_{YEAR}_{QUARTER}.json"
-    with open(filename, 'w', encoding='utf-8') as f:
-        json.dump(results, f, indent=2)
-
-    # -- DEBUGGING; COMMENT OUT LATER -- #
-    print(f"Saved {len(results)} courses to {filename}")
-    # ---------------------------------- #
+    return results
 
 # # -- TESTING; COMMENT OUT LATER -- #
+# Uses package-relative imports: run it from the repository root with
+#   python -m slug_quest.webscraping.schedule
 extract_course_data(2025, "Fall25", 0)
 # # -------------------------------- #